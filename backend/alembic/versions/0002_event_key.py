@@ -0,0 +1,28 @@
+"""Add events.event_key for idempotent event ingestion
+
+Revision ID: 0002_event_key
+Revises: 0001_initial
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "0002_event_key"
+down_revision = "0001_initial"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("events", sa.Column("event_key", sa.String(64), nullable=True))
+    op.create_unique_constraint("uq_events_fixture_id_event_key", "events", ["fixture_id", "event_key"])
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_events_fixture_id_event_key", "events", type_="unique")
+    op.drop_column("events", "event_key")
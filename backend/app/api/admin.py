@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
+from typing import Any
+
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -11,6 +13,7 @@ from app.db.models import League, Team
 from app.db.session import get_db
 from app.schemas.common import OKResponse
 from app.schemas.fixtures import SyncIn
+from app.services.cache import cache_delete_pattern, cache_metrics, cache_stats
 from app.services.factory import get_provider
 from app.services.provider import FootballProvider
 from app.services.sync import SyncService
@@ -30,18 +33,26 @@ async def trigger_sync(
 
     if body.scope == "standings":
         leagues = (await db.execute(select(League))).scalars().all()
-        for league in leagues:
-            league_prov_id = league.provider_league_id
-            await svc.sync_standings(league_prov_id, league.season)
+        await svc.sync_standings_many([(league.provider_league_id, league.season) for league in leagues])
         await db.commit()
-        log.info("Admin sync: standings complete", leagues=len(leagues))
+        log.info("Admin sync: standings complete", leagues=len(leagues), ids=svc.ids.summary(), **svc.report.summary())
 
     elif body.scope == "fixtures":
-        teams = (await db.execute(select(Team))).scalars().all()
-        for team in teams:
-            await svc.sync_fixtures(team.provider_team_id, body.hours_forward)
+        # One call per league; only teams without a league need the per-team endpoint
+        leagues = (await db.execute(select(League))).scalars().all()
+        await svc.sync_league_fixtures_many(
+            [(league.provider_league_id, league.season) for league in leagues], body.hours_forward
+        )
+        orphan_teams = (await db.execute(select(Team).where(Team.league_id.is_(None)))).scalars().all()
+        await svc.sync_fixtures_many([team.provider_team_id for team in orphan_teams], body.hours_forward)
         await db.commit()
-        log.info("Admin sync: fixtures complete", teams=len(teams))
+        log.info(
+            "Admin sync: fixtures complete",
+            leagues=len(leagues),
+            orphan_teams=len(orphan_teams),
+            ids=svc.ids.summary(),
+            **svc.report.summary(),
+        )
 
     elif body.scope == "events":
         from datetime import UTC, datetime, timedelta
@@ -56,17 +67,64 @@ async def trigger_sync(
             )
         )
         fixtures = result.scalars().all()
-        for fixture in fixtures:
-            await svc.sync_events(fixture.provider_fixture_id)
+        await svc.sync_events_many([fixture.provider_fixture_id for fixture in fixtures])
         await db.commit()
-        log.info("Admin sync: events complete", fixtures=len(fixtures))
+        log.info("Admin sync: events complete", fixtures=len(fixtures), ids=svc.ids.summary(), **svc.report.summary())
+
+    elif body.scope == "live":
+        league_ids = (await db.execute(select(League.provider_league_id))).scalars().all()
+        live = await svc.sync_live(league_ids)
+        # Matches that just left the feed: pick up their final score and status now
+        await svc.refresh_fixtures(live.ended)
+        await db.commit()
+        log.info(
+            "Admin sync: live complete",
+            live=len(live.deltas),
+            new_events=sum(len(d.new) for d in live.deltas),
+            ended=live.ended,
+            **svc.report.summary(),
+        )
 
     else:
         from fastapi import HTTPException, status
 
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Unknown scope: {body.scope}. Use: fixtures, standings, events",
+            detail=f"Unknown scope: {body.scope}. Use: fixtures, standings, events, live",
+        )
+
+    # Every branch has committed by now
+    await svc.refresh_caches()
+    if svc.report.failures:
+        log.warning(
+            "Admin sync: provider calls failed",
+            scope=body.scope,
+            failures=[(f.call, f.key, f.error) for f in svc.report.failures],
         )
+    return OKResponse()
+
+
+@router.get("/provider/stats")
+async def provider_stats(provider: FootballProvider = Depends(get_provider)) -> dict[str, Any]:
+    """Provider call counters since process start (cache hits, saved requests, 304s)."""
+    return provider.stats()
+
+
+@router.get("/cache/stats")
+async def response_cache_stats() -> dict[str, Any]:
+    """Response cache lookups in this process since start, split by tier (L1 memory, L2 Redis)."""
+    return cache_stats()
+
+
+@router.get("/cache/metrics")
+async def response_cache_metrics() -> dict[str, Any]:
+    """Per key family: hits and misses by tier, Redis latency and payload size histograms, L1 evictions."""
+    return await cache_metrics()
+
 
+@router.delete("/cache", response_model=OKResponse)
+async def purge_cache(pattern: str = Query(min_length=1, description="Glob, e.g. standings:*")) -> OKResponse:
+    """Delete cached responses by pattern. SCANs all of Redis; not for routine invalidation."""
+    await cache_delete_pattern(pattern)
+    log.info("Admin cache purge", pattern=pattern)
     return OKResponse()
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -13,6 +13,8 @@ from app.schemas.common import PaginatedResponse
 from app.schemas.teams import LeagueOut, TeamOut, TeamWithLeagueOut
 from app.services.factory import get_provider
 from app.services.provider import FootballProvider
+from app.services.provider_quota import QuotaExhaustedError
+from app.services.provider_resilience import ProviderUnavailableError
 
 router = APIRouter(tags=["catalog"])
 
@@ -32,7 +34,10 @@ async def search_teams(
 
     if not teams:
         # Fall back to provider search (does not persist)
-        provider_teams = await provider.search_teams(q, limit)
+        try:
+            provider_teams = await provider.search_teams(q, limit)
+        except (ProviderUnavailableError, QuotaExhaustedError) as exc:
+            raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)) from exc
         return PaginatedResponse(
             items=[
                 TeamWithLeagueOut(
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+import redis.asyncio as aioredis
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -14,6 +15,8 @@ from app.db.models import Event, Fixture
 from app.db.session import get_db
 from app.schemas.common import PaginatedResponse
 from app.schemas.fixtures import EventOut, FixtureDetailOut, FixtureOut
+from app.services.cache import get_redis
+from app.services.team_fixtures import TEAM_FIXTURES_WINDOW_DAYS, get_team_fixture_window, team_fixtures_page
 
 router = APIRouter(tags=["fixtures"])
 
@@ -26,11 +29,17 @@ async def team_fixtures(
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=20, ge=1, le=100),
     db: AsyncSession = Depends(get_db),
+    redis: aioredis.Redis = Depends(get_redis),
     _: str = Depends(get_current_user_id),
-) -> PaginatedResponse[FixtureOut]:
+) -> PaginatedResponse[FixtureOut] | Response:
     now = datetime.now(UTC)
-    from_dt = from_date or (now - timedelta(days=30))
-    to_dt = to_date or (now + timedelta(days=30))
+    if from_date is None and to_date is None:
+        # The default window is cached per team and refreshed by sync
+        window = await get_team_fixture_window(db, team_id, client=redis)
+        return Response(team_fixtures_page(window, now, page, page_size), media_type="application/json")
+
+    from_dt = from_date or (now - timedelta(days=TEAM_FIXTURES_WINDOW_DAYS))
+    to_dt = to_date or (now + timedelta(days=TEAM_FIXTURES_WINDOW_DAYS))
 
     q = (
         select(Fixture)
@@ -6,6 +6,7 @@ from fastapi import APIRouter
 from fastapi.responses import ORJSONResponse
 
 from app.services.cache import redis_ping
+from app.services.factory import get_provider
 
 router = APIRouter(tags=["health"])
 
@@ -18,11 +19,15 @@ async def healthz() -> ORJSONResponse:
 
 @router.get("/readyz")
 async def readyz() -> ORJSONResponse:
-    """Readiness probe – checks Redis connectivity."""
+    """Readiness probe – checks Redis connectivity and reports provider circuit breakers.
+
+    Open breakers mark the provider as degraded but do not fail the probe: the API
+    keeps serving from the database and last-known provider data.
+    """
     redis_ok = await redis_ping()
+    breakers = get_provider().stats().get("breakers", {})
+    provider_check = "degraded" if any(state != "closed" for state in breakers.values()) else "pass"
+    checks = {"redis": "pass" if redis_ok else "fail", "provider": provider_check, "breakers": breakers}
     if not redis_ok:
-        return ORJSONResponse(
-            status_code=503,
-            content={"status": "degraded", "checks": {"redis": "fail"}},
-        )
-    return ORJSONResponse({"status": "ok", "checks": {"redis": "pass"}})
+        return ORJSONResponse(status_code=503, content={"status": "degraded", "checks": checks})
+    return ORJSONResponse({"status": "ok", "checks": checks})
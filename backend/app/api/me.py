@@ -3,28 +3,28 @@
 from __future__ import annotations
 
 import uuid
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+import redis.asyncio as aioredis
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.core.security import get_current_user_id
-from app.db.models import Fixture, Follow, NotificationPreference, PushToken, Standing, Team, User
+from app.db.models import Follow, NotificationPreference, PushToken, Team, User
 from app.db.session import get_db
 from app.schemas.common import OKResponse
 from app.schemas.standings import (
     DashboardTeamEntry,
-    FixtureBrief,
     NotificationPreferenceIn,
     NotificationPreferenceOut,
     PushTokenIn,
     PushTokenOut,
-    StandingOut,
 )
 from app.schemas.teams import FollowIn, FollowOut, TeamOut
-from app.services.cache import cache_delete_pattern, cache_get, cache_set
+from app.services.cache import cache_bump_generation, get_redis
+from app.services.dashboard import DASHBOARD_MAX_DAYS_BACK, DASHBOARD_MAX_DAYS_FORWARD, dashboard_body
 
 router = APIRouter(prefix="/me", tags=["me"])
 
@@ -56,6 +56,7 @@ async def list_follows(
 async def follow_team(
     body: FollowIn,
     db: AsyncSession = Depends(get_db),
+    redis: aioredis.Redis = Depends(get_redis),
     user_id: str = Depends(get_current_user_id),
 ) -> FollowOut:
     # Ensure team exists
@@ -72,8 +73,9 @@ async def follow_team(
 
     follow = Follow(user_id=user_id, team_id=body.team_id, created_at=datetime.now(UTC))
     db.add(follow)
-    await db.flush()
-    await cache_delete_pattern(f"dashboard:{user_id}:*")
+    # Commit before bumping: a dashboard read in between would cache the old follows under the new generation
+    await db.commit()
+    await cache_bump_generation(f"dashboard:{user_id}", client=redis)
     return FollowOut(user_id=user_id, team_id=body.team_id, team=TeamOut.model_validate(team))
 
 
@@ -81,10 +83,12 @@ async def follow_team(
 async def unfollow_team(
     team_id: str,
     db: AsyncSession = Depends(get_db),
+    redis: aioredis.Redis = Depends(get_redis),
     user_id: str = Depends(get_current_user_id),
 ) -> OKResponse:
     await db.execute(delete(Follow).where(Follow.user_id == user_id, Follow.team_id == team_id))
-    await cache_delete_pattern(f"dashboard:{user_id}:*")
+    await db.commit()  # before the bump, as in follow_team
+    await cache_bump_generation(f"dashboard:{user_id}", client=redis)
     return OKResponse()
 
 
@@ -93,65 +97,15 @@ async def unfollow_team(
 
 @router.get("/dashboard", response_model=list[DashboardTeamEntry])
 async def dashboard(
-    days_back: int = Query(default=7, ge=0, le=30),
-    days_forward: int = Query(default=7, ge=0, le=60),
+    days_back: int = Query(default=7, ge=0, le=DASHBOARD_MAX_DAYS_BACK),
+    days_forward: int = Query(default=7, ge=0, le=DASHBOARD_MAX_DAYS_FORWARD),
     db: AsyncSession = Depends(get_db),
+    redis: aioredis.Redis = Depends(get_redis),
     user_id: str = Depends(get_current_user_id),
-) -> list[DashboardTeamEntry]:
-    cache_key = f"dashboard:{user_id}:{days_back}:{days_forward}"
-    cached = await cache_get(cache_key)
-    if cached is not None:
-        return [DashboardTeamEntry.model_validate(entry) for entry in cached]
-
-    follows_result = await db.execute(
-        select(Follow).options(selectinload(Follow.team)).where(Follow.user_id == user_id)
-    )
-    follows = follows_result.scalars().all()
-    now = datetime.now(UTC)
-    from_time = now - timedelta(days=days_back)
-    to_time = now + timedelta(days=days_forward)
-
-    entries: list[DashboardTeamEntry] = []
-    for follow in follows:
-        team = follow.team
-        team_out = TeamOut.model_validate(team)
-
-        # Standing
-        standing_row = await db.execute(
-            select(Standing).where(Standing.team_id == team.id).order_by(Standing.season.desc())
-        )
-        standing = standing_row.scalar_one_or_none()
-        standing_out = StandingOut.model_validate(standing) if standing else None
-
-        # Fixtures window
-        fixtures_result = await db.execute(
-            select(Fixture)
-            .options(selectinload(Fixture.home_team), selectinload(Fixture.away_team))
-            .where(
-                ((Fixture.home_team_id == team.id) | (Fixture.away_team_id == team.id))
-                & (Fixture.start_time >= from_time)
-                & (Fixture.start_time <= to_time)
-            )
-            .order_by(Fixture.start_time)
-        )
-        all_fixtures = fixtures_result.scalars().all()
-        past = [f for f in all_fixtures if f.start_time < now]
-        future = [f for f in all_fixtures if f.start_time >= now]
-
-        last_fixture = FixtureBrief.model_validate(past[-1]) if past else None
-        next_fixture = FixtureBrief.model_validate(future[0]) if future else None
-
-        entries.append(
-            DashboardTeamEntry(
-                team=team_out,
-                standing=standing_out,
-                next_fixture=next_fixture,
-                last_fixture=last_fixture,
-            )
-        )
-
-    await cache_set(cache_key, [e.model_dump(mode="json") for e in entries])
-    return entries
+) -> Response:
+    # Shared per-team fragments (one batched read) composed for this user's follows
+    body = await dashboard_body(db, user_id, days_back, days_forward, client=redis)
+    return Response(body, media_type="application/json")
 
 
 # ── Notification preferences ──────────────────────────────────────────────────
@@ -2,16 +2,17 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+import redis.asyncio as aioredis
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.core.security import get_current_user_id
-from app.db.models import League, Standing
+from app.db.models import League
 from app.db.session import get_db
 from app.schemas.standings import StandingOut
-from app.services.cache import cache_get, cache_set
+from app.services.cache import cache_get_or_compute, get_redis
+from app.services.standings import build_standings_body, standings_key
 
 router = APIRouter(tags=["standings"])
 
@@ -21,8 +22,9 @@ async def league_standings(
     league_id: str,
     season: str | None = Query(default=None),
     db: AsyncSession = Depends(get_db),
+    redis: aioredis.Redis = Depends(get_redis),
     _: str = Depends(get_current_user_id),
-) -> list[StandingOut]:
+) -> Response:
     # Use the league's current season if not specified
     if not season:
         league_result = await db.execute(select(League).where(League.id == league_id))
@@ -31,18 +33,9 @@ async def league_standings(
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="League not found")
         season = league.season
 
-    cache_key = f"standings:{league_id}:{season}"
-    cached = await cache_get(cache_key)
-    if cached is not None:
-        return [StandingOut.model_validate(s) for s in cached]
-
-    result = await db.execute(
-        select(Standing)
-        .options(selectinload(Standing.team))
-        .where(Standing.league_id == league_id, Standing.season == season)
-        .order_by(Standing.rank)
-    )
-    standings = result.scalars().all()
-    out = [StandingOut.model_validate(s) for s in standings]
-    await cache_set(cache_key, [s.model_dump(mode="json") for s in out])
-    return out
+    async def compute() -> bytes:
+        return await build_standings_body(db, league_id, season)
+
+    # The cached body is sent as-is: hits skip Pydantic validation and serialization entirely
+    body = await cache_get_or_compute(standings_key(league_id, season), compute, client=redis)
+    return Response(body, media_type="application/json")
@@ -19,6 +19,7 @@ class ProviderName(StrEnum):
     mock = "mock"
     api_football = "api_football"
     sportmonks = "sportmonks"
+    synthetic = "synthetic"
 
 
 class Settings(BaseSettings):
@@ -46,11 +47,47 @@ class Settings(BaseSettings):
     # ── Redis ────────────────────────────────────────────────────
     redis_url: str = Field(default="redis://localhost:6379/0")
     redis_cache_ttl_seconds: int = 300  # 5 minutes default cache TTL
+    cache_l1_max_entries: int = 2048  # in-process cache in front of Redis; 0 disables it
+    cache_l1_ttl_seconds: float = 5.0  # bounds staleness if an invalidation message is missed
+    cache_stale_grace_seconds: int = 60  # expired entries still served while one caller recomputes
+    cache_metrics_log_interval_seconds: float = 300.0  # per-family cache metrics log line; 0 disables it
+    dashboard_fragment_ttl_seconds: int = 3600  # per-team dashboard data; sync refreshes it on change
+    team_fixtures_ttl_seconds: int = 3600  # default window of /teams/{id}/fixtures; sync refreshes it
 
     # ── Provider ─────────────────────────────────────────────────
     provider_name: ProviderName = ProviderName.mock
     provider_api_key: str = ""
     provider_base_url: str = ""
+    provider_timeout_seconds: float = 15.0
+    provider_max_connections: int = 20
+    provider_max_keepalive_connections: int = 10
+    provider_keepalive_expiry_seconds: float = 30.0
+    provider_http2: bool = False  # needs the optional "http2" extra
+    provider_parse_offload_bytes: int = 0  # parse responses at least this large in a thread; 0 disables
+    provider_cache_enabled: bool = True  # cache leagues/teams/standings responses in Redis
+    provider_cache_standings_ttl_seconds: int = 900
+    provider_quota_enabled: bool = True  # shared Redis token bucket across API and worker processes
+    provider_quota_per_minute: int = 300  # plan defaults; replaced by the upstream's quota headers
+    provider_quota_per_day: int = 7500
+    provider_coalesce_distributed: bool = False  # also coalesce identical calls across processes via Redis
+    provider_coalesce_lock_ms: int = 5000
+    provider_retry_attempts: int = 3
+    provider_breaker_failure_threshold: int = 5  # consecutive failures before an endpoint fails fast
+    provider_breaker_reset_seconds: float = 30.0
+    provider_fallback_ttl_seconds: int = 2 * 24 * 3600  # how long last-known responses are kept
+
+    # ── Synthetic provider (PROVIDER_NAME=synthetic) ─────────────
+    synthetic_leagues: int = 20
+    synthetic_teams_per_league: int = 20
+    synthetic_seasons: int = 1
+    synthetic_live_matches: int = 10
+    synthetic_events_per_minute: float = 0.05
+    synthetic_latency_ms: float = 0.0
+    synthetic_error_rate: float = 0.0
+    synthetic_seed: int = 42
+
+    # ── Sync ─────────────────────────────────────────────────────
+    sync_fetch_concurrency: int = 8  # max provider calls in flight during a sync run
 
     # ── Pagination defaults ──────────────────────────────────────
     default_page_size: int = 20
@@ -68,8 +105,8 @@ class Settings(BaseSettings):
 
     @property
     def effective_provider(self) -> ProviderName:
-        """Use mock if no API key is set, regardless of provider_name."""
-        if not self.provider_api_key and self.provider_name != ProviderName.mock:
+        """Use mock if no API key is set, unless the provider needs none (mock, synthetic)."""
+        if not self.provider_api_key and self.provider_name not in (ProviderName.mock, ProviderName.synthetic):
             return ProviderName.mock
         return self.provider_name
 
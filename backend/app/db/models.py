@@ -118,9 +118,12 @@ class Fixture(Base):
 
 class Event(Base):
     __tablename__ = "events"
+    __table_args__ = (UniqueConstraint("fixture_id", "event_key"),)
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid_pk)
     fixture_id: Mapped[str] = mapped_column(String(36), ForeignKey("fixtures.id"), index=True)
+    # Stable identity of the provider event within its fixture (see services.sync.event_keys)
+    event_key: Mapped[str | None] = mapped_column(String(64), nullable=True)
     type: Mapped[str] = mapped_column(String(50))  # goal / card / substitution / ...
     minute: Mapped[int | None] = mapped_column(Integer, nullable=True)
     team_id: Mapped[str | None] = mapped_column(String(36), ForeignKey("teams.id"), nullable=True)
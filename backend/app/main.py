@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
@@ -14,6 +16,9 @@ from app.api import admin, auth, catalog, fixtures, health, me, standings
 from app.core.config import get_settings
 from app.core.errors import generic_exception_handler, validation_exception_handler
 from app.core.logging import RequestIDMiddleware, configure_logging
+from app.services.cache import get_cache_metrics, get_local_cache, run_invalidation_listener
+from app.services.cache_metrics import run_metrics_logger
+from app.services.factory import get_provider
 
 configure_logging()
 settings = get_settings()
@@ -29,8 +34,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         env=settings.app_env,
         provider=settings.effective_provider,
     )
+    # Keeps this worker's in-process cache coherent with writes made by the others
+    listener = asyncio.create_task(run_invalidation_listener()) if get_local_cache() is not None else None
+    interval = settings.cache_metrics_log_interval_seconds
+    metrics_logger = asyncio.create_task(run_metrics_logger(get_cache_metrics(), interval)) if interval > 0 else None
     yield
     log.info("MyTeams API shutting down")
+    for task in (listener, metrics_logger):
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+    get_cache_metrics().log_summary()
+    # The provider owns a pooled HTTP client for the lifetime of the process
+    await get_provider().aclose()
 
 
 app = FastAPI(
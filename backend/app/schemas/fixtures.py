@@ -45,5 +45,5 @@ class FixtureDetailOut(FixtureOut):
 
 
 class SyncIn(BaseModel):
-    scope: str  # fixtures | standings | events
+    scope: str  # fixtures | standings | events | live
     hours_forward: int = 72
@@ -2,32 +2,181 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable, Sequence
 from datetime import datetime
+from functools import partial
+from typing import Any, ClassVar, TypeVar
 
 import httpx
+import orjson
 
+from app.core.logging import get_logger
 from app.services.provider import (
     FootballProvider,
     ProviderEvent,
     ProviderFixture,
     ProviderLeague,
+    ProviderLiveFixture,
     ProviderStanding,
     ProviderTeam,
 )
+from app.services.provider_cache import ResponseStore
+from app.services.provider_quota import Priority, QuotaScheduler
+
+log = get_logger("api_football")
+R = TypeVar("R")
 
 
 class ApiFootballProvider(FootballProvider):
-    """Adapter for API-Football v3 (RapidAPI / direct)."""
+    """Adapter for API-Football v3 (RapidAPI / direct).
+
+    Requests go through one keep-alive client sized by the connection limits and
+    ``http2``. Those settings configure the default HTTP pool only: an injected
+    ``transport`` (cassette recording or replay, tests) brings its own connection
+    handling and is used as is.
+    """
+
+    # Read timeouts per endpoint; anything not listed uses the provider-wide default.
+    # Live events and team search sit on latency-sensitive paths, so they fail fast.
+    ENDPOINT_TIMEOUTS: ClassVar[dict[str, float]] = {
+        "/fixtures/events": 5.0,
+        "/teams": 8.0,
+    }
+    # Upper bound of the ``ids`` filter on /fixtures.
+    FIXTURE_IDS_PER_CALL: ClassVar[int] = 20
 
-    def __init__(self, api_key: str, base_url: str = "https://v3.football.api-sports.io") -> None:
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://v3.football.api-sports.io",
+        *,
+        timeout: float = 15.0,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        endpoint_timeouts: dict[str, float] | None = None,
+        validator_store: ResponseStore | None = None,
+        validator_ttl_seconds: int = 7 * 24 * 3600,
+        quota: QuotaScheduler | None = None,
+        ids_concurrency: int = 4,
+        parse_offload_bytes: int = 0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
         self._base = base_url.rstrip("/")
         self._headers = {
             "x-rapidapi-host": "v3.football.api-sports.io",
             "x-rapidapi-key": api_key,
         }
+        self._timeout = timeout
+        self._endpoint_timeouts = {**self.ENDPOINT_TIMEOUTS, **(endpoint_timeouts or {})}
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._http2 = http2  # requires the optional "h2" package (pip install ".[http2]")
+        self._http: httpx.AsyncClient | None = None
+        # Optional ETag/Last-Modified store: cached bodies are revalidated with
+        # conditional requests and reused on 304 Not Modified.
+        self._validators = validator_store
+        self._validator_ttl = validator_ttl_seconds
+        self._counts = {"requests": 0, "not_modified": 0, "parsed_in_thread": 0}
+        self._quota = quota
+        self._ids_concurrency = ids_concurrency
+        self._parse_offload_bytes = parse_offload_bytes  # 0 parses everything on the event loop
+        # Custom transport, e.g. cassette recording/replay (see provider_cassette);
+        # replaces the pool above, so the limits and http2 do not apply to it
+        self._transport = transport
 
     def _client(self) -> httpx.AsyncClient:
-        return httpx.AsyncClient(headers=self._headers, timeout=15.0)
+        """Return the shared keep-alive client, creating it on first use."""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                headers=self._headers,
+                timeout=self._timeout,
+                limits=self._limits,
+                http2=self._http2,
+                transport=self._transport,
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    def stats(self) -> dict[str, Any]:
+        stats: dict[str, Any] = {"http": dict(self._counts)}
+        if self._quota is not None:
+            stats["quota"] = self._quota.summary()
+        return stats
+
+    async def _get(
+        self,
+        path: str,
+        params: dict[str, str],
+        parse: Callable[[dict[str, Any]], R],
+        priority: Priority = Priority.background,
+    ) -> R:
+        """Fetch ``path`` and hand the decoded body to ``parse``.
+
+        Bodies of at least ``parse_offload_bytes`` are decoded and parsed in a worker
+        thread. Only the DTO building interleaves with the event loop there (orjson
+        holds the GIL for the whole decode), so this is off by default; compare both
+        on your payloads with ``benchmarks/bench_parse.py``.
+        """
+        content = await self._fetch(path, params, priority)
+        if self._parse_offload_bytes and len(content) >= self._parse_offload_bytes:
+            self._counts["parsed_in_thread"] += 1
+            return await asyncio.to_thread(_decode, content, parse)
+        return _decode(content, parse)
+
+    async def _fetch(self, path: str, params: dict[str, str], priority: Priority) -> bytes:
+        timeout = httpx.Timeout(self._timeout, read=self._endpoint_timeouts.get(path, self._timeout))
+        key = f"provider:http:{path}?" + "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+        cached = await self._load_validator(key)
+        headers: dict[str, str] = {}
+        if cached is not None:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        if self._quota is not None:
+            await self._quota.acquire(priority)
+        self._counts["requests"] += 1
+        r = await self._client().get(f"{self._base}{path}", params=params, headers=headers, timeout=timeout)
+        if self._quota is not None:
+            await self._quota.observe(r.headers)
+        if r.status_code == httpx.codes.NOT_MODIFIED and cached is not None:
+            self._counts["not_modified"] += 1
+            body: str = cached["body"]
+            return body.encode()
+        r.raise_for_status()
+
+        validators = {"etag": r.headers.get("etag"), "last_modified": r.headers.get("last-modified")}
+        if self._validators is not None and any(validators.values()):
+            entry = orjson.dumps({**validators, "body": r.content.decode()}).decode()
+            try:
+                await self._validators.set(key, entry, self._validator_ttl)
+            except Exception as exc:
+                log.warning("Validator store write failed", path=path, error=str(exc))
+        return r.content
+
+    async def _load_validator(self, key: str) -> dict[str, Any] | None:
+        if self._validators is None:
+            return None
+        try:
+            raw = await self._validators.get(key)
+        except Exception as exc:
+            log.warning("Validator store read failed", key=key, error=str(exc))
+            return None
+        if raw is None:
+            return None
+        entry: dict[str, Any] = orjson.loads(raw)
+        return entry
 
     async def get_leagues(self, country: str | None = None, season: str | None = None) -> list[ProviderLeague]:
         params: dict[str, str] = {}
@@ -35,9 +184,10 @@ class ApiFootballProvider(FootballProvider):
             params["country"] = country
         if season:
             params["season"] = season
-        async with self._client() as client:
-            r = await client.get(f"{self._base}/leagues", params=params)
-            r.raise_for_status()
+        return await self._get("/leagues", params, partial(self._parse_leagues, season=season))
+
+    @staticmethod
+    def _parse_leagues(data: dict[str, Any], season: str | None) -> list[ProviderLeague]:
         return [
             ProviderLeague(
                 provider_id=str(item["league"]["id"]),
@@ -46,29 +196,19 @@ class ApiFootballProvider(FootballProvider):
                 season=str(item["seasons"][-1]["year"]) if item.get("seasons") else (season or ""),
                 logo_url=item["league"].get("logo"),
             )
-            for item in r.json().get("response", [])
+            for item in data.get("response", [])
         ]
 
     async def get_teams(self, league_provider_id: str) -> list[ProviderTeam]:
-        async with self._client() as client:
-            r = await client.get(f"{self._base}/teams", params={"league": league_provider_id})
-            r.raise_for_status()
-        return [
-            ProviderTeam(
-                provider_id=str(item["team"]["id"]),
-                name=item["team"]["name"],
-                short_name=item["team"].get("code"),
-                country=item["team"].get("country"),
-                logo_url=item["team"].get("logo"),
-                league_provider_id=league_provider_id,
-            )
-            for item in r.json().get("response", [])
-        ]
+        parse = partial(self._parse_teams, league_provider_id=league_provider_id)
+        return await self._get("/teams", {"league": league_provider_id}, parse)
 
     async def search_teams(self, query: str, limit: int = 10) -> list[ProviderTeam]:
-        async with self._client() as client:
-            r = await client.get(f"{self._base}/teams", params={"search": query})
-            r.raise_for_status()
+        teams = await self._get("/teams", {"search": query}, self._parse_teams, Priority.interactive)
+        return teams[:limit]
+
+    @staticmethod
+    def _parse_teams(data: dict[str, Any], league_provider_id: str | None = None) -> list[ProviderTeam]:
         return [
             ProviderTeam(
                 provider_id=str(item["team"]["id"]),
@@ -76,8 +216,9 @@ class ApiFootballProvider(FootballProvider):
                 short_name=item["team"].get("code"),
                 country=item["team"].get("country"),
                 logo_url=item["team"].get("logo"),
+                league_provider_id=league_provider_id,
             )
-            for item in r.json().get("response", [])[:limit]
+            for item in data.get("response", [])
         ]
 
     async def get_fixtures(
@@ -88,53 +229,92 @@ class ApiFootballProvider(FootballProvider):
             "from": from_date.strftime("%Y-%m-%d"),
             "to": to_date.strftime("%Y-%m-%d"),
         }
-        async with self._client() as client:
-            r = await client.get(f"{self._base}/fixtures", params=params)
-            r.raise_for_status()
+        return await self._get("/fixtures", params, self._parse_fixtures, Priority.fixtures)
+
+    async def get_league_fixtures(
+        self, league_provider_id: str, season: str, from_date: datetime, to_date: datetime
+    ) -> list[ProviderFixture]:
+        params = {
+            "league": league_provider_id,
+            "season": season,
+            "from": from_date.strftime("%Y-%m-%d"),
+            "to": to_date.strftime("%Y-%m-%d"),
+        }
+        return await self._get("/fixtures", params, self._parse_fixtures, Priority.fixtures)
+
+    async def get_fixtures_by_ids(self, fixture_provider_ids: Sequence[str]) -> list[ProviderFixture]:
+        ids = sorted(set(fixture_provider_ids))
+        size = self.FIXTURE_IDS_PER_CALL
+        semaphore = asyncio.Semaphore(self._ids_concurrency)
+
+        async def chunk(batch: list[str]) -> list[ProviderFixture]:
+            async with semaphore:
+                return await self._get("/fixtures", {"ids": "-".join(batch)}, self._parse_fixtures, Priority.fixtures)
+
+        batches = await asyncio.gather(*(chunk(ids[i : i + size]) for i in range(0, len(ids), size)))
+        return [fixture for batch in batches for fixture in batch]
+
+    @classmethod
+    def _parse_fixtures(cls, data: dict[str, Any]) -> list[ProviderFixture]:
+        return [cls._parse_fixture(item) for item in data.get("response", [])]
+
+    @staticmethod
+    def _parse_fixture(item: dict[str, Any]) -> ProviderFixture:
+        f = item["fixture"]
+        goals = item.get("goals", {})
+        return ProviderFixture(
+            provider_id=str(f["id"]),
+            league_provider_id=str(item["league"]["id"]),
+            season=str(item["league"]["season"]),
+            home_team_provider_id=str(item["teams"]["home"]["id"]),
+            away_team_provider_id=str(item["teams"]["away"]["id"]),
+            start_time=datetime.fromisoformat(f["date"]),
+            status=f["status"]["short"],
+            home_score=goals.get("home"),
+            away_score=goals.get("away"),
+        )
+
+    async def get_live_fixtures(self, league_provider_ids: Sequence[str] | None = None) -> list[ProviderLiveFixture]:
+        live = "-".join(sorted(league_provider_ids)) if league_provider_ids else "all"
+        return await self._get("/fixtures", {"live": live}, self._parse_live_fixtures, Priority.live)
+
+    @classmethod
+    def _parse_live_fixtures(cls, data: dict[str, Any]) -> list[ProviderLiveFixture]:
         results = []
-        for item in r.json().get("response", []):
-            f = item["fixture"]
-            goals = item.get("goals", {})
-            results.append(
-                ProviderFixture(
-                    provider_id=str(f["id"]),
-                    league_provider_id=str(item["league"]["id"]),
-                    season=str(item["league"]["season"]),
-                    home_team_provider_id=str(item["teams"]["home"]["id"]),
-                    away_team_provider_id=str(item["teams"]["away"]["id"]),
-                    start_time=datetime.fromisoformat(f["date"]),
-                    status=f["status"]["short"],
-                    home_score=goals.get("home"),
-                    away_score=goals.get("away"),
-                )
-            )
+        for item in data.get("response", []):
+            fixture = cls._parse_fixture(item)
+            events = [cls._parse_event(fixture.provider_id, event) for event in item.get("events") or []]
+            results.append(ProviderLiveFixture(fixture, events))
         return results
 
     async def get_events(self, fixture_provider_id: str) -> list[ProviderEvent]:
-        async with self._client() as client:
-            r = await client.get(f"{self._base}/fixtures/events", params={"fixture": fixture_provider_id})
-            r.raise_for_status()
-        results = []
-        for item in r.json().get("response", []):
-            results.append(
-                ProviderEvent(
-                    fixture_provider_id=fixture_provider_id,
-                    type=item["type"].lower(),
-                    minute=item["time"].get("elapsed"),
-                    team_provider_id=str(item["team"]["id"]) if item.get("team") else None,
-                    player_name=item["player"].get("name") if item.get("player") else None,
-                    payload={"detail": item.get("detail"), "comments": item.get("comments")},
-                )
-            )
-        return results
+        parse = partial(self._parse_events, fixture_provider_id=fixture_provider_id)
+        return await self._get("/fixtures/events", {"fixture": fixture_provider_id}, parse, Priority.live)
+
+    @classmethod
+    def _parse_events(cls, data: dict[str, Any], fixture_provider_id: str) -> list[ProviderEvent]:
+        return [cls._parse_event(fixture_provider_id, item) for item in data.get("response", [])]
+
+    @staticmethod
+    def _parse_event(fixture_provider_id: str, item: dict[str, Any]) -> ProviderEvent:
+        return ProviderEvent(
+            fixture_provider_id=fixture_provider_id,
+            type=item["type"].lower(),
+            minute=item["time"].get("elapsed"),
+            team_provider_id=str(item["team"]["id"]) if item.get("team") else None,
+            player_name=item["player"].get("name") if item.get("player") else None,
+            payload={"detail": item.get("detail"), "comments": item.get("comments")},
+        )
 
     async def get_standings(self, league_provider_id: str, season: str) -> list[ProviderStanding]:
         params = {"league": league_provider_id, "season": season}
-        async with self._client() as client:
-            r = await client.get(f"{self._base}/standings", params=params)
-            r.raise_for_status()
+        parse = partial(self._parse_standings, league_provider_id=league_provider_id, season=season)
+        return await self._get("/standings", params, parse)
+
+    @staticmethod
+    def _parse_standings(data: dict[str, Any], league_provider_id: str, season: str) -> list[ProviderStanding]:
         results = []
-        for group in r.json().get("response", []):
+        for group in data.get("response", []):
             for league_obj in group.get("league", {}).get("standings", []):
                 for entry in league_obj:
                     all_stats = entry.get("all", {})
@@ -156,3 +336,7 @@ class ApiFootballProvider(FootballProvider):
                         )
                     )
         return results
+
+
+def _decode(content: bytes, parse: Callable[[dict[str, Any]], R]) -> R:
+    return parse(orjson.loads(content))
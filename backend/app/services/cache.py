@@ -1,16 +1,47 @@
-"""Redis cache helper."""
+"""Redis cache helper, fronted by a small in-process cache.
+
+Reads try the process-local L1 first, then Redis (L2). Writes and deletes go
+to both and are announced on a pub/sub channel, so the other API workers drop
+their L1 copy; L1 entries also expire after a few seconds in case a message is
+missed while a subscriber reconnects.
+"""
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import fnmatch
 import json
+import math
+import random
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass
 from typing import Any
 
 import redis.asyncio as aioredis
+from redis.exceptions import RedisError
 
 from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.services.cache_metrics import CacheMetrics
+
+log = get_logger("cache")
 
 _pool: aioredis.ConnectionPool | None = None
 
+INVALIDATION_CHANNEL = "cache:invalidate"
+GENERATION_PREFIX = "cache:gen:"
+# Counters must outlive every entry keyed by them, or a reset could revive old entries
+GENERATION_TTL_SECONDS = 30 * 24 * 3600
+RECOMPUTE_LOCK_MS = 5000  # upper bound on one get-or-compute recomputation
+# Server-wide (not per family): TTL expiries, maxmemory evictions, hit/miss
+_REDIS_INFO_FIELDS = ("expired_keys", "evicted_keys", "keyspace_hits", "keyspace_misses")
+_ORIGIN = uuid.uuid4().hex  # tags this process' own invalidation messages
+_MISSING = object()
+
 
 def get_redis_pool() -> aioredis.ConnectionPool:
     global _pool
@@ -20,32 +51,605 @@ def get_redis_pool() -> aioredis.ConnectionPool:
     return _pool
 
 
-async def cache_get(key: str) -> Any | None:
+async def get_redis() -> AsyncGenerator[aioredis.Redis, None]:
+    """FastAPI dependency: one client for all cache calls of a request."""
     async with aioredis.Redis(connection_pool=get_redis_pool()) as r:
-        raw = await r.get(key)
-        if raw is None:
-            return None
+        yield r
+
+
+@contextlib.asynccontextmanager
+async def _client(client: aioredis.Redis | None) -> AsyncIterator[aioredis.Redis]:
+    """Use the caller's client, or a pooled one for just this call."""
+    if client is not None:
+        yield client
+        return
+    async with aioredis.Redis(connection_pool=get_redis_pool()) as r:
+        yield r
+
+
+# ── L1: in-process LRU ────────────────────────────────────────────────────────
+
+
+class LocalCache:
+    """Size-bounded LRU whose entries also expire ``ttl_seconds`` after being stored.
+
+    Every reader gets the stored object itself, so values must be immutable: JSON
+    values are kept as their serialized payload and decoded on each hit.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+        metrics: CacheMetrics | None = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._metrics = metrics
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Any:
+        """Return the value, or ``_MISSING`` (values may legitimately be None)."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        expires_at, value = entry
+        if self._clock() >= expires_at:
+            del self._entries[key]
+            if self._metrics is not None:
+                self._metrics.for_key(key).l1_expirations += 1
+            return _MISSING
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        self._entries[key] = (self._clock() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            if self._metrics is not None:
+                self._metrics.for_key(evicted).l1_evictions += 1
+
+    def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def delete_matching(self, pattern: str) -> None:
+        for key in [k for k in self._entries if fnmatch.fnmatchcase(k, pattern)]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_l1: LocalCache | None = None
+_metrics = CacheMetrics()
+
+
+def get_local_cache() -> LocalCache | None:
+    """The process-wide L1, or None when CACHE_L1_MAX_ENTRIES is 0."""
+    global _l1
+    settings = get_settings()
+    if settings.cache_l1_max_entries <= 0:
+        return None
+    if _l1 is None:
+        _l1 = LocalCache(settings.cache_l1_max_entries, settings.cache_l1_ttl_seconds, metrics=_metrics)
+    return _l1
+
+
+def cache_stats() -> dict[str, Any]:
+    l1 = get_local_cache()
+    return {**_metrics.totals().summary(), "l1_entries": len(l1) if l1 is not None else None}
+
+
+async def cache_metrics() -> dict[str, Any]:
+    """Per-family metrics of this process, plus Redis' own expiry and eviction counters."""
+    l1 = get_local_cache()
+    try:
+        async with aioredis.Redis(connection_pool=get_redis_pool()) as r:
+            info = await r.info("stats")
+        redis: dict[str, Any] | None = {name: info.get(name) for name in _REDIS_INFO_FIELDS}
+    except RedisError:
+        redis = None
+    return {
+        **_metrics.snapshot(),
+        "l1": {"entries": len(l1), "max_entries": l1.max_entries} if l1 is not None else None,
+        "redis": redis,
+    }
+
+
+def get_cache_metrics() -> CacheMetrics:
+    return _metrics
+
+
+@contextlib.contextmanager
+def _observe(op: str, *keys: str) -> Iterator[None]:
+    """Time one Redis round trip for the families of ``keys``; count it as an error if it raises."""
+    families = _metrics.for_keys(keys)
+    start = time.perf_counter()
+    try:
+        yield
+    except RedisError:
+        for stats in families:
+            stats.errors += 1
+        raise
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    for stats in families:
+        stats.observe_latency(op, elapsed_ms)
+
+
+# ── Cache API ─────────────────────────────────────────────────────────────────
+
+
+async def cache_get(key: str, *, client: aioredis.Redis | None = None) -> Any | None:
+    stats = _metrics.for_key(key)
+    l1 = get_local_cache()
+    if l1 is not None and (raw := l1.get(key)) is not _MISSING:
+        stats.l1_hits += 1
         return json.loads(raw)
+    with _observe("get", key):
+        async with _client(client) as r:
+            raw = await r.get(key)
+    if raw is None:
+        stats.misses += 1
+        return None
+    stats.l2_hits += 1
+    if l1 is not None:
+        l1.set(key, raw)
+    return json.loads(raw)
 
 
-async def cache_set(key: str, value: Any, ttl_seconds: int | None = None) -> None:
+async def cache_set(
+    key: str, value: Any, ttl_seconds: int | None = None, *, client: aioredis.Redis | None = None
+) -> None:
     settings = get_settings()
     ttl = ttl_seconds or settings.redis_cache_ttl_seconds
-    async with aioredis.Redis(connection_pool=get_redis_pool()) as r:
-        await r.set(key, json.dumps(value), ex=ttl)
+    payload = json.dumps(value)
+    stats = _metrics.for_key(key)
+    with _observe("set", key):
+        async with _client(client) as r, r.pipeline(transaction=False) as pipe:
+            pipe.set(key, payload, ex=ttl)
+            _announce(pipe, "key", key)
+            await pipe.execute()
+    stats.writes += 1
+    stats.payload_bytes.observe(len(payload))
+    if (l1 := get_local_cache()) is not None:
+        l1.set(key, payload)
 
 
-async def cache_delete(key: str) -> None:
-    async with aioredis.Redis(connection_pool=get_redis_pool()) as r:
-        await r.delete(key)
+async def cache_delete(key: str, *, client: aioredis.Redis | None = None) -> None:
+    with _observe("delete", key):
+        async with _client(client) as r, r.pipeline(transaction=False) as pipe:
+            pipe.delete(key)
+            _announce(pipe, "key", key)
+            await pipe.execute()
+    _metrics.for_key(key).deletes += 1
+    if (l1 := get_local_cache()) is not None:
+        l1.delete(key)
+
+
+# ── Batches ───────────────────────────────────────────────────────────────────
+# One round trip for any number of keys: MGET for reads, a non-transactional
+# pipeline for writes and deletes.
+
+
+async def cache_get_many(keys: Iterable[str], *, client: aioredis.Redis | None = None) -> dict[str, Any]:
+    """Values of the keys that are cached; missing keys are left out."""
+    l1 = get_local_cache()
+    found: dict[str, Any] = {}
+    remote: list[str] = []
+    for key in dict.fromkeys(keys):
+        if l1 is not None and (raw := l1.get(key)) is not _MISSING:
+            _metrics.for_key(key).l1_hits += 1
+            found[key] = json.loads(raw)
+        else:
+            remote.append(key)
+    if not remote:
+        return found
+    with _observe("mget", *remote):
+        async with _client(client) as r:
+            raws = await r.mget(remote)
+    for key, raw in zip(remote, raws, strict=True):
+        stats = _metrics.for_key(key)
+        if raw is None:
+            stats.misses += 1
+            continue
+        stats.l2_hits += 1
+        found[key] = json.loads(raw)
+        if l1 is not None:
+            l1.set(key, raw)
+    return found
+
+
+async def cache_set_many(
+    items: Mapping[str, Any],
+    ttl_seconds: int | Mapping[str, int] | None = None,
+    *,
+    client: aioredis.Redis | None = None,
+) -> None:
+    """Store several values; ``ttl_seconds`` is one TTL for all or a per-key mapping."""
+    if not items:
+        return
+    default_ttl = get_settings().redis_cache_ttl_seconds
+    payloads = {key: json.dumps(value) for key, value in items.items()}
+    with _observe("mset", *payloads):
+        async with _client(client) as r, r.pipeline(transaction=False) as pipe:
+            for key, payload in payloads.items():
+                ttl = ttl_seconds.get(key) if isinstance(ttl_seconds, Mapping) else ttl_seconds
+                pipe.set(key, payload, ex=ttl or default_ttl)
+                _announce(pipe, "key", key)
+            await pipe.execute()
+    for key, payload in payloads.items():
+        stats = _metrics.for_key(key)
+        stats.writes += 1
+        stats.payload_bytes.observe(len(payload))
+    if (l1 := get_local_cache()) is not None:
+        for key, payload in payloads.items():
+            l1.set(key, payload)
+
+
+async def cache_delete_many(keys: Iterable[str], *, client: aioredis.Redis | None = None) -> None:
+    unique = list(dict.fromkeys(keys))
+    if not unique:
+        return
+    with _observe("delete", *unique):
+        async with _client(client) as r, r.pipeline(transaction=False) as pipe:
+            pipe.delete(*unique)
+            for key in unique:
+                _announce(pipe, "key", key)
+            await pipe.execute()
+    for key in unique:
+        _metrics.for_key(key).deletes += 1
+    if (l1 := get_local_cache()) is not None:
+        for key in unique:
+            l1.delete(key)
 
 
 async def cache_delete_pattern(pattern: str) -> None:
-    """Delete all keys matching a glob pattern."""
+    """Delete all keys matching a glob pattern.
+
+    SCANs the whole keyspace, so it is for admin use only; request paths
+    invalidate with ``cache_bump_generation`` instead.
+    """
     async with aioredis.Redis(connection_pool=get_redis_pool()) as r:
         keys = [k async for k in r.scan_iter(pattern)]
         if keys:
             await r.delete(*keys)
+        await r.publish(INVALIDATION_CHANNEL, f"{_ORIGIN} pattern {pattern}")
+    if (l1 := get_local_cache()) is not None:
+        l1.delete_matching(pattern)
+
+
+# ── Get-or-compute ────────────────────────────────────────────────────────────
+# Values are response bodies, already serialized, stored as
+# "<logical expiry> <seconds the last computation took>\n<body>" and kept in
+# Redis for ``grace`` seconds past that expiry. Each reader may refresh early
+# with a probability that grows as the expiry nears (XFetch: the longer a value
+# takes to compute, the earlier). Only the caller that takes a short lock
+# recomputes; the others keep serving the old body, or on a cold key wait
+# briefly for the lock holder's result.
+
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+  return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class _Entry:
+    expires_at: float
+    delta: float
+    body: bytes
+
+    def encode(self) -> str:
+        return f"{self.expires_at} {self.delta}\n{self.body.decode()}"
+
+    @classmethod
+    def decode(cls, raw: str) -> _Entry:
+        header, _, body = raw.partition("\n")
+        expires_at, delta = header.split(" ")
+        return cls(float(expires_at), float(delta), body.encode())
+
+
+async def cache_get_or_compute(
+    key: str,
+    compute: Callable[[], Awaitable[bytes]],
+    ttl_seconds: int | None = None,
+    *,
+    grace_seconds: int | None = None,
+    beta: float = 1.0,
+    client: aioredis.Redis | None = None,
+) -> bytes:
+    """Cached body of ``key``, calling ``compute`` at most once across processes per refresh.
+
+    ``compute`` returns the serialized (UTF-8 JSON) body, which hits hand back
+    untouched. If Redis is down it is called directly and nothing is cached.
+    """
+    settings = get_settings()
+    ttl = ttl_seconds or settings.redis_cache_ttl_seconds
+    grace = settings.cache_stale_grace_seconds if grace_seconds is None else grace_seconds
+    # Only the cache round trips are guarded: a RedisError from ``compute`` itself propagates
+    try:
+        body, token = await _cached_or_lock(key, grace, beta, client)
+    except RedisError as exc:
+        log.warning("Cache unavailable, computing uncached", key=key, error=str(exc))
+        return await compute()
+    if body is not None:
+        return body
+    return await _recompute(key, compute, ttl, grace, token, client)
+
+
+async def _cached_or_lock(
+    key: str, grace: int, beta: float, client: aioredis.Redis | None
+) -> tuple[bytes | None, str | None]:
+    """The body to serve, or None and the lock token to recompute with (None if the lock wait gave up)."""
+    entry = await _get_entry(key, client)
+    now = time.time()
+    if entry is not None and now < entry.expires_at + grace:
+        if now - entry.delta * beta * math.log(1.0 - random.random()) < entry.expires_at:  # noqa: S311
+            return entry.body, None
+        token = await _try_lock(key, client)
+        if token is None:
+            _metrics.for_key(key).stale_served += now >= entry.expires_at
+            return entry.body, None
+        _metrics.for_key(key).early_recomputes += now < entry.expires_at
+        return None, token
+
+    token = await _try_lock(key, client)
+    if token is None:
+        entry = await _wait_for_entry(key, client)
+        if entry is not None:
+            return entry.body, None
+    return None, token
+
+
+async def cache_refresh(
+    key: str,
+    compute: Callable[[], Awaitable[bytes]],
+    ttl_seconds: int | None = None,
+    *,
+    client: aioredis.Redis | None = None,
+) -> bytes:
+    """Recompute ``key`` now, whatever is cached, for ``cache_get_or_compute`` readers.
+
+    For writers that know the data changed (write-through warming). A failed
+    store is logged, not raised.
+    """
+    settings = get_settings()
+    ttl = ttl_seconds or settings.redis_cache_ttl_seconds
+    return await _recompute(key, compute, ttl, settings.cache_stale_grace_seconds, None, client)
+
+
+async def _get_entry(key: str, client: aioredis.Redis | None) -> _Entry | None:
+    stats = _metrics.for_key(key)
+    l1 = get_local_cache()
+    if l1 is not None and (value := l1.get(key)) is not _MISSING:
+        stats.l1_hits += 1
+        entry: _Entry = value
+        return entry
+    with _observe("get", key):
+        async with _client(client) as r:
+            raw = await r.get(key)
+    if raw is None:
+        stats.misses += 1
+        return None
+    stats.l2_hits += 1
+    entry = _Entry.decode(raw)
+    if l1 is not None:
+        l1.set(key, entry)
+    return entry
+
+
+async def _try_lock(key: str, client: aioredis.Redis | None) -> str | None:
+    token = uuid.uuid4().hex
+    async with _client(client) as r:
+        acquired = await r.set(f"lock:{key}", token, nx=True, px=RECOMPUTE_LOCK_MS)
+    return token if acquired else None
+
+
+async def _wait_for_entry(key: str, client: aioredis.Redis | None, poll_interval: float = 0.05) -> _Entry | None:
+    """Poll for the lock holder's result; None if it gave up or ran out of time."""
+    deadline = time.monotonic() + RECOMPUTE_LOCK_MS / 1000
+    async with _client(client) as r:
+        while time.monotonic() < deadline:
+            await asyncio.sleep(poll_interval)
+            raw = await r.get(key)
+            if raw is not None:
+                return _Entry.decode(raw)
+            if not await r.exists(f"lock:{key}"):
+                return None
+    return None
+
+
+async def _recompute(
+    key: str,
+    compute: Callable[[], Awaitable[bytes]],
+    ttl: int,
+    grace: int,
+    token: str | None,
+    client: aioredis.Redis | None,
+) -> bytes:
+    lock_key = f"lock:{key}"
+    start = time.monotonic()
+    try:
+        body = await compute()
+    except BaseException:
+        if token is not None:
+            # Otherwise the lock just expires after RECOMPUTE_LOCK_MS
+            with contextlib.suppress(RedisError):
+                async with _client(client) as r:
+                    await r.eval(_RELEASE_SCRIPT, 1, lock_key, token)  # type: ignore[misc]
+        raise
+    entry = _Entry(time.time() + ttl, time.monotonic() - start, body)
+    stats = _metrics.for_key(key)
+    stats.recomputes += 1
+    payload = entry.encode()
+    try:
+        with _observe("set", key):
+            async with _client(client) as r, r.pipeline(transaction=False) as pipe:
+                pipe.set(key, payload, ex=ttl + grace)
+                _announce(pipe, "key", key)
+                if token is not None:
+                    pipe.eval(_RELEASE_SCRIPT, 1, lock_key, token)
+                await pipe.execute()
+    except RedisError as exc:
+        log.warning("Computed value not cached", key=key, error=str(exc))
+        return body
+    stats.writes += 1
+    stats.payload_bytes.observe(len(payload))
+    if (l1 := get_local_cache()) is not None:
+        l1.set(key, entry)
+    return body
+
+
+# ── Batched recompute locks ───────────────────────────────────────────────────
+# The same per-key locks for values read with ``cache_get_many``: a caller takes
+# the locks of the keys it missed, builds only those in one go and waits for the
+# rest, so a key that expires under many readers is built once.
+
+
+async def cache_lock_many(keys: Iterable[str], *, client: aioredis.Redis | None = None) -> dict[str, str]:
+    """Take the recompute lock of every key that is free; the tokens of those taken, by key."""
+    tokens = {key: uuid.uuid4().hex for key in dict.fromkeys(keys)}
+    if not tokens:
+        return {}
+    async with _client(client) as r, r.pipeline(transaction=False) as pipe:
+        for key, token in tokens.items():
+            pipe.set(f"lock:{key}", token, nx=True, px=RECOMPUTE_LOCK_MS)
+        acquired = await pipe.execute()
+    return {key: token for (key, token), taken in zip(tokens.items(), acquired, strict=True) if taken}
+
+
+async def cache_unlock_many(tokens: Mapping[str, str], *, client: aioredis.Redis | None = None) -> None:
+    """Release locks taken by ``cache_lock_many``; one that expired and moved on is left alone."""
+    if not tokens:
+        return
+    async with _client(client) as r, r.pipeline(transaction=False) as pipe:
+        for key, token in tokens.items():
+            pipe.eval(_RELEASE_SCRIPT, 1, f"lock:{key}", token)
+        await pipe.execute()
+
+
+async def cache_wait_many(
+    keys: Iterable[str], *, client: aioredis.Redis | None = None, poll_interval: float = 0.05
+) -> dict[str, Any]:
+    """Poll for values other callers are building under their locks.
+
+    Returns those that arrived; a key is given up on once its lock is gone
+    without a value, or after ``RECOMPUTE_LOCK_MS``.
+    """
+    pending = list(dict.fromkeys(keys))
+    found: dict[str, Any] = {}
+    l1 = get_local_cache()
+    deadline = time.monotonic() + RECOMPUTE_LOCK_MS / 1000
+    async with _client(client) as r:
+        while pending and time.monotonic() < deadline:
+            await asyncio.sleep(poll_interval)
+            raws = await r.mget([*pending, *(f"lock:{key}" for key in pending)])
+            values, locks = raws[: len(pending)], raws[len(pending) :]
+            waiting = []
+            for key, raw, lock in zip(pending, values, locks, strict=True):
+                if raw is not None:
+                    found[key] = json.loads(raw)
+                    if l1 is not None:
+                        l1.set(key, raw)
+                elif lock is not None:
+                    waiting.append(key)
+            pending = waiting
+    return found
+
+
+# ── Generations ───────────────────────────────────────────────────────────────
+# A namespace (e.g. one user's dashboards) carries a counter that is part of
+# every key in it. Bumping the counter invalidates the whole namespace with one
+# INCR; entries under old generations are never read again and simply expire.
+
+
+async def cache_generation(namespace: str, *, client: aioredis.Redis | None = None) -> int:
+    key = f"{GENERATION_PREFIX}{namespace}"
+    l1 = get_local_cache()
+    stats = _metrics.for_key(key)
+    if l1 is not None and (value := l1.get(key)) is not _MISSING:
+        stats.l1_hits += 1
+        generation: int = value
+        return generation
+    with _observe("get", key):
+        async with _client(client) as r:
+            raw = await r.get(key)
+    if raw is None:
+        stats.misses += 1
+    else:
+        stats.l2_hits += 1
+    generation = int(raw or 0)
+    if l1 is not None:
+        l1.set(key, generation)
+    return generation
+
+
+async def cache_bump_generation(namespace: str, *, client: aioredis.Redis | None = None) -> int:
+    """Invalidate every key built by ``versioned_key`` for ``namespace``."""
+    key = f"{GENERATION_PREFIX}{namespace}"
+    with _observe("incr", key):
+        async with _client(client) as r, r.pipeline(transaction=False) as pipe:
+            pipe.incr(key)
+            pipe.expire(key, GENERATION_TTL_SECONDS)
+            _announce(pipe, "key", key)
+            generation = (await pipe.execute())[0]
+    _metrics.for_key(key).writes += 1
+    if (l1 := get_local_cache()) is not None:
+        l1.set(key, generation)
+    return int(generation)
+
+
+async def versioned_key(namespace: str, *parts: object, client: aioredis.Redis | None = None) -> str:
+    """``namespace:g<generation>:part:part…``"""
+    generation = await cache_generation(namespace, client=client)
+    return ":".join([namespace, f"g{generation}", *map(str, parts)])
+
+
+# ── Cross-process invalidation ────────────────────────────────────────────────
+
+
+def _announce(pipe: Any, kind: str, target: str) -> None:
+    # Even without an L1 here: the sync worker writes, API processes hold the copies
+    pipe.publish(INVALIDATION_CHANNEL, f"{_ORIGIN} {kind} {target}")
+
+
+def apply_invalidation(message: str) -> None:
+    """Drop the L1 entries named by a message another process published."""
+    origin, kind, target = message.split(" ", 2)
+    l1 = get_local_cache()
+    if l1 is None or origin == _ORIGIN:
+        return
+    if kind == "pattern":
+        l1.delete_matching(target)
+    else:
+        l1.delete(target)
+
+
+async def run_invalidation_listener(retry_seconds: float = 1.0) -> None:
+    """Apply invalidations from other processes until cancelled, resubscribing after errors."""
+    while True:
+        try:
+            async with aioredis.Redis(connection_pool=get_redis_pool()) as r, r.pubsub() as pubsub:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        apply_invalidation(message["data"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            log.warning("Cache invalidation channel lost, clearing L1", error=str(exc))
+        # Messages may have been missed while disconnected
+        if (l1 := get_local_cache()) is not None:
+            l1.clear()
+        await asyncio.sleep(retry_seconds)
 
 
 async def redis_ping() -> bool:
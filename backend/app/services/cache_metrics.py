@@ -0,0 +1,185 @@
+"""Response cache metrics, broken down by key family.
+
+A key's family is its leading segment (``standings``, ``dashboard``...), plus
+the second one when that is a fixed word rather than an id: per-team dashboard
+fragments (``dashboard:team``) and per-user follow lists (``dashboard``) are
+tuned separately. Each family counts hits per tier, misses, writes, deletes,
+errors and L1 evictions/expiries, and keeps histograms of Redis round-trip
+latency per operation and of the serialized size of written values.
+
+Counters are per process and since start, like the provider stats; they are
+served by ``GET /admin/cache/metrics`` and logged periodically.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.core.logging import get_logger
+
+log = get_logger("cache_metrics")
+
+LATENCY_BUCKETS_MS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0)
+PAYLOAD_BUCKETS_BYTES = (256, 1024, 4096, 16384, 65536, 262144, 1048576)
+
+
+def key_family(key: str) -> str:
+    head, _, rest = key.partition(":")
+    second = rest.partition(":")[0]
+    return f"{head}:{second}" if second.isalpha() else head
+
+
+@dataclass(slots=True)
+class Histogram:
+    """Fixed-bucket histogram; ``counts[i]`` holds values up to ``bounds[i]``, the last slot the rest."""
+
+    bounds: tuple[float, ...]
+    counts: list[int] = field(init=False)
+    total: int = 0
+    sum: float = 0.0
+
+    def __post_init__(self) -> None:
+        self.counts = [0] * (len(self.bounds) + 1)
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float | None:
+        """Upper bound of the bucket holding the ``q`` quantile; None if empty or past the last bound."""
+        if not self.total:
+            return None
+        rank, seen = q * self.total, 0
+        for bound, count in zip(self.bounds, self.counts, strict=False):
+            seen += count
+            if seen >= rank:
+                return bound
+        return None
+
+    def summary(self) -> dict[str, Any]:
+        labels = [f"le_{bound:g}" for bound in self.bounds] + ["inf"]
+        return {
+            "count": self.total,
+            "mean": round(self.sum / self.total, 3) if self.total else None,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": dict(zip(labels, self.counts, strict=True)),
+        }
+
+
+@dataclass
+class CacheTierStats:
+    l1_hits: int = 0
+    l2_hits: int = 0
+    misses: int = 0
+    recomputes: int = 0  # get-or-compute: values computed and stored by this process
+    early_recomputes: int = 0  # ...of which started before the entry expired
+    stale_served: int = 0  # expired entries served while another caller recomputed
+
+    def summary(self) -> dict[str, Any]:
+        lookups = self.l1_hits + self.l2_hits + self.misses
+        return {
+            "lookups": lookups,
+            "l1_hits": self.l1_hits,
+            "l2_hits": self.l2_hits,
+            "misses": self.misses,
+            "l1_hit_ratio": round(self.l1_hits / lookups, 3) if lookups else None,
+            "l2_hit_ratio": round(self.l2_hits / lookups, 3) if lookups else None,
+            "recomputes": self.recomputes,
+            "early_recomputes": self.early_recomputes,
+            "stale_served": self.stale_served,
+        }
+
+
+@dataclass
+class FamilyStats(CacheTierStats):
+    writes: int = 0
+    deletes: int = 0
+    errors: int = 0  # Redis calls that raised
+    l1_evictions: int = 0  # pushed out of the LRU by newer entries
+    l1_expirations: int = 0  # found past their L1 TTL
+    latency_ms: dict[str, Histogram] = field(default_factory=dict)  # Redis round trips, by operation
+    # Length of each written value as serialized (UTF-8 JSON; bytes for ASCII text)
+    payload_bytes: Histogram = field(default_factory=lambda: Histogram(PAYLOAD_BUCKETS_BYTES))
+
+    def observe_latency(self, op: str, ms: float) -> None:
+        if (histogram := self.latency_ms.get(op)) is None:
+            histogram = self.latency_ms[op] = Histogram(LATENCY_BUCKETS_MS)
+        histogram.observe(ms)
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            **super().summary(),
+            "writes": self.writes,
+            "deletes": self.deletes,
+            "errors": self.errors,
+            "l1_evictions": self.l1_evictions,
+            "l1_expirations": self.l1_expirations,
+            "latency_ms": {op: h.summary() for op, h in sorted(self.latency_ms.items())},
+            "payload_bytes": self.payload_bytes.summary(),
+        }
+
+
+class CacheMetrics:
+    """``FamilyStats`` per key family, created on first use."""
+
+    def __init__(self) -> None:
+        self.started_at = time.time()
+        self.families: dict[str, FamilyStats] = {}
+
+    def for_key(self, key: str) -> FamilyStats:
+        family = key_family(key)
+        if (stats := self.families.get(family)) is None:
+            stats = self.families[family] = FamilyStats()
+        return stats
+
+    def for_keys(self, keys: Iterable[str]) -> list[FamilyStats]:
+        return list({key_family(k): self.for_key(k) for k in keys}.values())
+
+    def totals(self) -> CacheTierStats:
+        totals = CacheTierStats()
+        for stats in self.families.values():
+            for name in CacheTierStats.__dataclass_fields__:
+                setattr(totals, name, getattr(totals, name) + getattr(stats, name))
+        return totals
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+            "families": {name: stats.summary() for name, stats in sorted(self.families.items())},
+        }
+
+    def log_summary(self) -> None:
+        """One structured line per family with the figures TTL tuning needs."""
+        for name, stats in sorted(self.families.items()):
+            summary = stats.summary()
+            get = stats.latency_ms.get("get") or stats.latency_ms.get("mget")
+            log.info(
+                "Cache metrics",
+                family=name,
+                lookups=summary["lookups"],
+                l1_hit_ratio=summary["l1_hit_ratio"],
+                l2_hit_ratio=summary["l2_hit_ratio"],
+                misses=stats.misses,
+                writes=stats.writes,
+                errors=stats.errors,
+                stale_served=stats.stale_served,
+                l1_evictions=stats.l1_evictions,
+                l1_expirations=stats.l1_expirations,
+                read_p95_ms=get.quantile(0.95) if get else None,
+                payload_p95_bytes=stats.payload_bytes.quantile(0.95),
+            )
+
+
+async def run_metrics_logger(metrics: CacheMetrics, interval_seconds: float) -> None:
+    """Log ``metrics`` every ``interval_seconds`` until cancelled."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        metrics.log_summary()
@@ -0,0 +1,108 @@
+"""Write-through warming of the cached reads a sync run made stale.
+
+``SyncService`` records what it wrote in a ``ChangeSet``. Once the run is
+committed, ``warm_caches`` rebuilds exactly the entries built from those rows,
+so the next request hits a fresh entry instead of a stale one or a cold miss:
+
+- standings tables of the changed ``(league, season)`` pairs;
+- dashboard fragments and default fixture windows of changed teams that
+  someone follows. Those of other teams are only dropped: nobody is likely to
+  read them before they would expire.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+import redis.asyncio as aioredis
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.db.models import Follow
+from app.services.cache import cache_delete_many, cache_refresh, cache_set_many
+from app.services.dashboard import build_team_fragments, fragment_ttl, team_fragment_key
+from app.services.id_resolver import IN_CHUNK_SIZE, chunks
+from app.services.standings import build_standings_body, standings_key
+from app.services.team_fixtures import build_team_fixture_windows, team_fixtures_key
+
+log = get_logger("cache_warmer")
+
+
+@dataclass
+class ChangeSet:
+    """Rows written by a sync run, by DB id."""
+
+    leagues: set[tuple[str, str]] = field(default_factory=set)  # (league_id, season) of changed standings
+    teams: set[str] = field(default_factory=set)  # teams whose fixtures or standing changed
+    fixtures: set[str] = field(default_factory=set)
+
+    def __bool__(self) -> bool:
+        return bool(self.leagues or self.teams or self.fixtures)
+
+    def clear(self) -> None:
+        self.leagues.clear()
+        self.teams.clear()
+        self.fixtures.clear()
+
+    def summary(self) -> dict[str, int]:
+        return {"leagues": len(self.leagues), "teams": len(self.teams), "fixtures": len(self.fixtures)}
+
+
+@dataclass
+class WarmResult:
+    standings: int = 0
+    fragments: int = 0
+    fixture_windows: int = 0
+    dropped_teams: int = 0
+
+
+async def warm_caches(db: AsyncSession, changes: ChangeSet, *, client: aioredis.Redis | None = None) -> WarmResult:
+    """Rebuild the entries affected by ``changes``; call after the sync is committed.
+
+    Raises ``RedisError`` if Redis is unreachable.
+    """
+    result = WarmResult()
+    # The sync wrote with Core statements, which bypass the session's identity map
+    db.expire_all()
+
+    for league_id, season in sorted(changes.leagues):
+
+        async def compute(league_id: str = league_id, season: str = season) -> bytes:
+            return await build_standings_body(db, league_id, season)
+
+        await cache_refresh(standings_key(league_id, season), compute, client=client)
+        result.standings += 1
+
+    followed = await _followed(db, changes.teams)
+    now = datetime.now(UTC)
+    window_ttl = get_settings().team_fixtures_ttl_seconds
+    for chunk in chunks(followed, IN_CHUNK_SIZE):
+        fragments = await build_team_fragments(db, chunk, now)
+        windows = await build_team_fixture_windows(db, chunk, now)
+        items: dict[str, Any] = {team_fragment_key(t): f for t, f in fragments.items()}
+        ttls = {team_fragment_key(t): fragment_ttl(f, now) for t, f in fragments.items()}
+        for team_id, window in windows.items():
+            items[team_fixtures_key(team_id)] = window
+            ttls[team_fixtures_key(team_id)] = window_ttl
+        await cache_set_many(items, ttls, client=client)
+        result.fragments += len(fragments)
+        result.fixture_windows += len(windows)
+
+    dropped = changes.teams.difference(followed)
+    await cache_delete_many(
+        [key for t in sorted(dropped) for key in (team_fragment_key(t), team_fixtures_key(t))], client=client
+    )
+    result.dropped_teams = len(dropped)
+    return result
+
+
+async def _followed(db: AsyncSession, team_ids: set[str]) -> list[str]:
+    followed: set[str] = set()
+    for chunk in chunks(sorted(team_ids), IN_CHUNK_SIZE):
+        rows = await db.execute(select(Follow.team_id).where(Follow.team_id.in_(chunk)).distinct())
+        followed.update(rows.scalars())
+    return sorted(followed)
@@ -0,0 +1,273 @@
+"""Dashboard assembly from shared, per-team cache fragments.
+
+A fragment holds everything the dashboard shows about one team: the team, its
+latest standing and the fixtures either side of the time it was built. It is
+the same for every follower, so thousands of users following one club share
+one cache entry. The only per-user data is the follow list, cached under the
+user's ``dashboard:{user_id}`` generation (bumped on follow/unfollow).
+
+Sync rebuilds the fragments of teams whose fixtures or standing it changed
+(see ``cache_warmer``); the TTL is only a safety net, capped at the next
+kickoff so "next" never turns into "last" inside a cached fragment. Fragments
+of a popular team still expire under many readers at once, so misses are built
+under per-team recompute locks.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import random
+from collections.abc import Iterable, Sequence
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import orjson
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+from sqlalchemy import func, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.db.models import Fixture, Follow, Standing, Team
+from app.schemas.standings import FixtureBrief, StandingOut
+from app.schemas.teams import TeamOut
+from app.services.cache import (
+    cache_get,
+    cache_get_many,
+    cache_lock_many,
+    cache_set,
+    cache_set_many,
+    cache_unlock_many,
+    cache_wait_many,
+    versioned_key,
+)
+
+log = get_logger("dashboard")
+
+DASHBOARD_MAX_DAYS_BACK = 30
+DASHBOARD_MAX_DAYS_FORWARD = 60
+# Spreads the expiry of fragments whose teams kick off at the same time
+FRAGMENT_KICKOFF_JITTER_SECONDS = 60
+
+
+def team_fragment_key(team_id: str) -> str:
+    return f"dashboard:team:{team_id}"
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite drops tzinfo on read; Postgres returns aware datetimes
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
+
+
+def _brief(fixture: Fixture | None) -> dict[str, Any] | None:
+    return FixtureBrief.model_validate(fixture).model_dump(mode="json") if fixture else None
+
+
+def _kickoff(fixture: Fixture | None) -> float | None:
+    return _as_utc(fixture.start_time).timestamp() if fixture else None
+
+
+# ── Fragments ─────────────────────────────────────────────────────────────────
+
+
+async def build_team_fragments(db: AsyncSession, team_ids: Sequence[str], now: datetime) -> dict[str, dict[str, Any]]:
+    """Fragments of ``team_ids`` read from the DB; unknown teams are left out.
+
+    Three queries whatever the number of teams: the teams, their latest
+    standings and their last/next fixtures (both ranked with window functions).
+    """
+    teams = (await db.execute(select(Team).where(Team.id.in_(team_ids)))).scalars().all()
+    if not teams:
+        return {}
+    standings = await _latest_standings(db, team_ids)
+    last, upcoming = await _neighbouring_fixtures(db, team_ids, now)
+    return {
+        team.id: {
+            "team": TeamOut.model_validate(team).model_dump(mode="json"),
+            "standing": StandingOut.model_validate(s).model_dump(mode="json")
+            if (s := standings.get(team.id))
+            else None,
+            "last_fixture": _brief(last.get(team.id)),
+            "last_kickoff": _kickoff(last.get(team.id)),
+            "next_fixture": _brief(upcoming.get(team.id)),
+            "next_kickoff": _kickoff(upcoming.get(team.id)),
+        }
+        for team in teams
+    }
+
+
+async def _latest_standings(db: AsyncSession, team_ids: Sequence[str]) -> dict[str, Standing]:
+    """Each team's row of its most recent season (the latest updated one if it sits in several tables)."""
+    ranked = (
+        select(
+            Standing.league_id,
+            Standing.season,
+            Standing.team_id,
+            func.row_number()
+            .over(partition_by=Standing.team_id, order_by=(Standing.season.desc(), Standing.updated_at.desc()))
+            .label("recency"),
+        )
+        .where(Standing.team_id.in_(team_ids))
+        .subquery()
+    )
+    result = await db.execute(
+        select(Standing).join(
+            ranked,
+            (Standing.league_id == ranked.c.league_id)
+            & (Standing.season == ranked.c.season)
+            & (Standing.team_id == ranked.c.team_id)
+            & (ranked.c.recency == 1),
+        )
+    )
+    # Standing.team resolves from the identity map: the teams are already loaded
+    return {standing.team_id: standing for standing in result.scalars()}
+
+
+async def _neighbouring_fixtures(
+    db: AsyncSession, team_ids: Sequence[str], now: datetime
+) -> tuple[dict[str, Fixture], dict[str, Fixture]]:
+    """Each team's latest fixture before ``now`` and earliest one from ``now`` on."""
+    sides = union_all(
+        select(Fixture.id.label("fixture_id"), Fixture.home_team_id.label("team_id"), Fixture.start_time).where(
+            Fixture.home_team_id.in_(team_ids)
+        ),
+        select(Fixture.id, Fixture.away_team_id, Fixture.start_time).where(Fixture.away_team_id.in_(team_ids)),
+    ).subquery()
+    played = sides.c.start_time < now
+    ranked = select(
+        sides.c.fixture_id,
+        sides.c.team_id,
+        played.label("played"),
+        func.row_number()
+        .over(partition_by=(sides.c.team_id, played), order_by=sides.c.start_time.desc())
+        .label("newest"),
+        func.row_number().over(partition_by=(sides.c.team_id, played), order_by=sides.c.start_time).label("oldest"),
+    ).subquery()
+    result = await db.execute(
+        select(ranked.c.team_id, ranked.c.played, Fixture)
+        .join(Fixture, Fixture.id == ranked.c.fixture_id)
+        .where((ranked.c.played & (ranked.c.newest == 1)) | (~ranked.c.played & (ranked.c.oldest == 1)))
+        .options(joinedload(Fixture.home_team), joinedload(Fixture.away_team))
+    )
+    last: dict[str, Fixture] = {}
+    upcoming: dict[str, Fixture] = {}
+    for team_id, was_played, fixture in result.unique().tuples():
+        (last if was_played else upcoming)[team_id] = fixture
+    return last, upcoming
+
+
+def fragment_ttl(fragment: dict[str, Any], now: datetime) -> int:
+    ttl = get_settings().dashboard_fragment_ttl_seconds
+    if fragment["next_kickoff"] is not None:
+        jitter = random.uniform(0, FRAGMENT_KICKOFF_JITTER_SECONDS)  # noqa: S311
+        ttl = min(ttl, int(fragment["next_kickoff"] - now.timestamp() - jitter))
+    return max(ttl, 1)
+
+
+async def get_team_fragments(
+    db: AsyncSession, team_ids: Sequence[str], *, client: aioredis.Redis | None = None
+) -> dict[str, dict[str, Any]]:
+    """Fragments from one batched cache read.
+
+    The caller builds the misses whose lock it takes, in one go, and waits for
+    the others; whatever their holders fail to deliver it builds too.
+    """
+    cached = await cache_get_many([team_fragment_key(t) for t in team_ids], client=client)
+    fragments = {t: cached[key] for t in team_ids if (key := team_fragment_key(t)) in cached}
+    missing = [t for t in team_ids if t not in fragments]
+    if not missing:
+        return fragments
+    tokens = await cache_lock_many([team_fragment_key(t) for t in missing], client=client)
+    try:
+        fragments |= await _build_and_cache(db, [t for t in missing if team_fragment_key(t) in tokens], client)
+    finally:
+        # Otherwise the locks just expire after RECOMPUTE_LOCK_MS
+        with contextlib.suppress(RedisError):
+            await cache_unlock_many(tokens, client=client)
+    locked = [t for t in missing if team_fragment_key(t) not in tokens]
+    if locked:
+        arrived = await cache_wait_many([team_fragment_key(t) for t in locked], client=client)
+        fragments |= {t: arrived[key] for t in locked if (key := team_fragment_key(t)) in arrived}
+        fragments |= await _build_and_cache(db, [t for t in locked if t not in fragments], client)
+    return fragments
+
+
+async def _build_and_cache(
+    db: AsyncSession, team_ids: Sequence[str], client: aioredis.Redis | None
+) -> dict[str, dict[str, Any]]:
+    if not team_ids:
+        return {}
+    now = datetime.now(UTC)
+    built = await build_team_fragments(db, team_ids, now)
+    try:
+        await cache_set_many(
+            {team_fragment_key(t): f for t, f in built.items()},
+            {team_fragment_key(t): fragment_ttl(f, now) for t, f in built.items()},
+            client=client,
+        )
+    except RedisError as exc:
+        log.warning("Dashboard fragments not cached", teams=len(built), error=str(exc))
+    return built
+
+
+# ── Per-user composition ──────────────────────────────────────────────────────
+
+
+async def _query_followed_team_ids(db: AsyncSession, user_id: str) -> list[str]:
+    result = await db.execute(select(Follow.team_id).where(Follow.user_id == user_id).order_by(Follow.created_at))
+    return list(result.scalars())
+
+
+async def followed_team_ids(db: AsyncSession, user_id: str, *, client: aioredis.Redis | None = None) -> list[str]:
+    key = await versioned_key(f"dashboard:{user_id}", "follows", client=client)
+    team_ids: list[str] | None = await cache_get(key, client=client)
+    if team_ids is None:
+        team_ids = await _query_followed_team_ids(db, user_id)
+        await cache_set(key, team_ids, client=client)
+    return team_ids
+
+
+def compose_dashboard(fragments: Iterable[dict[str, Any]], now: datetime, days_back: int, days_forward: int) -> bytes:
+    """Serialize the dashboard entries (``list[DashboardTeamEntry]``) for one request window."""
+    now_ts = now.timestamp()
+    earliest = (now - timedelta(days=days_back)).timestamp()
+    latest = (now + timedelta(days=days_forward)).timestamp()
+    entries = []
+    for fragment in fragments:
+        last, last_kickoff = fragment["last_fixture"], fragment["last_kickoff"]
+        upcoming, next_kickoff = fragment["next_fixture"], fragment["next_kickoff"]
+        if next_kickoff is not None and next_kickoff <= now_ts:
+            # Kicked off since the fragment was built (it expires by kickoff, but L1 may lag)
+            last, last_kickoff, upcoming = upcoming, next_kickoff, None
+        entries.append(
+            {
+                "team": fragment["team"],
+                "standing": fragment["standing"],
+                "next_fixture": upcoming if upcoming is not None and next_kickoff <= latest else None,
+                "last_fixture": last if last is not None and last_kickoff >= earliest else None,
+            }
+        )
+    return orjson.dumps(entries)
+
+
+async def dashboard_body(
+    db: AsyncSession,
+    user_id: str,
+    days_back: int,
+    days_forward: int,
+    *,
+    client: aioredis.Redis | None = None,
+) -> bytes:
+    """JSON body of ``GET /me/dashboard``; built straight from the DB if Redis is down."""
+    try:
+        team_ids = await followed_team_ids(db, user_id, client=client)
+        fragments = await get_team_fragments(db, team_ids, client=client)
+    except RedisError as exc:
+        log.warning("Cache unavailable, building dashboard uncached", error=str(exc))
+        team_ids = await _query_followed_team_ids(db, user_id)
+        fragments = await build_team_fragments(db, team_ids, datetime.now(UTC))
+    return compose_dashboard(
+        (fragments[t] for t in team_ids if t in fragments), datetime.now(UTC), days_back, days_forward
+    )
@@ -4,10 +4,38 @@ from __future__ import annotations
 
 from functools import lru_cache
 
-from app.core.config import ProviderName, get_settings
+from app.core.config import ProviderName, Settings, get_settings
 from app.services.api_football import ApiFootballProvider
 from app.services.mock_provider import MockProvider
 from app.services.provider import FootballProvider
+from app.services.provider_cache import CachedProvider, RedisResponseStore
+from app.services.provider_quota import QuotaLimits, QuotaScheduler
+from app.services.provider_resilience import ResilientProvider
+from app.services.provider_singleflight import CoalescingProvider
+from app.services.synthetic_provider import SyntheticConfig, SyntheticProvider
+
+
+def _wrap(provider: FootballProvider, settings: Settings) -> FootballProvider:
+    """Resilience → coalescing → response cache, innermost first."""
+    provider = ResilientProvider(
+        provider,
+        attempts=settings.provider_retry_attempts,
+        failure_threshold=settings.provider_breaker_failure_threshold,
+        reset_seconds=settings.provider_breaker_reset_seconds,
+        fallback_store=RedisResponseStore(),
+        fallback_ttl=settings.provider_fallback_ttl_seconds,
+    )
+    # Coalesce inside the cache, so concurrent cache misses share one upstream call
+    provider = CoalescingProvider(
+        provider,
+        distributed=settings.provider_coalesce_distributed,
+        lock_ms=settings.provider_coalesce_lock_ms,
+    )
+    if settings.provider_cache_enabled:
+        provider = CachedProvider(
+            provider, RedisResponseStore(), ttls={"get_standings": settings.provider_cache_standings_ttl_seconds}
+        )
+    return provider
 
 
 @lru_cache(maxsize=1)
@@ -15,9 +43,35 @@ def get_provider() -> FootballProvider:
     settings = get_settings()
     effective = settings.effective_provider
     if effective == ProviderName.api_football:
-        return ApiFootballProvider(
+        api_football = ApiFootballProvider(
             api_key=settings.provider_api_key,
             base_url=settings.provider_base_url or "https://v3.football.api-sports.io",
+            timeout=settings.provider_timeout_seconds,
+            max_connections=settings.provider_max_connections,
+            max_keepalive_connections=settings.provider_max_keepalive_connections,
+            keepalive_expiry=settings.provider_keepalive_expiry_seconds,
+            http2=settings.provider_http2,
+            parse_offload_bytes=settings.provider_parse_offload_bytes,
+            validator_store=RedisResponseStore() if settings.provider_cache_enabled else None,
+            quota=QuotaScheduler(QuotaLimits(settings.provider_quota_per_minute, settings.provider_quota_per_day))
+            if settings.provider_quota_enabled
+            else None,
+        )
+        return _wrap(api_football, settings)
+    if effective == ProviderName.synthetic:
+        # Same wrappers as production, so injected latency and errors exercise them
+        synthetic = SyntheticProvider(
+            SyntheticConfig(
+                leagues=settings.synthetic_leagues,
+                teams_per_league=settings.synthetic_teams_per_league,
+                seasons=settings.synthetic_seasons,
+                live_matches=settings.synthetic_live_matches,
+                events_per_minute=settings.synthetic_events_per_minute,
+                latency_ms=settings.synthetic_latency_ms,
+                error_rate=settings.synthetic_error_rate,
+                seed=settings.synthetic_seed,
+            )
         )
+        return _wrap(synthetic, settings)
     # mock (default) or any unimplemented provider
     return MockProvider()
@@ -0,0 +1,107 @@
+"""Per-sync-run identity map: provider ids → row ids for leagues, teams and fixtures."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Any, TypeVar
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import Fixture, League, Team
+
+T = TypeVar("T")
+
+# Keeps IN (...) lists well under the bind-parameter limits of Postgres and SQLite.
+IN_CHUNK_SIZE = 1000
+
+
+def chunks(items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+class Kind(StrEnum):
+    league = "league"
+    team = "team"
+    fixture = "fixture"
+
+
+_COLUMNS: dict[Kind, tuple[Any, Any]] = {
+    Kind.league: (League.provider_league_id, League.id),
+    Kind.team: (Team.provider_team_id, Team.id),
+    Kind.fixture: (Fixture.provider_fixture_id, Fixture.id),
+}
+
+
+@dataclass
+class ResolverStats:
+    hits: int = 0
+    misses: int = 0
+    queries: int = 0
+
+
+class IdResolver:
+    """Resolves provider ids to row ids, loading each key from the DB at most once per run.
+
+    Lookups are served from memory; only keys that are not yet known are fetched,
+    in ``IN (...)`` batches. Rows created during the run are registered with
+    :meth:`remember` so later lookups never hit the DB for them. A key that does
+    not exist is re-queried on the next lookup, since it may be created later in
+    the same run (e.g. ``sync_teams`` before ``sync_fixtures``).
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+        self._maps: dict[Kind, dict[str, str]] = {kind: {} for kind in Kind}
+        self.stats: dict[Kind, ResolverStats] = {kind: ResolverStats() for kind in Kind}
+
+    async def resolve(self, kind: Kind, provider_ids: Iterable[str]) -> dict[str, str]:
+        """Return ``provider_id -> row id`` for every key that exists."""
+        known = self._maps[kind]
+        stats = self.stats[kind]
+        wanted = set(provider_ids)
+        missing = sorted(wanted - known.keys())
+        stats.hits += len(wanted) - len(missing)
+        stats.misses += len(missing)
+
+        provider_col, id_col = _COLUMNS[kind]
+        for chunk in chunks(missing, IN_CHUNK_SIZE):
+            rows = await self.session.execute(select(provider_col, id_col).where(provider_col.in_(chunk)))
+            known.update(rows.tuples().all())
+            stats.queries += 1
+        return {pid: known[pid] for pid in wanted if pid in known}
+
+    async def resolve_one(self, kind: Kind, provider_id: str) -> str | None:
+        return (await self.resolve(kind, (provider_id,))).get(provider_id)
+
+    async def leagues(self, provider_ids: Iterable[str]) -> dict[str, str]:
+        return await self.resolve(Kind.league, provider_ids)
+
+    async def teams(self, provider_ids: Iterable[str]) -> dict[str, str]:
+        return await self.resolve(Kind.team, provider_ids)
+
+    async def fixtures(self, provider_ids: Iterable[str]) -> dict[str, str]:
+        return await self.resolve(Kind.fixture, provider_ids)
+
+    async def load_rows(self, kind: Kind, provider_ids: Iterable[str]) -> dict[str, Any]:
+        """Load full ORM rows keyed by provider id (for in-place updates), registering their ids."""
+        provider_col, _ = _COLUMNS[kind]
+        model = provider_col.class_
+        rows: dict[str, Any] = {}
+        for chunk in chunks(sorted(set(provider_ids)), IN_CHUNK_SIZE):
+            result = await self.session.execute(select(model).where(provider_col.in_(chunk)))
+            for row in result.scalars():
+                rows[getattr(row, provider_col.key)] = row
+            self.stats[kind].queries += 1
+        self._maps[kind].update({pid: row.id for pid, row in rows.items()})
+        return rows
+
+    def remember(self, kind: Kind, provider_id: str, row_id: str) -> None:
+        """Register a row created (or loaded) outside the resolver."""
+        self._maps[kind][provider_id] = row_id
+
+    def summary(self) -> dict[str, dict[str, int]]:
+        return {kind.value: vars(stats).copy() for kind, stats in self.stats.items()}
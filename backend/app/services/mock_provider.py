@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from datetime import UTC, datetime, timedelta
 from typing import ClassVar
 
 from app.services.provider import (
+    LIVE_STATUSES,
     FootballProvider,
     ProviderEvent,
     ProviderFixture,
     ProviderLeague,
+    ProviderLiveFixture,
     ProviderStanding,
     ProviderTeam,
 )
@@ -34,17 +37,23 @@ class MockProvider(FootballProvider):
         ProviderTeam("mock-530", "Atletico Madrid", "ATM", "Spain", None, "mock-140"),
     ]
 
-    def _fixtures_for_team(self, team_id: str) -> list[ProviderFixture]:
+    def _all_fixtures(self) -> list[ProviderFixture]:
         yesterday = (_NOW - timedelta(days=1)).replace(hour=15, minute=0, second=0, microsecond=0)
         tomorrow = (_NOW + timedelta(days=1)).replace(hour=17, minute=30, second=0, microsecond=0)
         next_week = (_NOW + timedelta(days=7)).replace(hour=21, minute=0, second=0, microsecond=0)
+        kicked_off = (_NOW - timedelta(minutes=55)).replace(second=0, microsecond=0)
 
-        all_fixtures = [
+        return [
             ProviderFixture("mock-fix-1001", "mock-39", "2024", "mock-50", "mock-40", yesterday, "FT", 2, 1),
             ProviderFixture("mock-fix-1002", "mock-39", "2024", "mock-42", "mock-50", tomorrow, "NS"),
             ProviderFixture("mock-fix-1003", "mock-140", "2024", "mock-541", "mock-529", next_week, "NS"),
+            ProviderFixture("mock-fix-1004", "mock-140", "2024", "mock-530", "mock-541", kicked_off, "2H", 1, 0),
+        ]
+
+    def _fixtures_for_team(self, team_id: str) -> list[ProviderFixture]:
+        return [
+            f for f in self._all_fixtures() if f.home_team_provider_id == team_id or f.away_team_provider_id == team_id
         ]
-        return [f for f in all_fixtures if f.home_team_provider_id == team_id or f.away_team_provider_id == team_id]
 
     async def get_leagues(self, country: str | None = None, season: str | None = None) -> list[ProviderLeague]:
         leagues = self.LEAGUES
@@ -67,6 +76,29 @@ class MockProvider(FootballProvider):
     ) -> list[ProviderFixture]:
         return [f for f in self._fixtures_for_team(team_provider_id) if from_date <= f.start_time <= to_date]
 
+    async def get_league_fixtures(
+        self, league_provider_id: str, season: str, from_date: datetime, to_date: datetime
+    ) -> list[ProviderFixture]:
+        return [
+            f
+            for f in self._all_fixtures()
+            if f.league_provider_id == league_provider_id
+            and f.season == season
+            and from_date <= f.start_time <= to_date
+        ]
+
+    async def get_fixtures_by_ids(self, fixture_provider_ids: Sequence[str]) -> list[ProviderFixture]:
+        wanted = set(fixture_provider_ids)
+        return [f for f in self._all_fixtures() if f.provider_id in wanted]
+
+    async def get_live_fixtures(self, league_provider_ids: Sequence[str] | None = None) -> list[ProviderLiveFixture]:
+        return [
+            ProviderLiveFixture(f, await self.get_events(f.provider_id))
+            for f in self._all_fixtures()
+            if f.status in LIVE_STATUSES
+            and (league_provider_ids is None or f.league_provider_id in league_provider_ids)
+        ]
+
     async def get_events(self, fixture_provider_id: str) -> list[ProviderEvent]:
         if fixture_provider_id == "mock-fix-1001":
             return [
@@ -74,6 +106,11 @@ class MockProvider(FootballProvider):
                 ProviderEvent("mock-fix-1001", "goal", 58, "mock-50", "De Bruyne"),
                 ProviderEvent("mock-fix-1001", "goal", 71, "mock-40", "Salah"),
             ]
+        if fixture_provider_id == "mock-fix-1004":
+            return [
+                ProviderEvent("mock-fix-1004", "goal", 38, "mock-530", "Griezmann", {"detail": "Normal Goal"}),
+                ProviderEvent("mock-fix-1004", "card", 49, "mock-541", "Vinicius Jr", {"detail": "Yellow Card"}),
+            ]
         return []
 
     async def get_standings(self, league_provider_id: str, season: str) -> list[ProviderStanding]:
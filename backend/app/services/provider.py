@@ -3,11 +3,18 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Any, TypeVar
 
+R = TypeVar("R")
 
-@dataclass
+# Short status codes of a fixture that is in play (API-Football vocabulary).
+LIVE_STATUSES = frozenset({"1H", "HT", "2H", "ET", "BT", "P", "SUSP", "INT", "LIVE"})
+
+
+@dataclass(slots=True)
 class ProviderLeague:
     provider_id: str
     name: str
@@ -16,7 +23,7 @@ class ProviderLeague:
     logo_url: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ProviderTeam:
     provider_id: str
     name: str
@@ -26,7 +33,7 @@ class ProviderTeam:
     league_provider_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ProviderFixture:
     provider_id: str
     league_provider_id: str
@@ -39,7 +46,7 @@ class ProviderFixture:
     away_score: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ProviderEvent:
     fixture_provider_id: str
     type: str
@@ -49,7 +56,15 @@ class ProviderEvent:
     payload: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
+class ProviderLiveFixture:
+    """A fixture in play together with its events, as of the same upstream response."""
+
+    fixture: ProviderFixture
+    events: list[ProviderEvent] = field(default_factory=list)
+
+
+@dataclass(slots=True)
 class ProviderStanding:
     league_provider_id: str
     season: str
@@ -68,6 +83,11 @@ class ProviderStanding:
 class FootballProvider(ABC):
     """Abstract interface for any football data provider."""
 
+    @property
+    def name(self) -> str:
+        """Namespace of this provider's entries in shared stores (response cache, locks...)."""
+        return type(self).__name__
+
     @abstractmethod
     async def get_leagues(self, country: str | None = None, season: str | None = None) -> list[ProviderLeague]: ...
 
@@ -82,8 +102,111 @@ class FootballProvider(ABC):
         self, team_provider_id: str, from_date: datetime, to_date: datetime
     ) -> list[ProviderFixture]: ...
 
+    @abstractmethod
+    async def get_league_fixtures(
+        self, league_provider_id: str, season: str, from_date: datetime, to_date: datetime
+    ) -> list[ProviderFixture]:
+        """All fixtures of one league season in a date window (one upstream call per league)."""
+        ...
+
+    @abstractmethod
+    async def get_fixtures_by_ids(self, fixture_provider_ids: Sequence[str]) -> list[ProviderFixture]:
+        """Specific fixtures by provider id; unknown ids are left out of the result."""
+        ...
+
+    @abstractmethod
+    async def get_live_fixtures(self, league_provider_ids: Sequence[str] | None = None) -> list[ProviderLiveFixture]:
+        """Every fixture in play (optionally only in these leagues) with its events, in one upstream call."""
+        ...
+
     @abstractmethod
     async def get_events(self, fixture_provider_id: str) -> list[ProviderEvent]: ...
 
     @abstractmethod
     async def get_standings(self, league_provider_id: str, season: str) -> list[ProviderStanding]: ...
+
+    async def aclose(self) -> None:
+        """Release pooled connections. Providers without network resources keep this no-op."""
+        return None
+
+    def stats(self) -> dict[str, Any]:
+        """Counters exposed by this provider (and any providers it wraps)."""
+        return {}
+
+
+class ProviderWrapper(FootballProvider):
+    """Base for adapters that decorate another provider (caching, coalescing, ...).
+
+    Every interface method is routed through :meth:`_call` with the endpoint name,
+    its arguments and a thunk that performs the call on the wrapped provider, so a
+    subclass only overrides ``_call``. Wrappers nest freely.
+    """
+
+    def __init__(self, inner: FootballProvider) -> None:
+        self.inner = inner
+
+    @property
+    def name(self) -> str:
+        """The wrapped provider's name, so keys don't depend on how wrappers are stacked."""
+        return self.inner.name
+
+    async def _call(self, endpoint: str, args: tuple[Any, ...], fetch: Callable[[], Awaitable[R]]) -> R:
+        return await fetch()
+
+    async def get_leagues(self, country: str | None = None, season: str | None = None) -> list[ProviderLeague]:
+        return await self._call(
+            "get_leagues", (country, season), lambda: self.inner.get_leagues(country=country, season=season)
+        )
+
+    async def get_teams(self, league_provider_id: str) -> list[ProviderTeam]:
+        return await self._call("get_teams", (league_provider_id,), lambda: self.inner.get_teams(league_provider_id))
+
+    async def search_teams(self, query: str, limit: int = 10) -> list[ProviderTeam]:
+        return await self._call("search_teams", (query, limit), lambda: self.inner.search_teams(query, limit))
+
+    async def get_fixtures(
+        self, team_provider_id: str, from_date: datetime, to_date: datetime
+    ) -> list[ProviderFixture]:
+        return await self._call(
+            "get_fixtures",
+            (team_provider_id, from_date, to_date),
+            lambda: self.inner.get_fixtures(team_provider_id, from_date, to_date),
+        )
+
+    async def get_league_fixtures(
+        self, league_provider_id: str, season: str, from_date: datetime, to_date: datetime
+    ) -> list[ProviderFixture]:
+        return await self._call(
+            "get_league_fixtures",
+            (league_provider_id, season, from_date, to_date),
+            lambda: self.inner.get_league_fixtures(league_provider_id, season, from_date, to_date),
+        )
+
+    async def get_fixtures_by_ids(self, fixture_provider_ids: Sequence[str]) -> list[ProviderFixture]:
+        return await self._call(
+            "get_fixtures_by_ids",
+            (tuple(sorted(fixture_provider_ids)),),
+            lambda: self.inner.get_fixtures_by_ids(fixture_provider_ids),
+        )
+
+    async def get_live_fixtures(self, league_provider_ids: Sequence[str] | None = None) -> list[ProviderLiveFixture]:
+        leagues = tuple(sorted(league_provider_ids)) if league_provider_ids is not None else None
+        return await self._call(
+            "get_live_fixtures", (leagues,), lambda: self.inner.get_live_fixtures(league_provider_ids)
+        )
+
+    async def get_events(self, fixture_provider_id: str) -> list[ProviderEvent]:
+        return await self._call(
+            "get_events", (fixture_provider_id,), lambda: self.inner.get_events(fixture_provider_id)
+        )
+
+    async def get_standings(self, league_provider_id: str, season: str) -> list[ProviderStanding]:
+        return await self._call(
+            "get_standings", (league_provider_id, season), lambda: self.inner.get_standings(league_provider_id, season)
+        )
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+    def stats(self) -> dict[str, Any]:
+        return self.inner.stats()
@@ -0,0 +1,183 @@
+"""Response cache around any FootballProvider, backed by Redis."""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, ClassVar, TypeVar
+
+import orjson
+import redis.asyncio as aioredis
+
+from app.core.logging import get_logger
+from app.services.cache import get_redis_pool
+from app.services.provider import (
+    FootballProvider,
+    ProviderEvent,
+    ProviderFixture,
+    ProviderLeague,
+    ProviderLiveFixture,
+    ProviderStanding,
+    ProviderTeam,
+    ProviderWrapper,
+)
+
+log = get_logger("provider_cache")
+R = TypeVar("R")
+
+_DTO_TYPES: dict[str, type[Any]] = {
+    "get_leagues": ProviderLeague,
+    "get_teams": ProviderTeam,
+    "search_teams": ProviderTeam,
+    "get_fixtures": ProviderFixture,
+    "get_league_fixtures": ProviderFixture,
+    "get_fixtures_by_ids": ProviderFixture,
+    "get_live_fixtures": ProviderLiveFixture,
+    "get_events": ProviderEvent,
+    "get_standings": ProviderStanding,
+}
+
+
+# ── Stores ────────────────────────────────────────────────────────────────────
+
+
+class ResponseStore(ABC):
+    """Minimal string key/value store with per-key expiry."""
+
+    @abstractmethod
+    async def get(self, key: str) -> str | None: ...
+
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl_seconds: int) -> None: ...
+
+
+class RedisResponseStore(ResponseStore):
+    """Shares the application's Redis connection pool."""
+
+    async def get(self, key: str) -> str | None:
+        async with aioredis.Redis(connection_pool=get_redis_pool()) as r:
+            value: str | None = await r.get(key)
+            return value
+
+    async def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        async with aioredis.Redis(connection_pool=get_redis_pool()) as r:
+            await r.set(key, value, ex=ttl_seconds)
+
+
+class MemoryResponseStore(ResponseStore):
+    """Process-local store; for tests and single-process tools such as benchmarks."""
+
+    def __init__(self) -> None:
+        self._data: dict[str, tuple[float, str]] = {}
+
+    async def get(self, key: str) -> str | None:
+        entry = self._data.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            self._data.pop(key, None)
+            return None
+        return entry[1]
+
+    async def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        self._data[key] = (time.monotonic() + ttl_seconds, value)
+
+
+# ── Cached provider ───────────────────────────────────────────────────────────
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    passthrough: int = 0  # endpoints that are not cached
+    errors: int = 0  # store failures; the call went upstream instead
+
+
+def cache_key(provider: str, endpoint: str, args: tuple[Any, ...]) -> str:
+    """``provider:<name>:<endpoint>:<digest of args>``; datetimes hash by ISO form."""
+    raw = orjson.dumps([a.isoformat() if isinstance(a, datetime) else a for a in args])
+    return f"provider:{provider}:{endpoint}:{hashlib.blake2b(raw, digest_size=12).hexdigest()}"
+
+
+def encode_response(items: list[Any]) -> str:
+    return orjson.dumps([asdict(item) for item in items]).decode()
+
+
+def _decode_fixture(item: dict[str, Any]) -> ProviderFixture:
+    return ProviderFixture(**{**item, "start_time": datetime.fromisoformat(item["start_time"])})
+
+
+def decode_response(endpoint: str, raw: str) -> list[Any]:
+    dto = _DTO_TYPES[endpoint]
+    items = orjson.loads(raw)
+    if dto is ProviderFixture:
+        return [_decode_fixture(item) for item in items]
+    if dto is ProviderLiveFixture:
+        return [
+            ProviderLiveFixture(_decode_fixture(item["fixture"]), [ProviderEvent(**e) for e in item["events"]])
+            for item in items
+        ]
+    return [dto(**item) for item in items]
+
+
+class CachedProvider(ProviderWrapper):
+    """Serves slow-changing endpoints from a shared store with per-endpoint TTLs.
+
+    Fixtures and events default to a TTL of 0 (never cached) so scores stay live;
+    leagues, rosters and standings are reused across sync runs and API processes.
+    A failing store is logged and bypassed rather than failing the call.
+    """
+
+    TTLS: ClassVar[dict[str, int]] = {
+        "get_leagues": 24 * 3600,
+        "get_teams": 24 * 3600,
+        "search_teams": 3600,
+        "get_standings": 15 * 60,
+    }
+
+    def __init__(
+        self,
+        inner: FootballProvider,
+        store: ResponseStore | None = None,
+        ttls: dict[str, int] | None = None,
+    ) -> None:
+        super().__init__(inner)
+        self.store = store or RedisResponseStore()
+        self.ttls = {**self.TTLS, **(ttls or {})}
+        self.cache_stats = CacheStats()
+
+    async def _call(self, endpoint: str, args: tuple[Any, ...], fetch: Callable[[], Awaitable[R]]) -> R:
+        ttl = self.ttls.get(endpoint, 0)
+        if ttl <= 0:
+            self.cache_stats.passthrough += 1
+            return await fetch()
+
+        key = cache_key(self.name, endpoint, args)
+        try:
+            raw = await self.store.get(key)
+        except Exception as exc:
+            self.cache_stats.errors += 1
+            log.warning("Provider cache read failed", endpoint=endpoint, error=str(exc))
+            return await fetch()
+        if raw is not None:
+            self.cache_stats.hits += 1
+            cached: R = decode_response(endpoint, raw)  # type: ignore[assignment]
+            return cached
+
+        self.cache_stats.misses += 1
+        result = await fetch()
+        try:
+            await self.store.set(key, encode_response(result), ttl)  # type: ignore[arg-type]
+        except Exception as exc:
+            self.cache_stats.errors += 1
+            log.warning("Provider cache write failed", endpoint=endpoint, error=str(exc))
+        return result
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            **self.inner.stats(),
+            "cache": {**asdict(self.cache_stats), "saved_requests": self.cache_stats.hits},
+        }
@@ -0,0 +1,186 @@
+"""Record and replay upstream HTTP traffic for offline, repeatable benchmarks.
+
+``RecordingTransport`` sits under ``ApiFootballProvider``'s HTTP client and keeps
+every response it sees; ``ReplayTransport`` serves them back, sleeping for the
+recorded (optionally scaled) latency. Both work at the HTTP level, so replayed
+runs exercise the real JSON parsing with real payloads.
+
+A cassette is a zip archive: ``index.json`` maps each request key to its
+responses' status, headers and latency, and each body is a deflated member.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import time
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+
+import httpx
+import orjson
+
+from app.core.logging import get_logger
+
+log = get_logger("provider_cassette")
+
+# Response headers worth keeping: the parsers and the quota scheduler read these.
+RECORDED_HEADERS = frozenset(
+    {
+        "content-type",
+        "etag",
+        "last-modified",
+        "x-ratelimit-limit",
+        "x-ratelimit-remaining",
+        "x-ratelimit-requests-limit",
+        "x-ratelimit-requests-remaining",
+    }
+)
+_CONDITIONAL_HEADERS = ("if-none-match", "if-modified-since")
+
+
+class CassetteMissError(Exception):
+    """Raised on replay when the cassette holds no response for a request."""
+
+    def __init__(self, key: str) -> None:
+        super().__init__(f"no recorded response for {key}")
+        self.key = key
+
+
+@dataclass(slots=True)
+class Interaction:
+    status: int
+    headers: dict[str, str]
+    body: bytes
+    elapsed: float  # seconds from sending the request to the last body byte
+
+
+def request_key(request: httpx.Request) -> str:
+    """Method, path and sorted query; host and auth headers are not part of it."""
+    query = "&".join(f"{k}={v}" for k, v in sorted(request.url.params.multi_items()))
+    return f"{request.method} {request.url.path}?{query}"
+
+
+class Cassette:
+    """Responses grouped by request key, in the order they were recorded.
+
+    Replaying a key walks through its responses and then keeps returning the
+    last one, so a polled endpoint (e.g. the live feed) plays back as it evolved.
+    """
+
+    def __init__(self) -> None:
+        self._interactions: dict[str, list[Interaction]] = {}
+        self._cursor: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return sum(len(v) for v in self._interactions.values())
+
+    def keys(self) -> list[str]:
+        return list(self._interactions)
+
+    def record(self, key: str, interaction: Interaction) -> None:
+        self._interactions.setdefault(key, []).append(interaction)
+
+    def next(self, key: str) -> Interaction | None:
+        recorded = self._interactions.get(key)
+        if not recorded:
+            return None
+        i = self._cursor.get(key, 0)
+        self._cursor[key] = min(i + 1, len(recorded) - 1)
+        return recorded[i]
+
+    def rewind(self) -> None:
+        self._cursor.clear()
+
+    def save(self, path: str | Path) -> None:
+        """Write atomically, so an interrupted recording never leaves a truncated cassette."""
+        path = Path(path)
+        tmp = path.with_name(path.name + ".tmp")
+        index: dict[str, list[dict[str, object]]] = {}
+        with zipfile.ZipFile(tmp, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=9) as zf:
+            for key, recorded in self._interactions.items():
+                digest = hashlib.blake2b(key.encode(), digest_size=10).hexdigest()
+                entries = index[key] = []
+                for n, it in enumerate(recorded):
+                    member = f"bodies/{digest}-{n}"
+                    zf.writestr(member, it.body)
+                    entries.append(
+                        {"member": member, "status": it.status, "headers": it.headers, "elapsed": it.elapsed}
+                    )
+            zf.writestr("index.json", orjson.dumps(index, option=orjson.OPT_INDENT_2))
+        os.replace(tmp, path)
+        log.info("Cassette saved", path=str(path), requests=len(index), responses=len(self))
+
+    @classmethod
+    def load(cls, path: str | Path) -> Cassette:
+        cassette = cls()
+        with zipfile.ZipFile(path) as zf:
+            index = orjson.loads(zf.read("index.json"))
+            for key, entries in index.items():
+                for e in entries:
+                    cassette.record(key, Interaction(e["status"], e["headers"], zf.read(e["member"]), e["elapsed"]))
+        return cassette
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Forwards to ``inner`` and records each response into ``cassette``.
+
+    Conditional request headers are dropped so every recording carries a full
+    body, whatever validator store the provider was built with. Without an
+    ``inner``, the transport makes its own HTTP pool; closing it (as the provider's
+    ``aclose`` does) releases that pool, and the next request opens a new one.
+    A passed-in ``inner`` belongs to the caller and is left open.
+    """
+
+    def __init__(self, cassette: Cassette, inner: httpx.AsyncBaseTransport | None = None) -> None:
+        self.cassette = cassette
+        self.inner = inner
+        self._pool: httpx.AsyncHTTPTransport | None = None
+
+    def _transport(self) -> httpx.AsyncBaseTransport:
+        if self.inner is not None:
+            return self.inner
+        if self._pool is None:
+            self._pool = httpx.AsyncHTTPTransport()
+        return self._pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        for name in _CONDITIONAL_HEADERS:
+            request.headers.pop(name, None)
+        start = time.perf_counter()
+        response = await self._transport().handle_async_request(request)
+        try:
+            body = await response.aread()
+        finally:
+            await response.aclose()
+        headers = {k: v for k, v in response.headers.items() if k.lower() in RECORDED_HEADERS}
+        self.cassette.record(
+            request_key(request), Interaction(response.status_code, headers, body, time.perf_counter() - start)
+        )
+        return httpx.Response(response.status_code, headers=headers, content=body, request=request)
+
+    async def aclose(self) -> None:
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            await pool.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """Serves recorded responses; ``latency_scale`` multiplies each recorded delay (0 disables it)."""
+
+    def __init__(self, cassette: Cassette, latency_scale: float = 1.0) -> None:
+        self.cassette = cassette
+        self.latency_scale = latency_scale
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = request_key(request)
+        interaction = self.cassette.next(key)
+        if interaction is None:
+            raise CassetteMissError(key)
+        if self.latency_scale > 0:
+            await asyncio.sleep(interaction.elapsed * self.latency_scale)
+        return httpx.Response(
+            interaction.status, headers=interaction.headers, content=interaction.body, request=request
+        )
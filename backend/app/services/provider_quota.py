@@ -0,0 +1,325 @@
+"""Distributed request budget for upstream provider calls.
+
+Every API and worker process draws from the same two buckets in Redis: a
+per-minute token bucket and a per-day counter that resets at 00:00 UTC, the
+window API-Football uses. Lower priorities cannot spend the last slice of
+either budget, so a burst of standings syncs never starves live events.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from enum import IntEnum
+from typing import Any
+
+import redis.asyncio as aioredis
+
+from app.core.logging import get_logger
+from app.services.cache import get_redis_pool
+
+log = get_logger("provider_quota")
+
+
+class Priority(IntEnum):
+    """Lower value = more important."""
+
+    live = 0  # in-play events
+    interactive = 1  # user-facing fallbacks, e.g. team search
+    fixtures = 2
+    background = 3  # standings, leagues, rosters
+
+
+# Share of each budget a priority must leave untouched for the ones above it.
+RESERVES: dict[Priority, float] = {
+    Priority.live: 0.0,
+    Priority.interactive: 0.05,
+    Priority.fixtures: 0.10,
+    Priority.background: 0.25,
+}
+
+# How long a caller will queue for a per-minute token before giving up.
+MAX_WAIT_SECONDS: dict[Priority, float] = {
+    Priority.live: 2.0,
+    Priority.interactive: 1.0,
+    Priority.fixtures: 30.0,
+    Priority.background: 60.0,
+}
+
+
+class QuotaExhaustedError(Exception):
+    """Raised when a call cannot be scheduled within the budget for its priority."""
+
+    def __init__(self, priority: Priority, reason: str) -> None:
+        super().__init__(f"provider quota exhausted for {priority.name} calls: {reason}")
+        self.priority = priority
+        self.reason = reason
+
+
+@dataclass
+class Grant:
+    granted: bool
+    wait_seconds: float = 0.0  # when not granted: time until a minute token frees up
+    day_exhausted: bool = False
+    minute_remaining: float = 0.0
+    day_remaining: int = 0
+
+
+@dataclass
+class QuotaLimits:
+    per_minute: int
+    per_day: int
+
+
+@dataclass
+class UpstreamQuota:
+    """Quota as last reported by the upstream response headers."""
+
+    minute_limit: int | None = None
+    minute_remaining: int | None = None
+    day_limit: int | None = None
+    day_remaining: int | None = None
+
+
+def parse_quota_headers(headers: Mapping[str, str]) -> UpstreamQuota:
+    """Read API-Football's rate-limit headers (missing or malformed values are ignored)."""
+
+    def _int(name: str) -> int | None:
+        try:
+            return int(headers[name])
+        except (KeyError, ValueError):
+            return None
+
+    return UpstreamQuota(
+        minute_limit=_int("x-ratelimit-limit"),
+        minute_remaining=_int("x-ratelimit-remaining"),
+        day_limit=_int("x-ratelimit-requests-limit"),
+        day_remaining=_int("x-ratelimit-requests-remaining"),
+    )
+
+
+def _day_key(now: float) -> str:
+    return datetime.fromtimestamp(now, UTC).strftime("%Y%m%d")
+
+
+def _seconds_to_midnight(now: float) -> int:
+    return 86400 - int(now) % 86400
+
+
+# ── Buckets ───────────────────────────────────────────────────────────────────
+
+
+class QuotaBackend(ABC):
+    @abstractmethod
+    async def take(self, limits: QuotaLimits, reserve: float, now: float) -> Grant: ...
+
+    @abstractmethod
+    async def observe(self, upstream: UpstreamQuota, limits: QuotaLimits, now: float) -> None:
+        """Pull the local view down to what the upstream says is left."""
+
+
+# KEYS: minute bucket hash, day counter.
+# ARGV: now, per_minute, per_day, minute reserve, day reserve, seconds to midnight.
+_TAKE_SCRIPT = """
+local now = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local day_limit = tonumber(ARGV[3])
+local minute_reserve = tonumber(ARGV[4])
+local day_reserve = tonumber(ARGV[5])
+local rate = capacity / 60.0
+
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local used = tonumber(redis.call('GET', KEYS[2]) or '0')
+
+if day_limit - used <= day_reserve then
+  return {0, '0', 1, tostring(tokens), day_limit - used}
+end
+if tokens - minute_reserve < 1 then
+  redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+  redis.call('EXPIRE', KEYS[1], 120)
+  return {0, tostring((1 + minute_reserve - tokens) / rate), 0, tostring(tokens), day_limit - used}
+end
+tokens = tokens - 1
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], 120)
+used = redis.call('INCR', KEYS[2])
+redis.call('EXPIRE', KEYS[2], tonumber(ARGV[6]) + 3600)
+return {1, '0', 0, tostring(tokens), day_limit - used}
+"""
+
+# KEYS: minute bucket hash, day counter. ARGV: now, minute remaining, day used, seconds to midnight.
+# Either value may be -1 (header absent). Only ever lowers the budget.
+_OBSERVE_SCRIPT = """
+local minute_remaining = tonumber(ARGV[2])
+if minute_remaining >= 0 then
+  local tokens = tonumber(redis.call('HGET', KEYS[1], 'tokens'))
+  if tokens == nil or tokens > minute_remaining then
+    redis.call('HSET', KEYS[1], 'tokens', minute_remaining, 'ts', ARGV[1])
+    redis.call('EXPIRE', KEYS[1], 120)
+  end
+end
+local day_used = tonumber(ARGV[3])
+if day_used >= 0 and day_used > tonumber(redis.call('GET', KEYS[2]) or '0') then
+  redis.call('SET', KEYS[2], day_used, 'EX', tonumber(ARGV[4]) + 3600)
+end
+return 1
+"""
+
+
+class RedisQuotaBackend(QuotaBackend):
+    """Shared buckets; both operations are single Lua scripts, so they are atomic across processes."""
+
+    def __init__(self, prefix: str = "provider:quota") -> None:
+        self.prefix = prefix
+
+    def _keys(self, now: float) -> list[str]:
+        return [f"{self.prefix}:minute", f"{self.prefix}:day:{_day_key(now)}"]
+
+    async def take(self, limits: QuotaLimits, reserve: float, now: float) -> Grant:
+        args = (
+            now,
+            limits.per_minute,
+            limits.per_day,
+            math.ceil(limits.per_minute * reserve),
+            math.ceil(limits.per_day * reserve),
+            _seconds_to_midnight(now),
+        )
+        async with aioredis.Redis(connection_pool=get_redis_pool()) as r:
+            granted, wait, day_exhausted, tokens, day_remaining = await r.eval(  # type: ignore[misc]
+                _TAKE_SCRIPT, 2, *self._keys(now), *map(str, args)
+            )
+        return Grant(bool(granted), float(wait), bool(day_exhausted), float(tokens), int(day_remaining))
+
+    async def observe(self, upstream: UpstreamQuota, limits: QuotaLimits, now: float) -> None:
+        minute = upstream.minute_remaining if upstream.minute_remaining is not None else -1
+        day_used = limits.per_day - upstream.day_remaining if upstream.day_remaining is not None else -1
+        args = (now, minute, day_used, _seconds_to_midnight(now))
+        async with aioredis.Redis(connection_pool=get_redis_pool()) as r:
+            await r.eval(_OBSERVE_SCRIPT, 2, *self._keys(now), *map(str, args))  # type: ignore[misc]
+
+
+class LocalQuotaBackend(QuotaBackend):
+    """The same algorithm in process memory; the fallback while Redis is unreachable."""
+
+    def __init__(self) -> None:
+        self._tokens: float | None = None
+        self._ts = 0.0
+        self._day = ""
+        self._day_used = 0
+
+    def _refill(self, limits: QuotaLimits, now: float) -> float:
+        if self._tokens is None:
+            self._tokens = float(limits.per_minute)
+        else:
+            elapsed = max(0.0, now - self._ts)
+            self._tokens = min(float(limits.per_minute), self._tokens + elapsed * limits.per_minute / 60)
+        self._ts = now
+        if self._day != _day_key(now):
+            self._day, self._day_used = _day_key(now), 0
+        return self._tokens
+
+    async def take(self, limits: QuotaLimits, reserve: float, now: float) -> Grant:
+        tokens = self._refill(limits, now)
+        day_remaining = limits.per_day - self._day_used
+        if day_remaining <= math.ceil(limits.per_day * reserve):
+            return Grant(False, day_exhausted=True, minute_remaining=tokens, day_remaining=day_remaining)
+        minute_reserve = math.ceil(limits.per_minute * reserve)
+        if tokens - minute_reserve < 1:
+            wait = (1 + minute_reserve - tokens) * 60 / limits.per_minute
+            return Grant(False, wait_seconds=wait, minute_remaining=tokens, day_remaining=day_remaining)
+        self._tokens = tokens - 1
+        self._day_used += 1
+        return Grant(True, minute_remaining=self._tokens, day_remaining=day_remaining - 1)
+
+    async def observe(self, upstream: UpstreamQuota, limits: QuotaLimits, now: float) -> None:
+        tokens = self._refill(limits, now)
+        if upstream.minute_remaining is not None:
+            self._tokens = min(tokens, float(upstream.minute_remaining))
+        if upstream.day_remaining is not None:
+            self._day_used = max(self._day_used, limits.per_day - upstream.day_remaining)
+
+
+# ── Scheduler ─────────────────────────────────────────────────────────────────
+
+
+@dataclass
+class PriorityStats:
+    granted: int = 0
+    waited: int = 0  # granted after queueing for a minute token
+    rejected: int = 0
+
+
+@dataclass
+class QuotaScheduler:
+    """Admits provider calls against the shared budget, queueing briefly when the minute bucket is empty.
+
+    Configured limits are replaced by the upstream's own once a response reports them.
+    """
+
+    limits: QuotaLimits
+    backend: QuotaBackend = field(default_factory=RedisQuotaBackend)
+    fallback: QuotaBackend = field(default_factory=LocalQuotaBackend)
+    upstream: UpstreamQuota = field(default_factory=UpstreamQuota)
+    stats: dict[Priority, PriorityStats] = field(default_factory=lambda: {p: PriorityStats() for p in Priority})
+    last_grant: Grant | None = None
+
+    async def _take(self, priority: Priority) -> Grant:
+        now = time.time()
+        try:
+            return await self.backend.take(self.limits, RESERVES[priority], now)
+        except Exception as exc:
+            log.warning("Quota backend unavailable, using process-local bucket", error=str(exc))
+            return await self.fallback.take(self.limits, RESERVES[priority], now)
+
+    async def acquire(self, priority: Priority) -> None:
+        stats = self.stats[priority]
+        deadline = time.monotonic() + MAX_WAIT_SECONDS[priority]
+        waited = False
+        while True:
+            grant = await self._take(priority)
+            self.last_grant = grant
+            if grant.granted:
+                stats.granted += 1
+                stats.waited += waited
+                return
+            if grant.day_exhausted:
+                stats.rejected += 1
+                raise QuotaExhaustedError(priority, "daily budget reserved for higher priorities")
+            if time.monotonic() + grant.wait_seconds > deadline:
+                stats.rejected += 1
+                raise QuotaExhaustedError(priority, "per-minute budget exhausted")
+            waited = True
+            await asyncio.sleep(grant.wait_seconds)
+
+    async def observe(self, headers: Mapping[str, str]) -> None:
+        upstream = parse_quota_headers(headers)
+        if upstream == UpstreamQuota():
+            return
+        self.upstream = upstream
+        if upstream.minute_limit:
+            self.limits.per_minute = upstream.minute_limit
+        if upstream.day_limit:
+            self.limits.per_day = upstream.day_limit
+        now = time.time()
+        try:
+            await self.backend.observe(upstream, self.limits, now)
+        except Exception as exc:
+            log.warning("Quota backend unavailable, using process-local bucket", error=str(exc))
+            await self.fallback.observe(upstream, self.limits, now)
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "limits": asdict(self.limits),
+            "upstream": asdict(self.upstream),
+            "minute_remaining": round(self.last_grant.minute_remaining, 1) if self.last_grant else None,
+            "day_remaining": self.last_grant.day_remaining if self.last_grant else None,
+            "priorities": {p.name: asdict(s) for p, s in self.stats.items()},
+        }
@@ -0,0 +1,236 @@
+"""Retries, circuit breakers and last-known-good fallback for provider calls."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from enum import StrEnum
+from typing import Any, ClassVar, TypeVar
+
+import httpx
+
+from app.core.logging import get_logger
+from app.services.provider import FootballProvider, ProviderWrapper
+from app.services.provider_cache import ResponseStore, cache_key, decode_response, encode_response
+from app.services.provider_quota import QuotaExhaustedError
+
+log = get_logger("provider_resilience")
+R = TypeVar("R")
+
+
+class ProviderUnavailableError(Exception):
+    """Upstream is failing (or its breaker is open) and no last-known data exists."""
+
+    def __init__(self, endpoint: str, reason: str) -> None:
+        super().__init__(f"provider {endpoint} unavailable: {reason}")
+        self.endpoint = endpoint
+        self.reason = reason
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Network errors, timeouts, 5xx and 429 are transient; other 4xx and quota rejections are not."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        code = exc.response.status_code
+        return code >= 500 or code == httpx.codes.TOO_MANY_REQUESTS
+    return isinstance(exc, httpx.TransportError)
+
+
+# ── Circuit breaker ───────────────────────────────────────────────────────────
+
+
+class BreakerState(StrEnum):
+    closed = "closed"
+    open = "open"
+    half_open = "half_open"
+
+
+class Admission:
+    """Token for a call let through by ``CircuitBreaker.allow``, compared by identity."""
+
+    __slots__ = ()
+
+
+_CLOSED = Admission()  # shared by every call admitted while the breaker is closed
+
+
+class CircuitBreaker:
+    """Opens after ``failure_threshold`` consecutive failures; after ``reset_seconds``
+    a single trial call is let through (half-open) and decides whether it closes again.
+
+    Calls admitted earlier may still finish during a trial, so only the trial's own
+    ``Admission`` can end it.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._clock = clock
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._trial: Admission | None = None
+
+    @property
+    def state(self) -> BreakerState:
+        if self.opened_at is None:
+            return BreakerState.closed
+        if self._clock() - self.opened_at >= self.reset_seconds:
+            return BreakerState.half_open
+        return BreakerState.open
+
+    def allow(self) -> Admission | None:
+        state = self.state
+        if state is BreakerState.closed:
+            return _CLOSED
+        if state is BreakerState.half_open and self._trial is None:
+            self._trial = Admission()
+            return self._trial
+        return None
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self._trial = None
+
+    def release(self, admission: Admission) -> None:
+        """End ``admission``'s trial if it never reached a verdict; a no-op for any other call."""
+        if admission is self._trial:
+            self._trial = None
+
+    def record_failure(self, admission: Admission) -> None:
+        self.failures += 1
+        if admission is self._trial or self.failures >= self.failure_threshold:
+            self.opened_at = self._clock()
+        self.release(admission)
+
+
+# ── Resilient provider ────────────────────────────────────────────────────────
+
+
+@dataclass
+class ResilienceStats:
+    retries: int = 0
+    failures: int = 0  # calls that failed after all attempts
+    short_circuited: int = 0  # rejected by an open breaker without calling upstream
+    fallbacks: int = 0  # served from last-known data instead of failing
+
+
+class ResilientProvider(ProviderWrapper):
+    """Retries transient failures with full-jitter exponential backoff, trips a breaker
+    per endpoint, and serves the last successful response while upstream is down.
+
+    Every interface method is a GET, so all of them are safe to retry. Last-known
+    responses of ``FALLBACK_ENDPOINTS`` are kept in ``fallback_store`` for
+    ``fallback_ttl`` seconds. Fixture, live and event calls feed sync writes, which
+    must not apply days-old scores over fresh ones: they fail instead, and the sync
+    skips that cycle.
+    """
+
+    FALLBACK_ENDPOINTS: ClassVar[frozenset[str]] = frozenset(
+        {"get_leagues", "get_teams", "search_teams", "get_standings"}
+    )
+
+    def __init__(
+        self,
+        inner: FootballProvider,
+        *,
+        attempts: int = 3,
+        backoff_base: float = 0.2,
+        backoff_cap: float = 2.0,
+        failure_threshold: int = 5,
+        reset_seconds: float = 30.0,
+        fallback_store: ResponseStore | None = None,
+        fallback_ttl: int = 2 * 24 * 3600,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(inner)
+        self.attempts = attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.fallback_store = fallback_store
+        self.fallback_ttl = fallback_ttl
+        self.breakers: dict[str, CircuitBreaker] = {}
+        self._breaker_args = (failure_threshold, reset_seconds, clock)
+        self.resilience_stats = ResilienceStats()
+
+    def breaker(self, endpoint: str) -> CircuitBreaker:
+        if endpoint not in self.breakers:
+            self.breakers[endpoint] = CircuitBreaker(*self._breaker_args)
+        return self.breakers[endpoint]
+
+    def _backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2**attempt))  # noqa: S311
+
+    async def _call(self, endpoint: str, args: tuple[Any, ...], fetch: Callable[[], Awaitable[R]]) -> R:
+        breaker = self.breaker(endpoint)
+        key = f"lastgood:{cache_key(self.name, endpoint, args)}"
+        admission = breaker.allow()
+        if admission is None:
+            self.resilience_stats.short_circuited += 1
+            cached: R = await self._fallback(endpoint, key, "circuit open")
+            return cached
+
+        try:
+            for attempt in range(self.attempts):
+                try:
+                    result = await fetch()
+                except QuotaExhaustedError:
+                    raise  # upstream was never called, so this says nothing about its health
+                except Exception as exc:
+                    if is_retryable(exc) and attempt + 1 < self.attempts:
+                        self.resilience_stats.retries += 1
+                        await asyncio.sleep(self._backoff(attempt))
+                        continue
+                    if not is_retryable(exc):
+                        if isinstance(exc, httpx.HTTPStatusError):
+                            breaker.record_success()  # a 4xx means upstream answered; don't trip on it
+                        raise  # anything else (e.g. an unparsable body) says nothing either way
+                    breaker.record_failure(admission)
+                    self.resilience_stats.failures += 1
+                    log.warning("Provider call failed", endpoint=endpoint, attempts=self.attempts, error=str(exc))
+                    stale: R = await self._fallback(endpoint, key, str(exc) or type(exc).__name__, exc)
+                    return stale
+                breaker.record_success()
+                await self._remember(endpoint, key, result)
+                return result
+        finally:
+            # A half-open trial that ended without a verdict (quota, parse error, cancellation) must not wedge it
+            breaker.release(admission)
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    async def _remember(self, endpoint: str, key: str, result: Any) -> None:
+        if self.fallback_store is None or endpoint not in self.FALLBACK_ENDPOINTS:
+            return
+        try:
+            await self.fallback_store.set(key, encode_response(result), self.fallback_ttl)
+        except Exception as exc:
+            log.warning("Last-known response not stored", endpoint=endpoint, error=str(exc))
+
+    async def _fallback(self, endpoint: str, key: str, reason: str, cause: BaseException | None = None) -> Any:
+        raw = None
+        if self.fallback_store is not None and endpoint in self.FALLBACK_ENDPOINTS:
+            try:
+                raw = await self.fallback_store.get(key)
+            except Exception as exc:
+                log.warning("Last-known response unavailable", endpoint=endpoint, error=str(exc))
+        if raw is None:
+            raise ProviderUnavailableError(endpoint, reason) from cause
+        self.resilience_stats.fallbacks += 1
+        return decode_response(endpoint, raw)
+
+    def breaker_states(self) -> dict[str, str]:
+        return {endpoint: breaker.state.value for endpoint, breaker in self.breakers.items()}
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            **self.inner.stats(),
+            "resilience": asdict(self.resilience_stats),
+            "breakers": self.breaker_states(),
+        }
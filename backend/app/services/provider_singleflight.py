@@ -0,0 +1,136 @@
+"""Request coalescing: identical concurrent provider calls share one upstream request."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import copy
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from typing import Any, TypeVar
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.core.logging import get_logger
+from app.services.cache import get_redis_pool
+from app.services.provider import FootballProvider, ProviderWrapper
+from app.services.provider_cache import cache_key, decode_response, encode_response
+
+log = get_logger("provider_singleflight")
+R = TypeVar("R")
+
+
+@dataclass
+class CoalesceStats:
+    calls: int = 0
+    upstream: int = 0  # calls that actually reached the wrapped provider
+    coalesced: int = 0  # joined an in-flight call in this process
+    remote_coalesced: int = 0  # reused the result of another process' call
+    lock_timeouts: int = 0  # another process held the lock but published nothing in time
+
+
+@dataclass(slots=True)
+class _Flight:
+    task: asyncio.Future[Any]
+    followers: int = 0
+
+
+class CoalescingProvider(ProviderWrapper):
+    """Singleflight around a provider.
+
+    Within a process, callers that arrive while an identical call is in flight
+    await the same task. With ``distributed=True``, the first process to take a
+    short Redis lock for the call makes the request and publishes the result for
+    ``result_ttl_ms``; other processes poll for it rather than calling upstream.
+    Any Redis failure degrades to in-process coalescing only.
+    """
+
+    def __init__(
+        self,
+        inner: FootballProvider,
+        *,
+        distributed: bool = False,
+        lock_ms: int = 5000,
+        result_ttl_ms: int = 2000,
+        poll_interval: float = 0.05,
+    ) -> None:
+        super().__init__(inner)
+        self.distributed = distributed
+        self.lock_ms = lock_ms
+        self.result_ttl_ms = result_ttl_ms
+        self.poll_interval = poll_interval
+        self.coalesce_stats = CoalesceStats()
+        self._inflight: dict[str, _Flight] = {}
+
+    async def _call(self, endpoint: str, args: tuple[Any, ...], fetch: Callable[[], Awaitable[R]]) -> R:
+        key = cache_key(self.name, endpoint, args)
+        self.coalesce_stats.calls += 1
+        flight = self._inflight.get(key)
+        if flight is not None:
+            self.coalesce_stats.coalesced += 1
+            flight.followers += 1
+            # Shared results are deep-copied, DTO payloads included, so no caller's edits reach another
+            shared: R = copy.deepcopy(await asyncio.shield(flight.task))
+            return shared
+
+        flight = _Flight(asyncio.ensure_future(self._lead(key, endpoint, fetch)))
+        self._inflight[key] = flight
+        flight.task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        result: R = await asyncio.shield(flight.task)
+        # The flight is unlisted before this resumes, so the follower count is final
+        return copy.deepcopy(result) if flight.followers else result
+
+    async def _fetch(self, fetch: Callable[[], Awaitable[R]]) -> R:
+        self.coalesce_stats.upstream += 1
+        return await fetch()
+
+    async def _lead(self, key: str, endpoint: str, fetch: Callable[[], Awaitable[R]]) -> R:
+        if not self.distributed:
+            return await self._fetch(fetch)
+
+        lock_key, result_key = f"singleflight:{key}:lock", f"singleflight:{key}:result"
+        try:
+            async with aioredis.Redis(connection_pool=get_redis_pool()) as r:
+                leader = await r.set(lock_key, "1", nx=True, px=self.lock_ms)
+                if not leader:
+                    raw = await self._wait_for_result(r, lock_key, result_key)
+                    if raw is not None:
+                        self.coalesce_stats.remote_coalesced += 1
+                        remote: R = decode_response(endpoint, raw)  # type: ignore[assignment]
+                        return remote
+        except RedisError as exc:
+            log.warning("Singleflight lock unavailable, calling upstream", endpoint=endpoint, error=str(exc))
+            return await self._fetch(fetch)
+        if not leader:
+            self.coalesce_stats.lock_timeouts += 1
+            return await self._fetch(fetch)
+
+        try:
+            result = await self._fetch(fetch)
+            try:
+                async with aioredis.Redis(connection_pool=get_redis_pool()) as r:
+                    await r.set(result_key, encode_response(result), px=self.result_ttl_ms)  # type: ignore[arg-type]
+            except RedisError as exc:
+                log.warning("Singleflight result not published", endpoint=endpoint, error=str(exc))
+            return result
+        finally:
+            # If this fails the lock simply expires after lock_ms
+            with contextlib.suppress(RedisError):
+                async with aioredis.Redis(connection_pool=get_redis_pool()) as r:
+                    await r.delete(lock_key)
+
+    async def _wait_for_result(self, r: aioredis.Redis, lock_key: str, result_key: str) -> str | None:
+        deadline = time.monotonic() + self.lock_ms / 1000
+        while time.monotonic() < deadline:
+            raw: str | None = await r.get(result_key)
+            if raw is not None:
+                return raw
+            if not await r.exists(lock_key):
+                return None  # the leader failed without publishing
+            await asyncio.sleep(self.poll_interval)
+        return None
+
+    def stats(self) -> dict[str, Any]:
+        return {**self.inner.stats(), "singleflight": asdict(self.coalesce_stats)}
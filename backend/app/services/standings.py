@@ -0,0 +1,27 @@
+"""League tables as served by ``GET /leagues/{id}/standings``."""
+
+from __future__ import annotations
+
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.db.models import Standing
+from app.schemas.standings import StandingOut
+
+_standings_json = TypeAdapter(list[StandingOut])
+
+
+def standings_key(league_id: str, season: str) -> str:
+    return f"standings:{league_id}:{season}"
+
+
+async def build_standings_body(db: AsyncSession, league_id: str, season: str) -> bytes:
+    result = await db.execute(
+        select(Standing)
+        .options(selectinload(Standing.team))
+        .where(Standing.league_id == league_id, Standing.season == season)
+        .order_by(Standing.rank)
+    )
+    return _standings_json.dump_json([StandingOut.model_validate(s) for s in result.scalars().all()])
@@ -2,33 +2,167 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
+import time
 import uuid
+from collections import Counter
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Sequence
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime, timedelta
+from typing import Any, TypeVar
 
-from sqlalchemy import select
+from sqlalchemy import delete, or_, select, update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import get_settings
 from app.core.logging import get_logger
-from app.db.models import Event, Fixture, League, Standing, Team
-from app.services.provider import FootballProvider, ProviderFixture
+from app.db.models import Base, Event, Fixture, League, Standing, Team
+from app.services.cache_warmer import ChangeSet, warm_caches
+from app.services.id_resolver import IN_CHUNK_SIZE, IdResolver, Kind, chunks
+from app.services.provider import LIVE_STATUSES, FootballProvider, ProviderEvent, ProviderFixture, ProviderStanding
 
 log = get_logger("sync")
 
+K = TypeVar("K")
+R = TypeVar("R")
+
+# Postgres caps a statement at 32767 bind parameters; a fixture row binds 11.
+_UPSERT_CHUNK_SIZE = 1000
+
+_STANDING_STAT_COLUMNS = (
+    Standing.rank,
+    Standing.played,
+    Standing.wins,
+    Standing.draws,
+    Standing.losses,
+    Standing.goals_for,
+    Standing.goals_against,
+    Standing.goal_diff,
+    Standing.points,
+)
+
+
+@dataclass
+class UpsertResult:
+    """Row counts for a bulk upsert."""
+
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    skipped: int = 0  # unresolved league/team foreign keys
+
+
+@dataclass
+class EventDelta:
+    """Events written by one ``sync_events`` run."""
+
+    fixture_provider_id: str
+    new: list[ProviderEvent] = field(default_factory=list)
+    changed: list[ProviderEvent] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)  # keys of stored events no longer in the feed
+
+
+@dataclass
+class LiveSyncResult:
+    """Outcome of one ``sync_live`` tick."""
+
+    fixtures: UpsertResult = field(default_factory=UpsertResult)
+    deltas: list[EventDelta] = field(default_factory=list)
+    ended: list[str] = field(default_factory=list)  # stored as live, no longer in the feed
+
+
+@dataclass
+class SyncFailure:
+    call: str
+    key: str
+    error: str
+
+
+@dataclass
+class SyncReport:
+    """Outcome of the batch (``*_many``) sync methods of one SyncService."""
+
+    calls: int = 0
+    failures: list[SyncFailure] = field(default_factory=list)
+    fetch_seconds: float = 0.0  # wall-clock time of the concurrent fetch phases
+    write_seconds: float = 0.0  # time spent writing, serialized on the session
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "failed": len(self.failures),
+            "fetch_seconds": round(self.fetch_seconds, 3),
+            "write_seconds": round(self.write_seconds, 3),
+        }
+
+
+def event_keys(events: Sequence[ProviderEvent]) -> list[str]:
+    """Stable identity for each event: fixture, type, minute, team, player and detail.
+
+    Identical events in one feed (e.g. two yellow cards for the same player in the
+    same minute) are told apart by their occurrence index.
+    """
+    seen: dict[str, int] = {}
+    keys = []
+    for pe in events:
+        parts = (
+            pe.fixture_provider_id,
+            pe.type,
+            pe.minute,
+            pe.team_provider_id,
+            pe.player_name,
+            pe.payload.get("detail") if pe.payload else None,
+        )
+        base = "|".join("" if p is None else str(p) for p in parts)
+        occurrence = seen.get(base, 0)
+        seen[base] = occurrence + 1
+        keys.append(hashlib.blake2b(f"{base}|{occurrence}".encode(), digest_size=16).hexdigest())
+    return keys
+
+
+def _log_upsert(message: str, result: UpsertResult, **context: Any) -> None:
+    log.info(
+        message,
+        **context,
+        inserted=result.inserted,
+        updated=result.updated,
+        unchanged=result.unchanged,
+        skipped=result.skipped,
+    )
+
+
+def _fixture_window(hours_forward: int) -> tuple[datetime, datetime]:
+    now = datetime.now(UTC)
+    return now - timedelta(hours=24), now + timedelta(hours=hours_forward)
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite drops tzinfo on read; Postgres returns aware datetimes
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
+
 
 class SyncService:
-    def __init__(self, provider: FootballProvider, session: AsyncSession) -> None:
+    def __init__(self, provider: FootballProvider, session: AsyncSession, fetch_concurrency: int | None = None) -> None:
         self.provider = provider
         self.session = session
+        self.ids = IdResolver(session)
+        self.fetch_concurrency = fetch_concurrency or get_settings().sync_fetch_concurrency
+        self.report = SyncReport()
+        # What this service wrote, for refresh_caches once the session is committed
+        self.changes = ChangeSet()
 
     # ── Leagues ───────────────────────────────────────────────────────────────
     async def sync_leagues(self, country: str | None = None, season: str | None = None) -> int:
         provider_leagues = await self.provider.get_leagues(country=country, season=season)
+        existing: dict[str, League] = await self.ids.load_rows(Kind.league, [pl.provider_id for pl in provider_leagues])
         count = 0
         for pl in provider_leagues:
-            existing = await self.session.execute(select(League).where(League.provider_league_id == pl.provider_id))
-            league = existing.scalar_one_or_none()
+            league = existing.get(pl.provider_id)
             if league is None:
                 league = League(
                     id=str(uuid.uuid4()),
@@ -39,6 +173,8 @@ class SyncService:
                     logo_url=pl.logo_url,
                 )
                 self.session.add(league)
+                existing[pl.provider_id] = league
+                self.ids.remember(Kind.league, pl.provider_id, league.id)
                 count += 1
             else:
                 league.name = pl.name
@@ -49,26 +185,26 @@ class SyncService:
 
     # ── Teams ─────────────────────────────────────────────────────────────────
     async def sync_teams(self, league_provider_id: str) -> int:
-        # Ensure league exists
-        league_row = await self.session.execute(select(League).where(League.provider_league_id == league_provider_id))
-        league = league_row.scalar_one_or_none()
+        league_id = await self.ids.resolve_one(Kind.league, league_provider_id)
 
         provider_teams = await self.provider.get_teams(league_provider_id)
+        existing: dict[str, Team] = await self.ids.load_rows(Kind.team, [pt.provider_id for pt in provider_teams])
         count = 0
         for pt in provider_teams:
-            existing = await self.session.execute(select(Team).where(Team.provider_team_id == pt.provider_id))
-            team = existing.scalar_one_or_none()
+            team = existing.get(pt.provider_id)
             if team is None:
                 team = Team(
                     id=str(uuid.uuid4()),
                     provider_team_id=pt.provider_id,
                     name=pt.name,
                     short_name=pt.short_name,
-                    league_id=league.id if league else None,
+                    league_id=league_id,
                     country=pt.country,
                     logo_url=pt.logo_url,
                 )
                 self.session.add(team)
+                existing[pt.provider_id] = team
+                self.ids.remember(Kind.team, pt.provider_id, team.id)
                 count += 1
             else:
                 team.name = pt.name
@@ -79,142 +215,428 @@ class SyncService:
 
     # ── Fixtures ──────────────────────────────────────────────────────────────
     async def sync_fixtures(self, team_provider_id: str, hours_forward: int = 72) -> int:
-        now = datetime.now(UTC)
-        from_date = now - timedelta(hours=24)
-        to_date = now + timedelta(hours=hours_forward)
-
+        from_date, to_date = _fixture_window(hours_forward)
         provider_fixtures = await self.provider.get_fixtures(team_provider_id, from_date, to_date)
-        count = 0
-        for pf in provider_fixtures:
-            count += await self._upsert_fixture(pf)
-        await self.session.flush()
-        log.info("Synced fixtures", team=team_provider_id, count=count)
-        return count
+        result = await self.upsert_fixtures(provider_fixtures)
+        _log_upsert("Synced fixtures", result, team=team_provider_id)
+        return result.inserted
+
+    async def sync_league_fixtures(self, league_provider_id: str, season: str, hours_forward: int = 72) -> int:
+        """Sync a whole league's fixture window with one provider call.
+
+        Preferred over per-team :meth:`sync_fixtures`, which downloads every fixture
+        twice (once for each side) and costs one call per team.
+        """
+        from_date, to_date = _fixture_window(hours_forward)
+        provider_fixtures = await self.provider.get_league_fixtures(league_provider_id, season, from_date, to_date)
+        result = await self.upsert_fixtures(provider_fixtures)
+        _log_upsert("Synced league fixtures", result, league=league_provider_id, season=season)
+        return result.inserted
 
-    async def _upsert_fixture(self, pf: ProviderFixture) -> int:
-        # Resolve foreign keys
-        league_row = await self.session.execute(
-            select(League).where(League.provider_league_id == pf.league_provider_id)
+    async def refresh_fixtures(self, fixture_provider_ids: Sequence[str]) -> UpsertResult:
+        """Re-fetch specific fixtures (post-match finalization, watched matches) by id.
+
+        The provider batches the ids, so a few dozen fixtures cost a couple of
+        calls. A failed fetch is recorded in ``report`` and writes nothing.
+        """
+        if not fixture_provider_ids:
+            return UpsertResult()
+        fetched = await self._fetch_all(
+            "get_fixtures_by_ids",
+            [",".join(fixture_provider_ids)],
+            lambda _: self.provider.get_fixtures_by_ids(fixture_provider_ids),
         )
-        league = league_row.scalar_one_or_none()
-        home_row = await self.session.execute(select(Team).where(Team.provider_team_id == pf.home_team_provider_id))
-        away_row = await self.session.execute(select(Team).where(Team.provider_team_id == pf.away_team_provider_id))
-        home_team = home_row.scalar_one_or_none()
-        away_team = away_row.scalar_one_or_none()
-
-        if not (league and home_team and away_team):
-            return 0
-
-        existing = await self.session.execute(select(Fixture).where(Fixture.provider_fixture_id == pf.provider_id))
-        fixture = existing.scalar_one_or_none()
-        if fixture is None:
-            fixture = Fixture(
-                id=str(uuid.uuid4()),
-                provider_fixture_id=pf.provider_id,
-                league_id=league.id,
-                season=pf.season,
-                home_team_id=home_team.id,
-                away_team_id=away_team.id,
-                start_time=pf.start_time,
-                status=pf.status,
-                home_score=pf.home_score,
-                away_score=pf.away_score,
-                updated_at=datetime.now(UTC),
+        if not fetched:
+            return UpsertResult()
+        async with self._timed_write():
+            result = await self.upsert_fixtures(fetched[0][1])
+        _log_upsert("Refreshed fixtures", result, requested=len(fixture_provider_ids))
+        return result
+
+    async def upsert_fixtures(self, provider_fixtures: Sequence[ProviderFixture]) -> UpsertResult:
+        """Write a batch of provider fixtures with set-based statements.
+
+        Foreign keys and existing rows are resolved with one ``IN (...)`` query per
+        chunk, and new or changed fixtures are written with a single multi-row
+        ``INSERT ... ON CONFLICT (provider_fixture_id) DO UPDATE`` per chunk.
+        """
+        result = UpsertResult()
+        # Last occurrence wins when the provider repeats a fixture in one payload
+        by_id = {pf.provider_id: pf for pf in provider_fixtures}
+        if not by_id:
+            return result
+
+        league_ids = await self.ids.leagues(pf.league_provider_id for pf in by_id.values())
+        team_ids = await self.ids.teams(
+            {pf.home_team_provider_id for pf in by_id.values()} | {pf.away_team_provider_id for pf in by_id.values()}
+        )
+        existing = await self._existing_fixtures(by_id.keys())
+
+        now = datetime.now(UTC)
+        rows: list[dict[str, Any]] = []
+        for pf in by_id.values():
+            league_id = league_ids.get(pf.league_provider_id)
+            home_id = team_ids.get(pf.home_team_provider_id)
+            away_id = team_ids.get(pf.away_team_provider_id)
+            if not (league_id and home_id and away_id):
+                result.skipped += 1
+                continue
+
+            current = existing.get(pf.provider_id)
+            if current is None:
+                row_id = str(uuid.uuid4())
+                self.ids.remember(Kind.fixture, pf.provider_id, row_id)
+                result.inserted += 1
+            elif current[1:] == (_as_utc(pf.start_time), pf.status, pf.home_score, pf.away_score):
+                result.unchanged += 1
+                continue
+            else:
+                row_id = current[0]
+                result.updated += 1
+
+            self.changes.teams.update((home_id, away_id))
+            self.changes.fixtures.add(row_id)
+            rows.append(
+                {
+                    "id": row_id,
+                    "provider_fixture_id": pf.provider_id,
+                    "league_id": league_id,
+                    "season": pf.season,
+                    "home_team_id": home_id,
+                    "away_team_id": away_id,
+                    "start_time": pf.start_time,
+                    "status": pf.status,
+                    "home_score": pf.home_score,
+                    "away_score": pf.away_score,
+                    "updated_at": now,
+                }
             )
-            self.session.add(fixture)
-            return 1
-        else:
-            fixture.status = pf.status
-            fixture.home_score = pf.home_score
-            fixture.away_score = pf.away_score
-            fixture.updated_at = datetime.now(UTC)
-            return 0
+
+        for chunk in chunks(rows, _UPSERT_CHUNK_SIZE):
+            stmt = self._insert(Fixture).values(chunk)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["provider_fixture_id"],
+                set_={
+                    "start_time": stmt.excluded.start_time,
+                    "status": stmt.excluded.status,
+                    "home_score": stmt.excluded.home_score,
+                    "away_score": stmt.excluded.away_score,
+                    "updated_at": stmt.excluded.updated_at,
+                },
+            )
+            await self.session.execute(stmt)
+        return result
+
+    async def _existing_fixtures(
+        self, provider_fixture_ids: Iterable[str]
+    ) -> dict[str, tuple[str, datetime, str, int | None, int | None]]:
+        """Return ``provider_fixture_id -> (id, start_time, status, home_score, away_score)``."""
+        existing: dict[str, tuple[str, datetime, str, int | None, int | None]] = {}
+        for chunk in chunks(list(provider_fixture_ids), IN_CHUNK_SIZE):
+            rows = await self.session.execute(
+                select(
+                    Fixture.provider_fixture_id,
+                    Fixture.id,
+                    Fixture.start_time,
+                    Fixture.status,
+                    Fixture.home_score,
+                    Fixture.away_score,
+                ).where(Fixture.provider_fixture_id.in_(chunk))
+            )
+            for provider_id, row_id, start_time, status, home_score, away_score in rows:
+                existing[provider_id] = (row_id, _as_utc(start_time), status, home_score, away_score)
+                self.ids.remember(Kind.fixture, provider_id, row_id)
+        return existing
+
+    def _insert(self, model: type[Base]) -> Any:
+        """Dialect-specific INSERT supporting ``ON CONFLICT`` (Postgres in prod, SQLite in tests)."""
+        if self.session.get_bind().dialect.name == "sqlite":
+            return sqlite_insert(model)
+        return pg_insert(model)
 
     # ── Events ────────────────────────────────────────────────────────────────
-    async def sync_events(self, fixture_provider_id: str) -> int:
+    async def sync_events(self, fixture_provider_id: str) -> EventDelta:
+        """Write only events that are new, changed or gone since the last run.
+
+        Events are matched on :func:`event_keys`, so re-syncing the same feed every
+        minute is a no-op. The returned delta lets callers react to just the new
+        goals and cards.
+        """
         provider_events = await self.provider.get_events(fixture_provider_id)
-        fixture_row = await self.session.execute(
-            select(Fixture).where(Fixture.provider_fixture_id == fixture_provider_id)
+        return await self.write_events(fixture_provider_id, provider_events)
+
+    async def write_events(self, fixture_provider_id: str, provider_events: Sequence[ProviderEvent]) -> EventDelta:
+        """Reconcile the stored events of a fixture with its latest feed.
+
+        Keys missing from the feed are deleted: an event the provider dropped (a goal
+        ruled out by VAR) or corrected (a new minute or player gives a new key).
+        """
+        delta = EventDelta(fixture_provider_id)
+        fixture_id = await self.ids.resolve_one(Kind.fixture, fixture_provider_id)
+        if not fixture_id:
+            return delta
+
+        rows = await self.session.execute(
+            select(
+                Event.event_key, Event.id, Event.payload, Event.type, Event.minute, Event.team_id, Event.player_name
+            ).where(Event.fixture_id == fixture_id)
         )
-        fixture = fixture_row.scalar_one_or_none()
-        if not fixture:
-            return 0
+        existing: dict[str, tuple[str, str | None]] = {}
+        # Rows written before events were keyed, by content; replaced once with keyed rows
+        legacy: Counter[tuple[Any, ...]] = Counter()
+        for key, row_id, payload, *columns in rows:
+            if key is None:
+                legacy[(*columns, payload)] += 1
+            else:
+                existing[key] = (row_id, payload)
+        if legacy:
+            await self.session.execute(delete(Event).where(Event.fixture_id == fixture_id, Event.event_key.is_(None)))
 
-        count = 0
-        for pe in provider_events:
-            team: Team | None = None
-            if pe.team_provider_id:
-                team_row = await self.session.execute(select(Team).where(Team.provider_team_id == pe.team_provider_id))
-                team = team_row.scalar_one_or_none()
-
-            new_event = Event(
-                id=str(uuid.uuid4()),
-                fixture_id=fixture.id,
-                type=pe.type,
-                minute=pe.minute,
-                team_id=team.id if team else None,
-                player_name=pe.player_name,
-                payload=json.dumps(pe.payload) if pe.payload else None,
-                created_at=datetime.now(UTC),
+        team_ids = await self.ids.teams(pe.team_provider_id for pe in provider_events if pe.team_provider_id)
+        now = datetime.now(UTC)
+        inserts: list[dict[str, Any]] = []
+        updates: list[dict[str, Any]] = []
+        keys = event_keys(provider_events)
+        for key, pe in zip(keys, provider_events, strict=True):
+            payload = json.dumps(pe.payload, sort_keys=True) if pe.payload else None
+            team_id = team_ids.get(pe.team_provider_id) if pe.team_provider_id else None
+            current = existing.get(key)
+            if current is None:
+                inserts.append(
+                    {
+                        "id": str(uuid.uuid4()),
+                        "fixture_id": fixture_id,
+                        "event_key": key,
+                        "type": pe.type,
+                        "minute": pe.minute,
+                        "team_id": team_id,
+                        "player_name": pe.player_name,
+                        "payload": payload,
+                        "created_at": now,
+                    }
+                )
+                content = (pe.type, pe.minute, team_id, pe.player_name, payload)
+                if legacy[content]:
+                    legacy[content] -= 1  # already stored, only without a key
+                else:
+                    delta.new.append(pe)
+            elif current[1] != payload:
+                updates.append({"id": current[0], "payload": payload})
+                delta.changed.append(pe)
+
+        delta.removed = sorted(existing.keys() - set(keys))
+        if delta.removed:
+            await self.session.execute(
+                delete(Event).where(Event.fixture_id == fixture_id, Event.event_key.in_(delta.removed))
             )
-            self.session.add(new_event)
-            count += 1
+        if inserts:
+            stmt = self._insert(Event).values(inserts)
+            await self.session.execute(stmt.on_conflict_do_nothing(index_elements=["fixture_id", "event_key"]))
+        if updates:
+            await self.session.execute(update(Event), updates)
+        log.info(
+            "Synced events",
+            fixture=fixture_provider_id,
+            received=len(provider_events),
+            new=len(delta.new),
+            changed=len(delta.changed),
+            removed=len(delta.removed),
+        )
+        return delta
 
-        await self.session.flush()
-        log.info("Synced events", fixture=fixture_provider_id, count=count)
-        return count
+    # ── Live ──────────────────────────────────────────────────────────────────
+    async def sync_live(self, league_provider_ids: Sequence[str] | None = None) -> LiveSyncResult:
+        """Refresh score, status and events of every match in play from one provider call.
+
+        ``ended`` lists fixtures still stored as live that dropped out of the feed
+        (usually just finished); their final state needs a regular fixture refresh.
+        A failed fetch is recorded in ``report`` and leaves the DB untouched.
+        """
+        result = LiveSyncResult()
+        key = ",".join(league_provider_ids) if league_provider_ids is not None else "all"
+        fetched = await self._fetch_all(
+            "get_live_fixtures", [key], lambda _: self.provider.get_live_fixtures(league_provider_ids)
+        )
+        if not fetched:
+            return result
+        live = fetched[0][1]
+
+        async with self._timed_write():
+            result.fixtures = await self.upsert_fixtures([lf.fixture for lf in live])
+            # Untracked leagues were skipped above; don't look their events up one by one
+            known = await self.ids.fixtures(lf.fixture.provider_id for lf in live)
+            for lf in live:
+                if lf.fixture.provider_id in known:
+                    result.deltas.append(await self.write_events(lf.fixture.provider_id, lf.events))
+            result.ended = await self._stale_live_fixtures({lf.fixture.provider_id for lf in live}, league_provider_ids)
+        _log_upsert("Synced live fixtures", result.fixtures, live=len(live), ended=len(result.ended))
+        return result
+
+    async def _stale_live_fixtures(self, in_feed: set[str], league_provider_ids: Sequence[str] | None) -> list[str]:
+        stmt = select(Fixture.provider_fixture_id).where(Fixture.status.in_(LIVE_STATUSES))
+        if league_provider_ids is not None:
+            league_ids = await self.ids.leagues(league_provider_ids)
+            stmt = stmt.where(Fixture.league_id.in_(list(league_ids.values())))
+        rows = await self.session.execute(stmt)
+        return sorted(set(rows.scalars()) - in_feed)
 
     # ── Standings ─────────────────────────────────────────────────────────────
     async def sync_standings(self, league_provider_id: str, season: str) -> int:
         provider_standings = await self.provider.get_standings(league_provider_id, season)
-        league_row = await self.session.execute(select(League).where(League.provider_league_id == league_provider_id))
-        league = league_row.scalar_one_or_none()
-        if not league:
-            return 0
+        result = await self.upsert_standings(provider_standings)
+        _log_upsert("Synced standings", result, league=league_provider_id, season=season)
+        return result.inserted + result.updated
 
-        count = 0
+    async def upsert_standings(self, provider_standings: Sequence[ProviderStanding]) -> UpsertResult:
+        """Write a whole table (or every group of a competition) in one multi-row upsert.
+
+        Rows whose values are unchanged are left alone, both client-side and via the
+        ``ON CONFLICT ... DO UPDATE ... WHERE`` guard, so ``updated_at`` only moves
+        when the table does.
+        """
+        result = UpsertResult()
+        league_ids = await self.ids.leagues(ps.league_provider_id for ps in provider_standings)
+        team_ids = await self.ids.teams(ps.team_provider_id for ps in provider_standings)
+
+        by_key: dict[tuple[str, str, str], ProviderStanding] = {}
         for ps in provider_standings:
-            team_row = await self.session.execute(select(Team).where(Team.provider_team_id == ps.team_provider_id))
-            team = team_row.scalar_one_or_none()
-            if not team:
+            league_id = league_ids.get(ps.league_provider_id)
+            team_id = team_ids.get(ps.team_provider_id)
+            if not (league_id and team_id):
+                result.skipped += 1
                 continue
+            by_key[(league_id, ps.season, team_id)] = ps
+        if not by_key:
+            return result
 
-            stmt = (
-                pg_insert(Standing)
-                .values(
-                    league_id=league.id,
-                    season=ps.season,
-                    team_id=team.id,
-                    rank=ps.rank,
-                    played=ps.played,
-                    wins=ps.wins,
-                    draws=ps.draws,
-                    losses=ps.losses,
-                    goals_for=ps.goals_for,
-                    goals_against=ps.goals_against,
-                    goal_diff=ps.goal_diff,
-                    points=ps.points,
-                    updated_at=datetime.now(UTC),
-                )
-                .on_conflict_do_update(
-                    index_elements=["league_id", "season", "team_id"],
-                    set_={
-                        "rank": ps.rank,
-                        "played": ps.played,
-                        "wins": ps.wins,
-                        "draws": ps.draws,
-                        "losses": ps.losses,
-                        "goals_for": ps.goals_for,
-                        "goals_against": ps.goals_against,
-                        "goal_diff": ps.goal_diff,
-                        "points": ps.points,
-                        "updated_at": datetime.now(UTC),
-                    },
-                )
+        stored = await self.session.execute(
+            select(Standing.league_id, Standing.season, Standing.team_id, *_STANDING_STAT_COLUMNS).where(
+                Standing.league_id.in_({key[0] for key in by_key}),
+                Standing.season.in_({key[1] for key in by_key}),
+            )
+        )
+        existing = {tuple(row[:3]): tuple(row[3:]) for row in stored}
+
+        now = datetime.now(UTC)
+        rows: list[dict[str, Any]] = []
+        for (league_id, season, team_id), ps in by_key.items():
+            stats = {col.key: getattr(ps, col.key) for col in _STANDING_STAT_COLUMNS}
+            current = existing.get((league_id, season, team_id))
+            if current is None:
+                result.inserted += 1
+            elif current == tuple(stats.values()):
+                result.unchanged += 1
+                continue
+            else:
+                result.updated += 1
+            self.changes.teams.add(team_id)
+            self.changes.leagues.add((league_id, season))
+            rows.append({"league_id": league_id, "season": season, "team_id": team_id, **stats, "updated_at": now})
+
+        if rows:
+            stmt = self._insert(Standing).values(rows)
+            excluded = stmt.excluded
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["league_id", "season", "team_id"],
+                set_={col.key: excluded[col.key] for col in (*_STANDING_STAT_COLUMNS, Standing.updated_at)},
+                where=or_(*(col.is_distinct_from(excluded[col.key]) for col in _STANDING_STAT_COLUMNS)),
             )
             await self.session.execute(stmt)
-            count += 1
+        return result
 
-        await self.session.flush()
-        log.info("Synced standings", league=league_provider_id, count=count)
+    # ── Cache warming ─────────────────────────────────────────────────────────
+    async def refresh_caches(self) -> None:
+        """Rebuild the cached reads made stale by ``changes``; call once the session is committed.
+
+        Refreshing earlier would re-cache the old rows. If warming fails (Redis
+        down, a row that no longer serializes) the entries stay stale until their
+        TTL and ``changes`` is kept for a retry: the sync itself has succeeded.
+        """
+        if not self.changes:
+            return
+        try:
+            warmed = await warm_caches(self.session, self.changes)
+        except Exception as exc:
+            log.warning("Cache warming failed", **self.changes.summary(), error=str(exc))
+            # Only the warmer's reads are left to discard; a failed query would otherwise wedge the session
+            await self.session.rollback()
+            return
+        log.info("Caches warmed", **self.changes.summary(), **asdict(warmed))
+        self.changes.clear()
+
+    # ── Batch sync (concurrent fetch, serialized writes) ──────────────────────
+    async def sync_standings_many(self, leagues: Sequence[tuple[str, str]]) -> int:
+        """Sync ``(league_provider_id, season)`` tables; failed fetches are recorded in ``report``."""
+        fetched = await self._fetch_all("get_standings", leagues, lambda key: self.provider.get_standings(*key))
+        count = 0
+        async with self._timed_write():
+            for (league_provider_id, season), provider_standings in fetched:
+                result = await self.upsert_standings(provider_standings)
+                _log_upsert("Synced standings", result, league=league_provider_id, season=season)
+                count += result.inserted + result.updated
+        return count
+
+    async def sync_league_fixtures_many(self, leagues: Sequence[tuple[str, str]], hours_forward: int = 72) -> int:
+        from_date, to_date = _fixture_window(hours_forward)
+        fetched = await self._fetch_all(
+            "get_league_fixtures",
+            leagues,
+            lambda key: self.provider.get_league_fixtures(key[0], key[1], from_date, to_date),
+        )
+        count = 0
+        async with self._timed_write():
+            for (league_provider_id, season), provider_fixtures in fetched:
+                result = await self.upsert_fixtures(provider_fixtures)
+                _log_upsert("Synced league fixtures", result, league=league_provider_id, season=season)
+                count += result.inserted
+        return count
+
+    async def sync_fixtures_many(self, team_provider_ids: Sequence[str], hours_forward: int = 72) -> int:
+        from_date, to_date = _fixture_window(hours_forward)
+        fetched = await self._fetch_all(
+            "get_fixtures", team_provider_ids, lambda key: self.provider.get_fixtures(key, from_date, to_date)
+        )
+        count = 0
+        async with self._timed_write():
+            for team_provider_id, provider_fixtures in fetched:
+                result = await self.upsert_fixtures(provider_fixtures)
+                _log_upsert("Synced fixtures", result, team=team_provider_id)
+                count += result.inserted
         return count
+
+    async def sync_events_many(self, fixture_provider_ids: Sequence[str]) -> list[EventDelta]:
+        fetched = await self._fetch_all("get_events", fixture_provider_ids, self.provider.get_events)
+        async with self._timed_write():
+            return [await self.write_events(fixture_id, events) for fixture_id, events in fetched]
+
+    async def _fetch_all(self, call: str, keys: Sequence[K], fetch: Callable[[K], Awaitable[R]]) -> list[tuple[K, R]]:
+        """Run ``fetch`` for every key with at most ``fetch_concurrency`` calls in flight.
+
+        Only provider I/O runs concurrently; the session is never touched here.
+        Failures are logged and collected in ``report.failures`` instead of
+        aborting the run. Successful results keep the order of ``keys``.
+        """
+        semaphore = asyncio.Semaphore(self.fetch_concurrency)
+
+        async def one(key: K) -> tuple[K, R] | None:
+            async with semaphore:
+                try:
+                    return key, await fetch(key)
+                except Exception as exc:
+                    self.report.failures.append(SyncFailure(call, str(key), repr(exc)))
+                    log.warning("Provider call failed", call=call, key=str(key), error=repr(exc))
+                    return None
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(one(key) for key in keys))
+        self.report.fetch_seconds += time.perf_counter() - start
+        self.report.calls += len(keys)
+        return [result for result in results if result is not None]
+
+    @asynccontextmanager
+    async def _timed_write(self) -> AsyncIterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.report.write_seconds += time.perf_counter() - start
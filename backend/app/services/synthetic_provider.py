@@ -0,0 +1,380 @@
+"""SyntheticProvider – seeded, production-sized fake data for load tests and sync benchmarks.
+
+Nothing is stored: every league, team, fixture, event and standing is a pure
+function of the config and its indices, so memory stays flat at any scale and
+two instances with the same seed agree on everything except live progress,
+which follows the wall clock from the moment the provider was created.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import random
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+import httpx
+
+from app.services.provider import (
+    LIVE_STATUSES,
+    FootballProvider,
+    ProviderEvent,
+    ProviderFixture,
+    ProviderLeague,
+    ProviderLiveFixture,
+    ProviderStanding,
+    ProviderTeam,
+)
+
+_CITIES = (
+    "Northbridge", "Eastport", "Westfield", "Southam", "Kingsford", "Riverton", "Ashby", "Brookvale",
+    "Clearwater", "Dunmore", "Elmstead", "Fairhaven", "Glenrock", "Highcliff", "Ironwood", "Juniper",
+    "Kestrel", "Lakemont", "Millbrook", "Newhaven", "Oakridge", "Pinecrest", "Queensbury", "Redmoor",
+)  # fmt: skip
+_SUFFIXES = ("United", "City", "Athletic", "Rovers", "Wanderers", "FC", "Albion", "Town")
+_EVENT_TYPES = ("goal", "goal", "goal", "card", "card", "card", "card", "subst", "subst", "subst")
+
+_WEEK = timedelta(days=7)
+_MATCH_MINUTES = 90
+
+
+@dataclass(frozen=True)
+class SyntheticConfig:
+    leagues: int = 20
+    teams_per_league: int = 20
+    seasons: int = 1  # the current season plus seasons - 1 earlier ones
+    live_matches: int = 10  # matches in play at start-up, spread over the first half
+    events_per_minute: float = 0.05  # chance of an event in each match minute
+    latency_ms: float = 0.0  # mean injected latency per call (uniform 0..2x)
+    error_rate: float = 0.0  # share of calls failing with an injected 503
+    seed: int = 42
+    first_season: int = 2024  # year of the current season
+
+
+@dataclass(frozen=True)
+class _Slot:
+    """Position of one fixture in the generated schedule."""
+
+    league: int
+    season: int  # 0 = current, 1 = previous, ...
+    round: int
+    match: int
+
+
+class SyntheticProvider(FootballProvider):
+    """Double round-robin leagues with deterministic results, generated on demand.
+
+    The current season is half played: its middle round kicks off today, earlier
+    rounds are finished and later ones are scheduled weekly. The first
+    ``live_matches`` fixtures of today's round started in the last hour, so the
+    live feed has matches in play as soon as the provider starts.
+    """
+
+    def __init__(self, config: SyntheticConfig | None = None, now: datetime | None = None) -> None:
+        self.config = config or SyntheticConfig()
+        self._started = now or datetime.now(UTC)
+        self._now_override = now
+        self._rng = random.Random(self.config.seed)  # noqa: S311 – latency/error injection only
+        n = self.config.teams_per_league
+        self._slots_per_team = n if n % 2 else n - 1  # rounds in one half of the season
+        self._rounds = 2 * self._slots_per_team
+        self._matches_per_round = (n + n % 2) // 2  # odd leagues: one pairing per round is the bye
+        self._current_round = self._rounds // 2
+        today = self._started.replace(hour=15, minute=0, second=0, microsecond=0)
+        self._season_start = today - self._current_round * _WEEK
+
+    # ── Identity ──────────────────────────────────────────────────────────────
+    def _now(self) -> datetime:
+        return self._now_override or datetime.now(UTC)
+
+    def _season_year(self, season: int) -> str:
+        return str(self.config.first_season - season)
+
+    def _season_index(self, season: str) -> int | None:
+        try:
+            index = self.config.first_season - int(season)
+        except ValueError:
+            return None
+        return index if 0 <= index < self.config.seasons else None
+
+    @staticmethod
+    def _league_index(league_provider_id: str) -> int | None:
+        prefix, _, index = league_provider_id.rpartition("-")
+        return int(index) if prefix == "syn-lg" and index.isdigit() else None
+
+    def _league(self, league: int) -> ProviderLeague:
+        country = f"Country {league % 10}"
+        return ProviderLeague(f"syn-lg-{league}", f"Synthetic League {league}", country, self._season_year(0))
+
+    def _team(self, league: int, team: int) -> ProviderTeam:
+        name = (
+            f"{_CITIES[(league * 7 + team) % len(_CITIES)]} "
+            f"{_SUFFIXES[(league + team) % len(_SUFFIXES)]} {league}-{team}"
+        )
+        return ProviderTeam(
+            f"syn-t-{league}-{team}", name, f"S{team:02d}", f"Country {league % 10}", None, f"syn-lg-{league}"
+        )
+
+    # ── Schedule ──────────────────────────────────────────────────────────────
+    def _pairing(self, round_: int, match: int) -> tuple[int, int] | None:
+        """Circle-method pairing; ``None`` when one side is the bye of an odd league."""
+        n = self.config.teams_per_league
+        size = n + n % 2
+        half_round = round_ % (size - 1)
+        if match == 0:
+            home, away = size - 1, half_round
+        else:
+            home, away = (half_round + match) % (size - 1), (half_round - match) % (size - 1)
+        if half_round % 2:
+            home, away = away, home
+        if round_ >= size - 1:
+            home, away = away, home  # second half of the season: return fixtures
+        if home >= n or away >= n:
+            return None
+        return home, away
+
+    def _kickoff(self, slot: _Slot) -> datetime:
+        if slot.season == 0 and slot.round == self._current_round:
+            earlier = sum(self._pairing(slot.round, m) is not None for m in range(slot.match))
+            live_rank = slot.league * (self.config.teams_per_league // 2) + earlier
+            if live_rank < self.config.live_matches:
+                # Spread over the first half, so nothing reaches full time for a while
+                return self._started - timedelta(minutes=1 + live_rank * 40 // max(1, self.config.live_matches))
+        start = self._season_start - timedelta(days=365 * slot.season)
+        # Everything else in a round is spread over the three days after its start
+        return start + slot.round * _WEEK + timedelta(days=1 + slot.match % 3)
+
+    def _slot(self, fixture_provider_id: str) -> _Slot | None:
+        parts = fixture_provider_id.split("-")
+        if len(parts) != 6 or parts[:2] != ["syn", "fx"] or not all(p.isdigit() for p in parts[2:]):
+            return None
+        slot = _Slot(*(int(p) for p in parts[2:]))
+        if (
+            slot.league >= self.config.leagues
+            or slot.season >= self.config.seasons
+            or slot.round >= self._rounds
+            or slot.match >= self._matches_per_round
+            or self._pairing(slot.round, slot.match) is None
+        ):
+            return None
+        return slot
+
+    def _slots(self, leagues: Sequence[int], seasons: Sequence[int], rounds: Sequence[int]) -> Iterator[_Slot]:
+        for league in leagues:
+            for season in seasons:
+                for round_ in rounds:
+                    for match in range(self._matches_per_round):
+                        if self._pairing(round_, match) is not None:
+                            yield _Slot(league, season, round_, match)
+
+    def _rounds_between(self, season: int, from_date: datetime, to_date: datetime) -> range:
+        start = self._season_start - timedelta(days=365 * season)
+        # Widened by a round on each side to cover kick-offs shifted within the week
+        first = max(0, (from_date - start) // _WEEK - 1)
+        last = min(self._rounds - 1, (to_date - start) // _WEEK + 1)
+        return range(first, last + 1)
+
+    # ── Match state ───────────────────────────────────────────────────────────
+    def _match_rng(self, slot: _Slot) -> random.Random:
+        digest = hashlib.blake2b(f"{self.config.seed}:{slot}".encode(), digest_size=8).digest()
+        return random.Random(int.from_bytes(digest))  # noqa: S311
+
+    @staticmethod
+    def _status(elapsed_minutes: float) -> tuple[str, int]:
+        """Short status and match minute ``elapsed_minutes`` after kick-off."""
+        if elapsed_minutes < 0:
+            return "NS", 0
+        if elapsed_minutes < 45:
+            return "1H", int(elapsed_minutes) + 1
+        if elapsed_minutes < 60:
+            return "HT", 45
+        if elapsed_minutes < 105:
+            return "2H", int(elapsed_minutes) - 14
+        return "FT", _MATCH_MINUTES
+
+    def _events(self, slot: _Slot, minute: int) -> list[ProviderEvent]:
+        pairing = self._pairing(slot.round, slot.match)
+        assert pairing is not None
+        rng = self._match_rng(slot)
+        fixture_id = self._fixture_id(slot)
+        events = []
+        # Draw for all 90 minutes so earlier events never change as the match goes on
+        for m in range(1, _MATCH_MINUTES + 1):
+            happens = rng.random() < self.config.events_per_minute
+            side, kind, player = rng.randrange(2), rng.choice(_EVENT_TYPES), rng.randrange(1, 24)
+            if happens and m <= minute:
+                team = pairing[side]
+                detail = {"goal": "Normal Goal", "card": "Yellow Card", "subst": f"Substitution {player}"}[kind]
+                events.append(
+                    ProviderEvent(
+                        fixture_id,
+                        kind,
+                        m,
+                        f"syn-t-{slot.league}-{team}",
+                        f"Player {slot.league}-{team}-{player}",
+                        {"detail": detail},
+                    )
+                )
+        return events
+
+    @staticmethod
+    def _fixture_id(slot: _Slot) -> str:
+        return f"syn-fx-{slot.league}-{slot.season}-{slot.round}-{slot.match}"
+
+    def _fixture(self, slot: _Slot) -> tuple[ProviderFixture, int]:
+        home, away = self._pairing(slot.round, slot.match) or (0, 0)
+        kickoff = self._kickoff(slot)
+        status, minute = self._status((self._now() - kickoff).total_seconds() / 60)
+        home_score = away_score = None
+        if status != "NS":
+            goals = [e for e in self._events(slot, minute) if e.type == "goal"]
+            home_score = sum(e.team_provider_id == f"syn-t-{slot.league}-{home}" for e in goals)
+            away_score = len(goals) - home_score
+        fixture = ProviderFixture(
+            self._fixture_id(slot),
+            f"syn-lg-{slot.league}",
+            self._season_year(slot.season),
+            f"syn-t-{slot.league}-{home}",
+            f"syn-t-{slot.league}-{away}",
+            kickoff,
+            status,
+            home_score,
+            away_score,
+        )
+        return fixture, minute
+
+    # ── Fault injection ───────────────────────────────────────────────────────
+    async def _call(self, endpoint: str) -> None:
+        if self.config.latency_ms > 0:
+            await asyncio.sleep(self._rng.uniform(0, 2 * self.config.latency_ms) / 1000)
+        if self.config.error_rate > 0 and self._rng.random() < self.config.error_rate:
+            request = httpx.Request("GET", f"https://synthetic.invalid/{endpoint}")
+            raise httpx.HTTPStatusError(
+                "injected failure", request=request, response=httpx.Response(503, request=request)
+            )
+
+    # ── FootballProvider ──────────────────────────────────────────────────────
+    async def get_leagues(self, country: str | None = None, season: str | None = None) -> list[ProviderLeague]:
+        await self._call("leagues")
+        leagues = [self._league(lg) for lg in range(self.config.leagues)]
+        if country:
+            leagues = [lg for lg in leagues if lg.country.lower() == country.lower()]
+        if season:
+            leagues = [lg for lg in leagues if lg.season == season]
+        return leagues
+
+    async def get_teams(self, league_provider_id: str) -> list[ProviderTeam]:
+        await self._call("teams")
+        league = self._league_index(league_provider_id)
+        if league is None or league >= self.config.leagues:
+            return []
+        return [self._team(league, team) for team in range(self.config.teams_per_league)]
+
+    async def search_teams(self, query: str, limit: int = 10) -> list[ProviderTeam]:
+        await self._call("teams/search")
+        q = query.lower()
+        results = []
+        for league in range(self.config.leagues):
+            for team in range(self.config.teams_per_league):
+                candidate = self._team(league, team)
+                if q in candidate.name.lower():
+                    results.append(candidate)
+                    if len(results) >= limit:
+                        return results
+        return results
+
+    async def get_fixtures(
+        self, team_provider_id: str, from_date: datetime, to_date: datetime
+    ) -> list[ProviderFixture]:
+        await self._call("fixtures")
+        _, _, rest = team_provider_id.partition("syn-t-")
+        league, _, team = rest.partition("-")
+        if not (league.isdigit() and team.isdigit()):
+            return []
+        return [
+            f
+            for f in self._window(int(league), range(self.config.seasons), from_date, to_date)
+            if team_provider_id in (f.home_team_provider_id, f.away_team_provider_id)
+        ]
+
+    async def get_league_fixtures(
+        self, league_provider_id: str, season: str, from_date: datetime, to_date: datetime
+    ) -> list[ProviderFixture]:
+        await self._call("fixtures")
+        league, season_index = self._league_index(league_provider_id), self._season_index(season)
+        if league is None or season_index is None:
+            return []
+        return self._window(league, [season_index], from_date, to_date)
+
+    def _window(
+        self, league: int, seasons: Sequence[int], from_date: datetime, to_date: datetime
+    ) -> list[ProviderFixture]:
+        if league >= self.config.leagues:
+            return []
+        fixtures = []
+        for season in seasons:
+            for slot in self._slots([league], [season], self._rounds_between(season, from_date, to_date)):
+                if from_date <= self._kickoff(slot) <= to_date:
+                    fixtures.append(self._fixture(slot)[0])
+        return fixtures
+
+    async def get_fixtures_by_ids(self, fixture_provider_ids: Sequence[str]) -> list[ProviderFixture]:
+        await self._call("fixtures")
+        slots = [slot for pid in dict.fromkeys(fixture_provider_ids) if (slot := self._slot(pid)) is not None]
+        return [self._fixture(slot)[0] for slot in slots]
+
+    async def get_live_fixtures(self, league_provider_ids: Sequence[str] | None = None) -> list[ProviderLiveFixture]:
+        await self._call("fixtures/live")
+        leagues: Sequence[int] = range(self.config.leagues)
+        if league_provider_ids is not None:
+            wanted = {self._league_index(pid) for pid in league_provider_ids}
+            leagues = [lg for lg in leagues if lg in wanted]
+        live = []
+        for slot in self._slots(leagues, [0], [self._current_round]):
+            fixture, minute = self._fixture(slot)
+            if fixture.status in LIVE_STATUSES:
+                live.append(ProviderLiveFixture(fixture, self._events(slot, minute)))
+        return live
+
+    async def get_events(self, fixture_provider_id: str) -> list[ProviderEvent]:
+        await self._call("fixtures/events")
+        slot = self._slot(fixture_provider_id)
+        if slot is None:
+            return []
+        fixture, minute = self._fixture(slot)
+        return self._events(slot, minute) if fixture.status != "NS" else []
+
+    async def get_standings(self, league_provider_id: str, season: str) -> list[ProviderStanding]:
+        await self._call("standings")
+        league, season_index = self._league_index(league_provider_id), self._season_index(season)
+        if league is None or season_index is None or league >= self.config.leagues:
+            return []
+        table = {
+            team: ProviderStanding(league_provider_id, season, f"syn-t-{league}-{team}", 0)
+            for team in range(self.config.teams_per_league)
+        }
+        for slot in self._slots([league], [season_index], range(self._rounds)):
+            fixture, _ = self._fixture(slot)
+            if fixture.status != "FT" or fixture.home_score is None or fixture.away_score is None:
+                continue
+            home, away = self._pairing(slot.round, slot.match) or (0, 0)
+            sides = ((home, fixture.home_score, fixture.away_score), (away, fixture.away_score, fixture.home_score))
+            for team, scored, conceded in sides:
+                row = table[team]
+                row.played += 1
+                row.goals_for += scored
+                row.goals_against += conceded
+                row.goal_diff = row.goals_for - row.goals_against
+                if scored > conceded:
+                    row.wins += 1
+                elif scored == conceded:
+                    row.draws += 1
+                else:
+                    row.losses += 1
+                row.points = 3 * row.wins + row.draws
+        ranked = sorted(table.values(), key=lambda r: (-r.points, -r.goal_diff, -r.goals_for, r.team_provider_id))
+        for rank, row in enumerate(ranked, start=1):
+            row.rank = rank
+        return ranked
@@ -0,0 +1,103 @@
+"""The default window of ``GET /teams/{id}/fixtures``, cached per team.
+
+Without ``from``/``to`` the endpoint lists a team's fixtures from 30 days ago
+to 30 days ahead. The cached window reaches a TTL further ahead than that, so
+each request can cut its own exact window out of it until the entry expires.
+"""
+
+from __future__ import annotations
+
+import bisect
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import orjson
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.db.models import Fixture
+from app.schemas.fixtures import FixtureOut
+from app.services.cache import cache_get, cache_set
+
+log = get_logger("team_fixtures")
+
+TEAM_FIXTURES_WINDOW_DAYS = 30
+
+
+def team_fixtures_key(team_id: str) -> str:
+    return f"fixtures:team:{team_id}"
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite drops tzinfo on read; Postgres returns aware datetimes
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
+
+
+async def build_team_fixture_windows(
+    db: AsyncSession, team_ids: Sequence[str], now: datetime
+) -> dict[str, dict[str, Any]]:
+    """``team_id -> {"kickoffs": [...], "items": [FixtureOut, ...]}`` from one query for all teams."""
+    window = timedelta(days=TEAM_FIXTURES_WINDOW_DAYS)
+    ttl = timedelta(seconds=get_settings().team_fixtures_ttl_seconds)
+    result = await db.execute(
+        select(Fixture)
+        .options(selectinload(Fixture.home_team), selectinload(Fixture.away_team))
+        .where(
+            or_(Fixture.home_team_id.in_(team_ids), Fixture.away_team_id.in_(team_ids)),
+            Fixture.start_time >= now - window,
+            Fixture.start_time <= now + window + ttl,
+        )
+        .order_by(Fixture.start_time)
+    )
+    windows: dict[str, dict[str, Any]] = {t: {"kickoffs": [], "items": []} for t in team_ids}
+    for fixture in result.scalars():
+        kickoff = _as_utc(fixture.start_time).timestamp()
+        item = FixtureOut.model_validate(fixture).model_dump(mode="json")
+        for team_id in {fixture.home_team_id, fixture.away_team_id}:
+            if (entry := windows.get(team_id)) is not None:
+                entry["kickoffs"].append(kickoff)
+                entry["items"].append(item)
+    return windows
+
+
+def team_fixtures_page(window: dict[str, Any], now: datetime, page: int, page_size: int) -> bytes:
+    """Serialize one ``PaginatedResponse[FixtureOut]`` page of the default window around ``now``."""
+    span = timedelta(days=TEAM_FIXTURES_WINDOW_DAYS)
+    kickoffs = window["kickoffs"]
+    lo = bisect.bisect_left(kickoffs, (now - span).timestamp())
+    hi = bisect.bisect_right(kickoffs, (now + span).timestamp())
+    offset = lo + (page - 1) * page_size
+    total = hi - lo
+    return orjson.dumps(
+        {
+            "items": window["items"][offset : min(offset + page_size, hi)],
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "has_next": (page - 1) * page_size + page_size < total,
+        }
+    )
+
+
+async def get_team_fixture_window(
+    db: AsyncSession, team_id: str, *, client: aioredis.Redis | None = None
+) -> dict[str, Any]:
+    key = team_fixtures_key(team_id)
+    try:
+        window: dict[str, Any] | None = await cache_get(key, client=client)
+    except RedisError as exc:
+        log.warning("Cache unavailable, reading fixtures uncached", team_id=team_id, error=str(exc))
+        return (await build_team_fixture_windows(db, [team_id], datetime.now(UTC)))[team_id]
+    if window is None:
+        window = (await build_team_fixture_windows(db, [team_id], datetime.now(UTC)))[team_id]
+        try:
+            await cache_set(key, window, get_settings().team_fixtures_ttl_seconds, client=client)
+        except RedisError as exc:
+            log.warning("Team fixtures not cached", team_id=team_id, error=str(exc))
+    return window
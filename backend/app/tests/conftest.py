@@ -6,12 +6,16 @@ from collections.abc import AsyncGenerator
 
 import pytest
 import pytest_asyncio
+import redis.asyncio as aioredis
 from httpx import ASGITransport, AsyncClient
+from redis.exceptions import RedisError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from app.core.config import get_settings
 from app.db.models import Base
 from app.db.session import get_db
 from app.main import app as fastapi_app
+from app.services import cache
 from app.services.factory import get_provider
 from app.services.mock_provider import MockProvider
 
@@ -57,6 +61,22 @@ async def client(db: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     fastapi_app.dependency_overrides.clear()
 
 
+@pytest_asyncio.fixture
+async def redis_client(monkeypatch: pytest.MonkeyPatch) -> AsyncGenerator[aioredis.Redis, None]:
+    """The configured Redis (CI runs one) behind a fresh pool; skips the test if it is unreachable."""
+    pool = aioredis.ConnectionPool.from_url(get_settings().redis_url, decode_responses=True)
+    monkeypatch.setattr(cache, "_pool", pool)
+    client = aioredis.Redis(connection_pool=pool)
+    try:
+        await client.ping()
+    except RedisError:
+        await pool.disconnect()
+        pytest.skip("Redis is not reachable")
+    yield client
+    await client.aclose()
+    await pool.disconnect()
+
+
 @pytest.fixture
 def mock_provider() -> MockProvider:
     return MockProvider()
@@ -0,0 +1,157 @@
+"""Tests for ApiFootballProvider against a local stand-in HTTP server."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass, field
+from urllib.parse import unquote
+
+import pytest
+import pytest_asyncio
+
+from app.services.api_football import ApiFootballProvider
+from app.services.provider_cache import MemoryResponseStore
+
+STANDINGS_BODY = {
+    "response": [
+        {
+            "league": {
+                "standings": [
+                    [
+                        {
+                            "rank": 1,
+                            "team": {"id": 50},
+                            "points": 64,
+                            "goalsDiff": 37,
+                            "all": {"played": 28, "win": 20, "draw": 4, "lose": 4, "goals": {"for": 65, "against": 28}},
+                        }
+                    ]
+                ]
+            }
+        }
+    ]
+}
+
+
+@dataclass
+class StandInServer:
+    """Minimal HTTP/1.1 keep-alive server that counts TCP connections and requests."""
+
+    body: bytes = json.dumps(STANDINGS_BODY).encode()
+    etag: str | None = None
+    connections: int = 0
+    paths: list[str] = field(default_factory=list)
+    not_modified: int = 0
+    base_url: str = ""
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            while request_line := await reader.readline():
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b""):
+                    name, _, value = line.decode().partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                self.paths.append(request_line.split()[1].decode())
+                if self.etag and headers.get("if-none-match") == self.etag:
+                    self.not_modified += 1
+                    writer.write(b"HTTP/1.1 304 Not Modified\r\nContent-Length: 0\r\n\r\n")
+                    await writer.drain()
+                    continue
+                etag_header = f"ETag: {self.etag}\r\n" if self.etag else ""
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"{etag_header}Content-Length: {len(self.body)}\r\n\r\n".encode()
+                    + self.body
+                )
+                await writer.drain()
+        finally:
+            writer.close()
+
+
+@pytest_asyncio.fixture
+async def stand_in() -> AsyncGenerator[StandInServer, None]:
+    server = StandInServer()
+    tcp = await asyncio.start_server(server.handle, "127.0.0.1", 0)
+    port = tcp.sockets[0].getsockname()[1]
+    server.base_url = f"http://127.0.0.1:{port}"
+    async with tcp:
+        yield server
+        tcp.close()
+
+
+@pytest.mark.asyncio
+async def test_requests_reuse_one_pooled_connection(stand_in: StandInServer) -> None:
+    provider = ApiFootballProvider("test-key", base_url=stand_in.base_url)
+    try:
+        for _ in range(5):
+            standings = await provider.get_standings("39", "2024")
+    finally:
+        await provider.aclose()
+
+    assert standings[0].team_provider_id == "50"
+    assert standings[0].points == 64
+    assert len(stand_in.paths) == 5
+    assert stand_in.connections == 1
+
+
+@pytest.mark.asyncio
+async def test_client_is_recreated_after_close(stand_in: StandInServer) -> None:
+    provider = ApiFootballProvider("test-key", base_url=stand_in.base_url)
+    await provider.get_standings("39", "2024")
+    await provider.aclose()
+    await provider.get_standings("39", "2024")
+    await provider.aclose()
+
+    assert stand_in.connections == 2
+
+
+def test_endpoint_timeouts_override_defaults() -> None:
+    provider = ApiFootballProvider("k", timeout=20.0, endpoint_timeouts={"/standings": 30.0})
+    assert provider._endpoint_timeouts["/standings"] == 30.0
+    assert provider._endpoint_timeouts["/fixtures/events"] == ApiFootballProvider.ENDPOINT_TIMEOUTS["/fixtures/events"]
+
+
+@pytest.mark.asyncio
+async def test_conditional_requests_reuse_body_on_304(stand_in: StandInServer) -> None:
+    stand_in.etag = '"v1"'
+    provider = ApiFootballProvider("test-key", base_url=stand_in.base_url, validator_store=MemoryResponseStore())
+    try:
+        first = await provider.get_standings("39", "2024")
+        second = await provider.get_standings("39", "2024")
+    finally:
+        await provider.aclose()
+
+    assert second == first
+    assert stand_in.not_modified == 1
+    assert provider.stats() == {"http": {"requests": 2, "not_modified": 1, "parsed_in_thread": 0}}
+
+
+@pytest.mark.asyncio
+async def test_fixtures_by_ids_are_fetched_in_chunks(stand_in: StandInServer) -> None:
+    stand_in.body = json.dumps({"response": []}).encode()
+    provider = ApiFootballProvider("test-key", base_url=stand_in.base_url)
+    try:
+        await provider.get_fixtures_by_ids([str(n) for n in range(45)])
+    finally:
+        await provider.aclose()
+
+    ids = sorted(unquote(path.split("ids=")[1]) for path in stand_in.paths)
+    assert [len(chunk.split("-")) for chunk in ids] == [20, 20, 5]
+
+
+@pytest.mark.asyncio
+async def test_large_responses_are_parsed_in_a_thread(stand_in: StandInServer) -> None:
+    inline = ApiFootballProvider("test-key", base_url=stand_in.base_url, parse_offload_bytes=0)
+    offloaded = ApiFootballProvider("test-key", base_url=stand_in.base_url, parse_offload_bytes=len(stand_in.body))
+    try:
+        expected = await inline.get_standings("39", "2024")
+        assert await offloaded.get_standings("39", "2024") == expected
+    finally:
+        await inline.aclose()
+        await offloaded.aclose()
+
+    assert inline.stats()["http"]["parsed_in_thread"] == 0
+    assert offloaded.stats()["http"]["parsed_in_thread"] == 1
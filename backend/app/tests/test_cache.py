@@ -0,0 +1,397 @@
+"""Tests for the in-process cache layer in front of Redis."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+from collections.abc import AsyncGenerator, Generator
+from dataclasses import dataclass
+
+import pytest
+import redis.asyncio as aioredis
+from httpx import AsyncClient
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.db.models import League, Team
+from app.db.session import get_db
+from app.main import app as fastapi_app
+from app.services import cache, dashboard
+from app.services.cache import (
+    LocalCache,
+    apply_invalidation,
+    cache_delete,
+    cache_delete_many,
+    cache_generation,
+    cache_get,
+    cache_get_many,
+    cache_get_or_compute,
+    cache_set,
+    cache_set_many,
+    versioned_key,
+)
+from app.services.cache_metrics import CacheMetrics, CacheTierStats, Histogram, key_family
+from app.services.standings import standings_key
+
+
+@dataclass
+class FakeClock:
+    now: float = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def l1(monkeypatch: pytest.MonkeyPatch) -> Generator[LocalCache, None, None]:
+    local = LocalCache(max_entries=8, ttl_seconds=5)
+    monkeypatch.setattr(cache, "_l1", local)
+    yield local
+
+
+def _key(family: str) -> str:
+    """A key no other test (or a local dev instance) uses; entries are left to expire."""
+    return f"{family}:{uuid.uuid4().hex}"
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    local = LocalCache(max_entries=2, ttl_seconds=60)
+    local.set("a", 1)
+    local.set("b", 2)
+    assert local.get("a") == 1  # "b" is now the least recently used
+    local.set("c", 3)
+
+    assert local.get("b") is cache._MISSING
+    assert (local.get("a"), local.get("c")) == (1, 3)
+
+
+def test_entries_expire_and_none_is_a_value() -> None:
+    clock = FakeClock()
+    local = LocalCache(max_entries=8, ttl_seconds=5, clock=clock)
+    local.set("standings:l1:2024", None)
+    assert local.get("standings:l1:2024") is None
+
+    clock.now = 5
+    assert local.get("standings:l1:2024") is cache._MISSING
+    assert len(local) == 0
+
+
+@pytest.mark.asyncio
+async def test_local_hits_hand_out_fresh_copies(l1: LocalCache) -> None:
+    l1.set("dashboard:u1:g0:follows", '["t1"]')
+    follows: list[str] | None = await cache_get("dashboard:u1:g0:follows")
+    assert follows is not None
+    follows.append("t2")
+    assert await cache_get("dashboard:u1:g0:follows") == ["t1"]
+
+
+@pytest.mark.asyncio
+async def test_writes_are_announced_even_without_a_local_cache(
+    redis_client: aioredis.Redis, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(get_settings(), "cache_l1_max_entries", 0)  # like the sync worker
+    monkeypatch.setattr(cache, "_l1", None)
+    key = _key("standings")
+    async with redis_client.pubsub() as pubsub:
+        await pubsub.subscribe(cache.INVALIDATION_CHANNEL)
+        await cache_set(key, [], 60)
+        await cache_delete(key)
+        messages: list[str] = []
+        while len(messages) < 2 and (message := await pubsub.get_message(timeout=1)) is not None:
+            if message["type"] == "message":
+                messages.append(message["data"])
+    assert messages == [f"{cache._ORIGIN} key {key}"] * 2
+
+
+def test_invalidations_from_other_processes_drop_entries(l1: LocalCache) -> None:
+    for key in ("dashboard:u1:7:7", "dashboard:u1:0:14", "dashboard:u2:7:7", "standings:l1:2024"):
+        l1.set(key, [])
+
+    apply_invalidation("other-process key standings:l1:2024")
+    apply_invalidation("other-process pattern dashboard:u1:*")
+    assert len(l1) == 1 and l1.get("dashboard:u2:7:7") == []
+
+    apply_invalidation(f"{cache._ORIGIN} key dashboard:u2:7:7")  # our own write: already applied
+    assert len(l1) == 1
+
+
+@pytest.mark.asyncio
+async def test_versioned_keys_embed_the_namespace_generation(l1: LocalCache) -> None:
+    l1.set("cache:gen:dashboard:u1", 3)
+    assert await versioned_key("dashboard:u1", 7, 14) == "dashboard:u1:g3:7:14"
+
+    apply_invalidation("other-process key cache:gen:dashboard:u1")  # another worker bumped it
+    assert l1.get("cache:gen:dashboard:u1") is cache._MISSING
+
+
+@pytest.mark.asyncio
+async def test_follow_and_unfollow_start_a_new_dashboard_generation(
+    client: AsyncClient, db: AsyncSession, l1: LocalCache, redis_client: aioredis.Redis
+) -> None:
+    db.add(League(id="gen-league", provider_league_id="gen-lg", name="Gen League", country="X", season="2024"))
+    db.add(Team(id="gen-team", provider_team_id="gen-t", name="Gen FC", league_id="gen-league"))
+    await db.flush()
+    user_id = f"gen-user-{uuid.uuid4().hex}"
+    login = await client.post("/v1/auth/dev-login", json={"user_id": user_id})
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    namespace = f"dashboard:{user_id}"
+    assert (await client.get("/v1/me/dashboard", headers=headers)).json() == []  # caches the empty follow list
+    before = await versioned_key(namespace, "follows")
+    assert await cache_get(before) == []
+
+    assert (await client.post("/v1/me/follows", json={"team_id": "gen-team"}, headers=headers)).status_code == 201
+    after_follow = await versioned_key(namespace, "follows")
+    assert (await cache_generation(namespace), await cache_get(after_follow)) == (1, None)
+    entries = (await client.get("/v1/me/dashboard", headers=headers)).json()
+    assert [entry["team"]["id"] for entry in entries] == ["gen-team"]
+
+    assert (await client.delete("/v1/me/follows/gen-team", headers=headers)).status_code == 200
+    assert (await cache_generation(namespace), await cache_get(await versioned_key(namespace, "follows"))) == (2, None)
+    assert (await client.get("/v1/me/dashboard", headers=headers)).json() == []
+
+
+@pytest.mark.asyncio
+async def test_a_dashboard_read_racing_a_follow_is_not_cached_past_it(
+    client: AsyncClient, db: AsyncSession, l1: LocalCache, redis_client: aioredis.Redis, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    suffix = uuid.uuid4().hex
+    db.add(League(id=f"race-{suffix}", provider_league_id=f"race-{suffix}", name="Race", country="X", season="2024"))
+    db.add(Team(id=f"race-{suffix}", provider_team_id=f"race-{suffix}", name="Race FC", league_id=f"race-{suffix}"))
+    await db.flush()
+    login = await client.post("/v1/auth/dev-login", json={"user_id": f"race-user-{suffix}"})
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+    async def committing_db() -> AsyncGenerator[AsyncSession, None]:
+        yield db
+        await db.commit()  # as get_db does once the endpoint returns
+
+    commit, raced = db.commit, False
+
+    async def commit_after_a_concurrent_read() -> None:
+        nonlocal raced
+
+        async def committed_follows(db: AsyncSession, user_id: str) -> list[str]:
+            return []  # what another connection sees until the follow commits
+
+        if not raced:
+            raced = True
+            with monkeypatch.context() as patch:
+                patch.setattr(dashboard, "_query_followed_team_ids", committed_follows)
+                assert (await client.get("/v1/me/dashboard", headers=headers)).json() == []
+        await commit()
+
+    fastapi_app.dependency_overrides[get_db] = committing_db  # the client fixture clears overrides
+    monkeypatch.setattr(db, "commit", commit_after_a_concurrent_read)
+    assert (await client.post("/v1/me/follows", json={"team_id": f"race-{suffix}"}, headers=headers)).status_code == 201
+
+    entries = (await client.get("/v1/me/dashboard", headers=headers)).json()
+    assert [entry["team"]["id"] for entry in entries] == [f"race-{suffix}"]
+
+
+@pytest.mark.asyncio
+async def test_standings_hits_are_served_byte_for_byte(
+    client: AsyncClient, l1: LocalCache, redis_client: aioredis.Redis
+) -> None:
+    league_id = f"bytes-{uuid.uuid4().hex}"
+    # Spacing no serializer would produce: anything re-encoded on the way out would differ
+    body = b'[ {"rank" : 1,  "team_id":"t1"} ]'
+    await redis_client.set(
+        standings_key(league_id, "2024"), cache._Entry(time.time() + 300, 0.01, body).encode(), ex=60
+    )
+    login = await client.post("/v1/auth/dev-login", json={"user_id": "bytes-user"})
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+    response = await client.get(f"/v1/leagues/{league_id}/standings?season=2024", headers=headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.content == body
+
+
+@pytest.mark.asyncio
+async def test_get_or_compute_serves_a_fresh_entry_without_computing(l1: LocalCache) -> None:
+    l1.set("standings:l1:2024", cache._Entry(time.time() + 300, 0.01, b'[{"rank":1}]'))
+
+    async def compute() -> bytes:
+        raise AssertionError("fresh entries are not recomputed")
+
+    assert await cache_get_or_compute("standings:l1:2024", compute) == b'[{"rank":1}]'
+
+
+@pytest.mark.asyncio
+async def test_get_or_compute_falls_back_to_computing_without_redis(
+    l1: LocalCache, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(cache, "_pool", aioredis.ConnectionPool.from_url("redis://127.0.0.1:1/0"))
+    calls = 0
+
+    async def compute() -> bytes:
+        nonlocal calls
+        calls += 1
+        return b'[{"rank":1}]'
+
+    assert await cache_get_or_compute("standings:l1:2024", compute) == b'[{"rank":1}]'
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_compute_once(l1: LocalCache, redis_client: aioredis.Redis) -> None:
+    key = _key("standings")
+    calls = 0
+
+    async def compute() -> bytes:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.1)  # the others wait on the lock meanwhile
+        return b'[{"rank":1}]'
+
+    bodies = await asyncio.gather(*(cache_get_or_compute(key, compute, 60) for _ in range(5)))
+
+    assert bodies == [b'[{"rank":1}]'] * 5
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_served_while_another_caller_recomputes(
+    l1: LocalCache, redis_client: aioredis.Redis, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    metrics = CacheMetrics()
+    monkeypatch.setattr(cache, "_metrics", metrics)
+    key = _key("standings")
+    await redis_client.set(key, cache._Entry(time.time() - 5, 0.01, b"old").encode(), ex=60)
+    await redis_client.set(f"lock:{key}", "another-process", px=cache.RECOMPUTE_LOCK_MS)
+
+    async def compute() -> bytes:
+        raise AssertionError("the lock holder recomputes")
+
+    assert await cache_get_or_compute(key, compute, 60, grace_seconds=30) == b"old"
+    assert metrics.for_key(key).stale_served == 1
+
+
+@pytest.mark.asyncio
+async def test_entries_near_expiry_are_recomputed_early(
+    l1: LocalCache, redis_client: aioredis.Redis, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    metrics = CacheMetrics()
+    monkeypatch.setattr(cache, "_metrics", metrics)
+    monkeypatch.setattr("app.services.cache.random.random", lambda: 0.5)
+    key = _key("standings")
+    # 2s left, but the last computation took 10s: XFetch refreshes now
+    await redis_client.set(key, cache._Entry(time.time() + 2, 10.0, b"old").encode(), ex=60)
+
+    async def compute() -> bytes:
+        return b"new"
+
+    assert await cache_get_or_compute(key, compute, 60) == b"new"
+    assert metrics.for_key(key).early_recomputes == 1
+    assert cache._Entry.decode(await redis_client.get(key)).body == b"new"
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_raised_by_compute_are_not_retried(l1: LocalCache, redis_client: aioredis.Redis) -> None:
+    key = _key("dashboard")
+    calls = 0
+
+    async def compute() -> bytes:
+        nonlocal calls
+        calls += 1
+        raise RedisError("a cache read inside compute failed")
+
+    with pytest.raises(RedisError):
+        await cache_get_or_compute(key, compute, 60)
+    assert calls == 1
+    assert not await redis_client.exists(f"lock:{key}")  # released for the next caller
+
+
+@pytest.mark.asyncio
+async def test_get_many_reads_only_l1_misses_from_redis(l1: LocalCache, monkeypatch: pytest.MonkeyPatch) -> None:
+    l1.set("standings:l1:2024", '[{"rank": 1}]')
+    l1.set("standings:l2:2024", "null")
+    assert await cache_get_many(["standings:l1:2024", "standings:l2:2024", "standings:l1:2024"]) == {
+        "standings:l1:2024": [{"rank": 1}],
+        "standings:l2:2024": None,
+    }
+
+    monkeypatch.setattr(cache, "_pool", aioredis.ConnectionPool.from_url("redis://127.0.0.1:1/0"))
+    with pytest.raises(RedisError):
+        await cache_get_many(["standings:l1:2024", "standings:l3:2024"])
+
+
+@pytest.mark.asyncio
+async def test_set_many_applies_per_key_ttls(l1: LocalCache, redis_client: aioredis.Redis) -> None:
+    short, long, default = _key("standings"), _key("standings"), _key("standings")
+    await cache_set_many({short: [1], long: [2], default: [3]}, {short: 30, long: 600})
+
+    assert 0 < await redis_client.ttl(short) <= 30
+    assert 30 < await redis_client.ttl(long) <= 600
+    assert 0 < await redis_client.ttl(default) <= get_settings().redis_cache_ttl_seconds
+    assert await cache_get_many([short, long, default]) == {short: [1], long: [2], default: [3]}
+
+
+@pytest.mark.asyncio
+async def test_delete_many_clears_redis_and_the_local_cache(l1: LocalCache, redis_client: aioredis.Redis) -> None:
+    keys = [_key("dashboard"), _key("dashboard")]
+    await cache_set_many({key: {"n": n} for n, key in enumerate(keys)}, 60)
+    assert all(l1.get(key) is not cache._MISSING for key in keys)
+
+    await cache_delete_many([*keys, keys[0]])
+
+    assert await redis_client.exists(*keys) == 0
+    assert all(l1.get(key) is cache._MISSING for key in keys)
+
+
+def test_entries_round_trip_through_their_redis_encoding() -> None:
+    entry = cache._Entry(1_700_000_000.25, 0.125, '[{"team":"Atlético"}]\n'.encode())
+    assert cache._Entry.decode(entry.encode()) == entry
+
+
+def test_hit_ratios() -> None:
+    assert CacheTierStats().summary()["l1_hit_ratio"] is None
+    summary = CacheTierStats(l1_hits=6, l2_hits=3, misses=1).summary()
+    assert (summary["lookups"], summary["l1_hit_ratio"], summary["l2_hit_ratio"]) == (10, 0.6, 0.3)
+
+
+# ── Metrics ───────────────────────────────────────────────────────────────────
+
+
+def test_keys_are_grouped_into_families() -> None:
+    assert key_family("standings:0b6e-league:2024") == "standings"
+    assert key_family("dashboard:team:7f3a-team") == "dashboard:team"
+    assert key_family("dashboard:9c1d-user:g3:follows") == "dashboard"
+    assert key_family("cache:gen:dashboard:9c1d-user") == "cache:gen"
+
+
+def test_histogram_quantiles_are_bucket_upper_bounds() -> None:
+    histogram = Histogram((1.0, 5.0, 10.0))
+    for value in (0.4, 0.9, 3.0, 4.0, 7.0, 12.0):
+        histogram.observe(value)
+    assert histogram.counts == [2, 2, 1, 1]
+    assert (histogram.quantile(0.5), histogram.quantile(0.8), histogram.quantile(0.99)) == (5.0, 10.0, None)
+    assert histogram.summary()["buckets"] == {"le_1": 2, "le_5": 2, "le_10": 1, "inf": 1}
+
+
+@pytest.mark.asyncio
+async def test_metrics_are_kept_per_family(monkeypatch: pytest.MonkeyPatch) -> None:
+    metrics = CacheMetrics()
+    monkeypatch.setattr(cache, "_metrics", metrics)
+    clock = FakeClock()
+    monkeypatch.setattr(cache, "_l1", LocalCache(max_entries=2, ttl_seconds=5, clock=clock, metrics=metrics))
+    local = cache.get_local_cache()
+    assert local is not None
+    local.set("standings:l1:2024", "[]")
+    local.set("dashboard:team:t1", "{}")
+    local.set("dashboard:team:t2", "{}")  # evicts the standings table
+    await cache_get_many(["dashboard:team:t1", "dashboard:team:t2"])
+    clock.now = 5
+    assert local.get("dashboard:team:t1") is cache._MISSING
+
+    monkeypatch.setattr(cache, "_pool", aioredis.ConnectionPool.from_url("redis://127.0.0.1:1/0"))
+    with pytest.raises(RedisError):
+        await cache_get_many(["standings:l1:2024", "dashboard:team:t3"])
+
+    fragments, standings = metrics.families["dashboard:team"], metrics.families["standings"]
+    assert (fragments.l1_hits, fragments.l1_expirations, fragments.errors) == (2, 1, 1)
+    assert (standings.l1_evictions, standings.errors, standings.latency_ms) == (1, 1, {})
+    assert metrics.totals().summary()["l1_hits"] == 2
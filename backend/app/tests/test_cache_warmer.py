@@ -0,0 +1,173 @@
+"""Tests for what sync publishes and the entries the cache warmer rebuilds."""
+
+from __future__ import annotations
+
+import time
+import uuid
+from collections.abc import Generator
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+
+import orjson
+import pytest
+import redis.asyncio as aioredis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import Fixture, Follow, League, Team, User
+from app.services import cache, sync
+from app.services.cache import LocalCache, cache_set_many
+from app.services.cache_warmer import ChangeSet, WarmResult
+from app.services.dashboard import team_fragment_key
+from app.services.mock_provider import MockProvider
+from app.services.provider import ProviderStanding
+from app.services.standings import standings_key
+from app.services.sync import SyncService
+from app.services.team_fixtures import build_team_fixture_windows, team_fixtures_key, team_fixtures_page
+
+_NOW = datetime(2024, 5, 10, 12, 0, tzinfo=UTC)
+
+
+@pytest.fixture
+def no_redis(monkeypatch: pytest.MonkeyPatch) -> Generator[None, None, None]:
+    monkeypatch.setattr(cache, "_l1", LocalCache(max_entries=64, ttl_seconds=60))
+    monkeypatch.setattr(cache, "_pool", aioredis.ConnectionPool.from_url("redis://127.0.0.1:1/0"))
+    yield
+
+
+async def _seed(db: AsyncSession) -> None:
+    db.add(League(id="warm-league", provider_league_id="warm-lg", name="Warm League", country="X", season="2024"))
+    for n in range(2):
+        db.add(Team(id=f"warm-team-{n}", provider_team_id=f"warm-t-{n}", name=f"Warm {n}", league_id="warm-league"))
+    offsets = [timedelta(days=d) for d in (-45, -29, -3, 4, 11, 29)] + [timedelta(days=30, minutes=30)]
+    for n, offset in enumerate(offsets):
+        db.add(
+            Fixture(
+                id=f"warm-fix-{n}",
+                provider_fixture_id=f"warm-f-{n}",
+                league_id="warm-league",
+                season="2024",
+                home_team_id=f"warm-team-{n % 2}",
+                away_team_id=f"warm-team-{(n + 1) % 2}",
+                start_time=_NOW + offset,
+                status="NS",
+                updated_at=_NOW,
+            )
+        )
+    await db.flush()
+
+
+def _standing(team: int, points: int) -> ProviderStanding:
+    return ProviderStanding(
+        league_provider_id="warm-lg",
+        season="2024",
+        team_provider_id=f"warm-t-{team}",
+        rank=team + 1,
+        played=10,
+        wins=points // 3,
+        draws=points % 3,
+        losses=10 - points // 3 - points % 3,
+        goals_for=20,
+        goals_against=10,
+        goal_diff=10,
+        points=points,
+    )
+
+
+@pytest.mark.asyncio
+async def test_sync_publishes_changed_tables_and_keeps_them_while_redis_is_down(
+    db: AsyncSession, no_redis: None
+) -> None:
+    await _seed(db)
+    svc = SyncService(MockProvider(), db)
+    await svc.upsert_standings([_standing(0, 25), _standing(1, 19)])
+    svc.changes.clear()
+
+    await svc.upsert_standings([_standing(0, 26), _standing(1, 19)])
+    assert (svc.changes.leagues, svc.changes.teams) == ({("warm-league", "2024")}, {"warm-team-0"})
+
+    await svc.refresh_caches()  # logged; retried by the next call
+    assert svc.changes.teams == {"warm-team-0"}
+
+
+@pytest.mark.asyncio
+async def test_warming_failures_do_not_fail_the_sync(
+    db: AsyncSession, no_redis: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    async def broken_warmer(db: AsyncSession, changes: ChangeSet) -> WarmResult:
+        raise ValueError("row no longer serializes")
+
+    monkeypatch.setattr(sync, "warm_caches", broken_warmer)
+    await _seed(db)
+    svc = SyncService(MockProvider(), db)
+    await svc.upsert_standings([_standing(0, 25)])
+
+    await svc.refresh_caches()
+    assert svc.changes.teams == {"warm-team-0"}
+
+
+@pytest.mark.asyncio
+async def test_refresh_caches_rewrites_what_the_sync_changed(
+    db: AsyncSession, redis_client: aioredis.Redis, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(cache, "_l1", LocalCache(max_entries=64, ttl_seconds=60))
+    suffix = uuid.uuid4().hex
+    league, followed, other = f"warm-lg-{suffix}", f"warm-followed-{suffix}", f"warm-other-{suffix}"
+    db.add(League(id=league, provider_league_id=league, name="Warm", country="X", season="2024"))
+    for team_id in (followed, other):
+        db.add(Team(id=team_id, provider_team_id=team_id, name=team_id, league_id=league))
+    db.add(User(id=f"warm-user-{suffix}", created_at=_NOW))
+    db.add(Follow(user_id=f"warm-user-{suffix}", team_id=followed, created_at=_NOW))
+    db.add(
+        Fixture(
+            id=f"warm-fix-{suffix}",
+            provider_fixture_id=f"warm-fix-{suffix}",
+            league_id=league,
+            season="2024",
+            home_team_id=followed,
+            away_team_id=other,
+            start_time=datetime.now(UTC) + timedelta(days=3),
+            status="NS",
+            updated_at=_NOW,
+        )
+    )
+    await db.flush()
+    # What requests cached before the sync
+    stale = cache._Entry(time.time() + 300, 0.01, b"[]")
+    await redis_client.set(standings_key(league, "2024"), stale.encode(), ex=60)
+    keys = {t: (team_fragment_key(t), team_fixtures_key(t)) for t in (followed, other)}
+    await cache_set_many({key: {"stale": True} for pair in keys.values() for key in pair}, 60)
+
+    svc = SyncService(MockProvider(), db)
+    await svc.upsert_standings(
+        [
+            replace(_standing(0, 25), league_provider_id=league, team_provider_id=followed),
+            replace(_standing(1, 19), league_provider_id=league, team_provider_id=other),
+        ]
+    )
+    await db.commit()
+    await svc.refresh_caches()
+
+    standings = orjson.loads(cache._Entry.decode(await redis_client.get(standings_key(league, "2024"))).body)
+    assert [(row["team_id"], row["points"]) for row in standings] == [(followed, 25), (other, 19)]
+    fragment, window = (orjson.loads(raw) for raw in await redis_client.mget(keys[followed]))
+    assert (fragment["team"]["id"], fragment["standing"]["points"]) == (followed, 25)
+    assert fragment["next_fixture"]["id"] == f"warm-fix-{suffix}"
+    assert [item["id"] for item in window["items"]] == [f"warm-fix-{suffix}"]
+    assert await redis_client.exists(*keys[other]) == 0  # nobody follows it: dropped, not rebuilt
+    assert not svc.changes
+
+
+@pytest.mark.asyncio
+async def test_fixture_window_pages_match_the_default_query_window(db: AsyncSession) -> None:
+    await _seed(db)
+    window = (await build_team_fixture_windows(db, ["warm-team-0", "warm-team-1"], _NOW))["warm-team-0"]
+    assert len(window["items"]) == 6  # up to a TTL past 30 days, for requests made later
+
+    first = orjson.loads(team_fixtures_page(window, _NOW, page=1, page_size=3))
+    assert [f["id"] for f in first["items"]] == ["warm-fix-1", "warm-fix-2", "warm-fix-3"]
+    assert (first["total"], first["has_next"]) == (5, True)
+    second = orjson.loads(team_fixtures_page(window, _NOW, page=2, page_size=3))
+    assert ([f["id"] for f in second["items"]], second["has_next"]) == (["warm-fix-4", "warm-fix-5"], False)
+
+    later = orjson.loads(team_fixtures_page(window, _NOW + timedelta(days=2), page=1, page_size=20))
+    assert [f["id"] for f in later["items"]] == ["warm-fix-2", "warm-fix-3", "warm-fix-4", "warm-fix-5", "warm-fix-6"]
@@ -0,0 +1,213 @@
+"""Tests for dashboard fragments and their per-user composition."""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from collections.abc import Generator, Sequence
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import orjson
+import pytest
+import redis.asyncio as aioredis
+from pydantic import TypeAdapter
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import Fixture, Follow, League, Standing, Team, User
+from app.schemas.standings import DashboardTeamEntry
+from app.services import cache, dashboard
+from app.services.cache import LocalCache
+from app.services.dashboard import (
+    FRAGMENT_KICKOFF_JITTER_SECONDS,
+    build_team_fragments,
+    compose_dashboard,
+    dashboard_body,
+    fragment_ttl,
+    get_team_fragments,
+    team_fragment_key,
+)
+from app.services.id_resolver import Kind
+from app.services.mock_provider import MockProvider
+from app.services.provider import ProviderFixture
+from app.services.sync import SyncService
+
+_NOW = datetime(2024, 5, 10, 12, 0, tzinfo=UTC)
+
+
+@pytest.fixture
+def l1(monkeypatch: pytest.MonkeyPatch) -> Generator[LocalCache, None, None]:
+    local = LocalCache(max_entries=64, ttl_seconds=60)
+    monkeypatch.setattr(cache, "_l1", local)
+    # Anything that misses L1 fails fast instead of waiting for a real Redis
+    monkeypatch.setattr(cache, "_pool", aioredis.ConnectionPool.from_url("redis://127.0.0.1:1/0"))
+    yield local
+
+
+async def _seed(db: AsyncSession) -> None:
+    db.add(League(id="dash-league", provider_league_id="dash-lg", name="Dash League", country="X", season="2024"))
+    for n in range(3):
+        db.add(Team(id=f"dash-team-{n}", provider_team_id=f"dash-t-{n}", name=f"Dash {n}", league_id="dash-league"))
+    db.add(User(id="dash-user", created_at=_NOW))
+    for n in (2, 0):
+        db.add(Follow(user_id="dash-user", team_id=f"dash-team-{n}", created_at=_NOW + timedelta(minutes=n)))
+    kickoffs = [(-40, 0, 1), (-3, 1, 0), (2, 0, 1), (9, 1, 0), (-1, 2, 1)]
+    for n, (days, home, away) in enumerate(kickoffs):
+        db.add(
+            Fixture(
+                id=f"dash-fix-{n}",
+                provider_fixture_id=f"dash-f-{n}",
+                league_id="dash-league",
+                season="2024",
+                home_team_id=f"dash-team-{home}",
+                away_team_id=f"dash-team-{away}",
+                start_time=_NOW + timedelta(days=days),
+                status="FT" if days < 0 else "NS",
+                home_score=1 if days < 0 else None,
+                away_score=0 if days < 0 else None,
+                updated_at=_NOW,
+            )
+        )
+    for season in ("2023", "2024"):
+        db.add(
+            Standing(
+                league_id="dash-league",
+                season=season,
+                team_id="dash-team-0",
+                rank=1 if season == "2024" else 4,
+                played=30,
+                wins=20,
+                draws=5,
+                losses=5,
+                goals_for=60,
+                goals_against=25,
+                goal_diff=35,
+                points=65,
+                updated_at=_NOW,
+            )
+        )
+    await db.flush()
+
+
+@pytest.mark.asyncio
+async def test_fragments_hold_latest_standing_and_neighbouring_fixtures(db: AsyncSession) -> None:
+    await _seed(db)
+    fragments = await build_team_fragments(db, ["dash-team-0", "dash-team-2", "missing"], _NOW)
+
+    assert set(fragments) == {"dash-team-0", "dash-team-2"}
+    team0 = fragments["dash-team-0"]
+    assert team0["standing"]["season"] == "2024"
+    assert (team0["last_fixture"]["id"], team0["next_fixture"]["id"]) == ("dash-fix-1", "dash-fix-2")
+    assert team0["next_fixture"]["away_team"]["name"] == "Dash 1"
+    assert fragments["dash-team-2"]["next_fixture"] is None
+
+    # Cached until the next kickoff at most, so "next" never goes stale
+    assert fragment_ttl(team0, _NOW) == 3600
+    assert 90 - FRAGMENT_KICKOFF_JITTER_SECONDS <= fragment_ttl(team0, _NOW + timedelta(days=2, seconds=-90)) <= 90
+
+
+@pytest.mark.asyncio
+async def test_composition_matches_the_response_schema_and_window(db: AsyncSession) -> None:
+    await _seed(db)
+    fragments = await build_team_fragments(db, ["dash-team-0"], _NOW)
+
+    entries = TypeAdapter(list[DashboardTeamEntry]).validate_json(compose_dashboard(fragments.values(), _NOW, 7, 7))
+    assert [(e.last_fixture and e.last_fixture.id, e.next_fixture and e.next_fixture.id) for e in entries] == [
+        ("dash-fix-1", "dash-fix-2")
+    ]
+    assert TypeAdapter(list[DashboardTeamEntry]).dump_json(entries) == compose_dashboard(fragments.values(), _NOW, 7, 7)
+
+    narrow = orjson.loads(compose_dashboard(fragments.values(), _NOW, 2, 1))
+    assert (narrow[0]["last_fixture"], narrow[0]["next_fixture"]) == (None, None)
+
+    # The next match kicked off after the fragment was built
+    later = orjson.loads(compose_dashboard(fragments.values(), _NOW + timedelta(days=2, hours=1), 7, 7))
+    assert (later[0]["last_fixture"]["id"], later[0]["next_fixture"]) == ("dash-fix-2", None)
+
+
+@pytest.mark.asyncio
+async def test_cached_fragments_are_composed_without_the_db(db: AsyncSession, l1: LocalCache) -> None:
+    await _seed(db)
+    for team_id, fragment in (await build_team_fragments(db, ["dash-team-0", "dash-team-2"], _NOW)).items():
+        l1.set(team_fragment_key(team_id), orjson.dumps(fragment).decode())
+    await db.rollback()  # nothing left to read
+
+    assert set(await get_team_fragments(db, ["dash-team-2", "dash-team-0"])) == {"dash-team-0", "dash-team-2"}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_cold_reads_build_a_fragment_once(
+    db: AsyncSession, redis_client: aioredis.Redis, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(cache, "_l1", LocalCache(max_entries=64, ttl_seconds=60))
+    team_id = f"herd-{uuid.uuid4().hex}"
+    builds: list[list[str]] = []
+
+    async def build(db: AsyncSession, team_ids: Sequence[str], now: datetime) -> dict[str, dict[str, Any]]:
+        builds.append(list(team_ids))
+        await asyncio.sleep(0.1)  # the other readers find the lock taken meanwhile
+        return {t: {"team": {"id": t}, "next_kickoff": None} for t in team_ids}
+
+    monkeypatch.setattr(dashboard, "build_team_fragments", build)
+    results = await asyncio.gather(*(get_team_fragments(db, [team_id]) for _ in range(5)))
+
+    assert builds == [[team_id]]
+    assert all(fragments[team_id]["team"] == {"id": team_id} for fragments in results)
+
+
+@pytest.mark.asyncio
+async def test_dashboard_is_built_from_the_db_when_redis_is_down(db: AsyncSession, l1: LocalCache) -> None:
+    await _seed(db)
+    body = orjson.loads(await dashboard_body(db, "dash-user", 30, 60))
+    assert [entry["team"]["id"] for entry in body] == ["dash-team-0", "dash-team-2"]  # in follow order
+
+
+@pytest.mark.asyncio
+async def test_sync_records_the_teams_it_wrote(db: AsyncSession) -> None:
+    await _seed(db)
+    svc = SyncService(MockProvider(), db)
+    await svc.upsert_fixtures(
+        [
+            ProviderFixture(
+                provider_id="dash-f-3",
+                league_provider_id="dash-lg",
+                season="2024",
+                home_team_provider_id="dash-t-1",
+                away_team_provider_id="dash-t-0",
+                start_time=_NOW + timedelta(days=9),
+            ),
+            ProviderFixture(
+                provider_id="dash-f-9",
+                league_provider_id="dash-lg",
+                season="2024",
+                home_team_provider_id="dash-t-2",
+                away_team_provider_id="dash-t-1",
+                start_time=_NOW + timedelta(days=12),
+            ),
+        ]
+    )
+    # dash-f-3 was unchanged
+    assert (svc.changes.teams, svc.changes.fixtures) == (
+        {"dash-team-1", "dash-team-2"},
+        {await svc.ids.resolve_one(Kind.fixture, "dash-f-9")},
+    )
+
+
+@pytest.mark.asyncio
+async def test_fragments_cost_the_same_queries_for_any_number_of_teams(db: AsyncSession) -> None:
+    await _seed(db)
+    statements: list[str] = []
+
+    def count(*args: object) -> None:
+        statements.append(str(args[2]))
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        await build_team_fragments(db, ["dash-team-0"], _NOW)
+        one = len(statements)
+        await build_team_fragments(db, ["dash-team-0", "dash-team-1", "dash-team-2"], _NOW)
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+    assert one == len(statements) - one == 3
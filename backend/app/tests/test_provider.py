@@ -62,3 +62,21 @@ async def test_get_standings(mock_provider: MockProvider) -> None:
     standings = await mock_provider.get_standings("mock-39", "2024")
     assert len(standings) == 3
     assert standings[0].rank == 1
+
+
+@pytest.mark.asyncio
+async def test_get_league_fixtures_filters_by_league_and_window(mock_provider: MockProvider) -> None:
+    now = datetime.now(UTC)
+    fixtures = await mock_provider.get_league_fixtures(
+        "mock-39", "2024", now - timedelta(days=2), now + timedelta(days=2)
+    )
+    assert {f.provider_id for f in fixtures} == {"mock-fix-1001", "mock-fix-1002"}
+    assert all(f.league_provider_id == "mock-39" for f in fixtures)
+
+
+@pytest.mark.asyncio
+async def test_get_live_fixtures_includes_events(mock_provider: MockProvider) -> None:
+    live = await mock_provider.get_live_fixtures()
+    assert [lf.fixture.provider_id for lf in live] == ["mock-fix-1004"]
+    assert [e.type for e in live[0].events] == ["goal", "card"]
+    assert await mock_provider.get_live_fixtures(["mock-39"]) == []
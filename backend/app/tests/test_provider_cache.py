@@ -0,0 +1,100 @@
+"""Tests for the provider response cache."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.services.mock_provider import MockProvider
+from app.services.provider import ProviderEvent, ProviderStanding, ProviderWrapper
+from app.services.provider_cache import CachedProvider, MemoryResponseStore, ResponseStore
+
+_NOW = datetime.now(UTC)
+_WINDOW = (_NOW - timedelta(days=30), _NOW + timedelta(days=30))
+
+
+class CountingProvider(MockProvider):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: list[str] = []
+
+    async def get_standings(self, league_provider_id: str, season: str) -> list[ProviderStanding]:
+        self.calls.append("get_standings")
+        return await super().get_standings(league_provider_id, season)
+
+    async def get_events(self, fixture_provider_id: str) -> list[ProviderEvent]:
+        self.calls.append("get_events")
+        return await super().get_events(fixture_provider_id)
+
+
+class BrokenStore(ResponseStore):
+    async def get(self, key: str) -> str | None:
+        raise ConnectionError("redis down")
+
+    async def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        raise ConnectionError("redis down")
+
+
+@pytest.mark.asyncio
+async def test_cached_endpoints_hit_upstream_once() -> None:
+    inner = CountingProvider()
+    provider = CachedProvider(inner, MemoryResponseStore())
+
+    first = await provider.get_standings("mock-39", "2024")
+    second = await provider.get_standings("mock-39", "2024")
+    await provider.get_standings("mock-39", "2023")
+
+    assert second == first
+    assert inner.calls == ["get_standings", "get_standings"]
+    assert provider.stats()["cache"] == {"hits": 1, "misses": 2, "passthrough": 0, "errors": 0, "saved_requests": 1}
+
+
+@pytest.mark.asyncio
+async def test_live_endpoints_are_not_cached_by_default() -> None:
+    inner = CountingProvider()
+    provider = CachedProvider(inner, MemoryResponseStore())
+
+    await provider.get_events("mock-fix-1001")
+    await provider.get_events("mock-fix-1001")
+
+    assert inner.calls == ["get_events", "get_events"]
+    assert provider.stats()["cache"]["passthrough"] == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_fixtures_round_trip_datetimes() -> None:
+    provider = CachedProvider(MockProvider(), MemoryResponseStore(), ttls={"get_league_fixtures": 60})
+    window = ("mock-39", "2024", *_WINDOW)
+
+    fresh = await provider.get_league_fixtures(*window)
+    cached = await provider.get_league_fixtures(*window)
+
+    assert fresh and cached == fresh
+    assert cached[0].start_time.tzinfo is not None
+
+
+@pytest.mark.asyncio
+async def test_store_failures_fall_back_to_upstream() -> None:
+    inner = CountingProvider()
+    provider = CachedProvider(inner, BrokenStore())
+
+    standings = await provider.get_standings("mock-39", "2024")
+
+    assert len(standings) == 3
+    assert provider.stats()["cache"]["errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_keys_are_namespaced_by_the_innermost_provider() -> None:
+    class OtherProvider(CountingProvider):
+        pass
+
+    store = MemoryResponseStore()
+    mock, other = CountingProvider(), OtherProvider()
+    # Wrapped like the factory does, so the cache's direct inner is the same class for both
+    for inner in (mock, other):
+        await CachedProvider(ProviderWrapper(inner), store).get_standings("mock-39", "2024")
+
+    assert mock.calls == other.calls == ["get_standings"]
+    assert CachedProvider(ProviderWrapper(other), store).name == "OtherProvider"
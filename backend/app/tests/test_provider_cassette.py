@@ -0,0 +1,111 @@
+"""Tests for cassette recording and replay under ApiFootballProvider."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+from app.services.api_football import ApiFootballProvider
+from app.services.provider_cache import MemoryResponseStore
+from app.services.provider_cassette import (
+    Cassette,
+    CassetteMissError,
+    Interaction,
+    RecordingTransport,
+    ReplayTransport,
+)
+
+TEAMS_BODY = {"response": [{"team": {"id": 50, "name": "Manchester City", "country": "England", "logo": None}}]}
+
+
+def upstream(calls: list[httpx.Request]) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        n = len(calls)  # every call returns a different body
+        body = {**TEAMS_BODY, "results": n}
+        return httpx.Response(200, json=body, headers={"etag": f'"{n}"', "x-ratelimit-remaining": "299"})
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.mark.asyncio
+async def test_recorded_responses_replay_offline(tmp_path: Path) -> None:
+    calls: list[httpx.Request] = []
+    cassette = Cassette()
+    recorder = ApiFootballProvider("key", transport=RecordingTransport(cassette, upstream(calls)))
+    recorded = await recorder.search_teams("City")
+    await recorder.aclose()
+    cassette.save(tmp_path / "teams.zip")
+
+    replayer = ApiFootballProvider("other-key", transport=ReplayTransport(Cassette.load(tmp_path / "teams.zip"), 0))
+    assert await replayer.search_teams("City") == recorded
+    assert len(calls) == 1
+    with pytest.raises(CassetteMissError):
+        await replayer.search_teams("United")
+
+
+class ClosableTransport(httpx.AsyncBaseTransport):
+    def __init__(self, inner: httpx.AsyncBaseTransport) -> None:
+        self.inner = inner
+        self.closed = False
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self.closed:
+            raise RuntimeError("transport is closed")
+        return await self.inner.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_recording_provider_can_be_reused_after_close() -> None:
+    calls: list[httpx.Request] = []
+    cassette = Cassette()
+    provider = ApiFootballProvider("key", transport=RecordingTransport(cassette, ClosableTransport(upstream(calls))))
+    await provider.search_teams("City")
+    await provider.aclose()
+
+    await provider.search_teams("City")
+
+    assert len(calls) == len(cassette) == 2
+
+
+@pytest.mark.asyncio
+async def test_recording_drops_conditional_headers() -> None:
+    calls: list[httpx.Request] = []
+    cassette = Cassette()
+    provider = ApiFootballProvider(
+        "key", transport=RecordingTransport(cassette, upstream(calls)), validator_store=MemoryResponseStore()
+    )
+    await provider.search_teams("City")
+    await provider.search_teams("City")
+
+    assert "if-none-match" not in calls[1].headers
+    (key,) = cassette.keys()
+    assert key == "GET /teams?search=City"
+    assert [cassette.next(key).status for _ in range(2)] == [200, 200]  # type: ignore[union-attr]
+
+
+def test_replay_walks_recorded_responses_then_repeats_the_last() -> None:
+    cassette = Cassette()
+    for n in range(2):
+        cassette.record("GET /fixtures?live=all", Interaction(200, {}, str(n).encode(), 0.0))
+    bodies = [cassette.next("GET /fixtures?live=all").body for _ in range(3)]  # type: ignore[union-attr]
+    assert bodies == [b"0", b"1", b"1"]
+    cassette.rewind()
+    assert cassette.next("GET /fixtures?live=all").body == b"0"  # type: ignore[union-attr]
+
+
+@pytest.mark.asyncio
+async def test_replay_latency_is_scaled() -> None:
+    cassette = Cassette()
+    cassette.record("GET /teams?search=City", Interaction(200, {}, b'{"response": []}', 0.2))
+    request = httpx.Request("GET", "https://example.test/teams", params={"search": "City"})
+
+    start = time.perf_counter()
+    await ReplayTransport(cassette, latency_scale=0.25).handle_async_request(request)
+    assert 0.04 <= time.perf_counter() - start < 0.15
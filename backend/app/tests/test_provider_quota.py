@@ -0,0 +1,63 @@
+"""Tests for the provider request budget."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.services.provider_quota import (
+    LocalQuotaBackend,
+    Priority,
+    QuotaExhaustedError,
+    QuotaLimits,
+    QuotaScheduler,
+    parse_quota_headers,
+)
+
+
+def _scheduler(per_minute: int, per_day: int) -> QuotaScheduler:
+    return QuotaScheduler(QuotaLimits(per_minute, per_day), backend=LocalQuotaBackend())
+
+
+def test_parse_quota_headers_ignores_missing_and_malformed_values() -> None:
+    upstream = parse_quota_headers({"x-ratelimit-requests-remaining": "42", "x-ratelimit-limit": "ten"})
+    assert (upstream.day_remaining, upstream.minute_limit, upstream.minute_remaining) == (42, None, None)
+
+
+@pytest.mark.asyncio
+async def test_low_priorities_leave_the_daily_reserve_to_live_calls() -> None:
+    quota = _scheduler(per_minute=1000, per_day=8)
+
+    for _ in range(6):  # 8 minus the 25% background reserve
+        await quota.acquire(Priority.background)
+    with pytest.raises(QuotaExhaustedError):
+        await quota.acquire(Priority.background)
+    await quota.acquire(Priority.live)
+    await quota.acquire(Priority.live)
+    with pytest.raises(QuotaExhaustedError):
+        await quota.acquire(Priority.live)
+
+    summary = quota.summary()
+    assert summary["priorities"]["background"] == {"granted": 6, "waited": 0, "rejected": 1}
+    assert summary["day_remaining"] == 0
+
+
+@pytest.mark.asyncio
+async def test_empty_minute_bucket_rejects_when_wait_exceeds_priority_limit() -> None:
+    quota = _scheduler(per_minute=2, per_day=1000)
+
+    await quota.acquire(Priority.live)
+    await quota.acquire(Priority.live)
+    with pytest.raises(QuotaExhaustedError, match="per-minute"):
+        await quota.acquire(Priority.live)  # next token is 30s away; live waits at most 2s
+
+
+@pytest.mark.asyncio
+async def test_upstream_headers_lower_the_shared_budget() -> None:
+    quota = _scheduler(per_minute=300, per_day=7500)
+
+    await quota.observe({"x-ratelimit-requests-limit": "100", "x-ratelimit-requests-remaining": "1"})
+
+    assert quota.limits.per_day == 100
+    await quota.acquire(Priority.live)
+    with pytest.raises(QuotaExhaustedError, match="daily"):
+        await quota.acquire(Priority.live)
@@ -0,0 +1,184 @@
+"""Tests for retries, circuit breakers and last-known fallback."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.services.mock_provider import MockProvider
+from app.services.provider import ProviderEvent, ProviderStanding
+from app.services.provider_cache import MemoryResponseStore
+from app.services.provider_resilience import (
+    BreakerState,
+    CircuitBreaker,
+    ProviderUnavailableError,
+    ResilientProvider,
+)
+
+
+def _status_error(code: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "https://upstream.test/standings")
+    return httpx.HTTPStatusError("upstream error", request=request, response=httpx.Response(code, request=request))
+
+
+class FlakyProvider(MockProvider):
+    """Raises the queued errors in order, then answers normally."""
+
+    def __init__(self, *errors: BaseException) -> None:
+        super().__init__()
+        self.errors = list(errors)
+        self.calls = 0
+
+    def _maybe_fail(self) -> None:
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+
+    async def get_standings(self, league_provider_id: str, season: str) -> list[ProviderStanding]:
+        self._maybe_fail()
+        return await super().get_standings(league_provider_id, season)
+
+    async def get_events(self, fixture_provider_id: str) -> list[ProviderEvent]:
+        self._maybe_fail()
+        return await super().get_events(fixture_provider_id)
+
+
+def _state(breaker: CircuitBreaker) -> BreakerState:
+    return breaker.state  # read through a call, so mypy doesn't carry narrowing across transitions
+
+
+class Clock:
+    now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _resilient(inner: MockProvider, **kwargs: object) -> ResilientProvider:
+    return ResilientProvider(inner, backoff_base=0, **kwargs)  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_transient_errors_are_retried() -> None:
+    inner = FlakyProvider(httpx.ConnectTimeout("timeout"), _status_error(503))
+    provider = _resilient(inner)
+
+    standings = await provider.get_standings("mock-39", "2024")
+
+    assert len(standings) == 3
+    assert inner.calls == 3
+    assert provider.stats()["resilience"]["retries"] == 2
+
+
+@pytest.mark.asyncio
+async def test_client_errors_are_not_retried_and_do_not_trip_the_breaker() -> None:
+    inner = FlakyProvider(_status_error(404))
+    provider = _resilient(inner, failure_threshold=1)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await provider.get_standings("mock-39", "2024")
+
+    assert inner.calls == 1
+    assert provider.breaker_states() == {"get_standings": "closed"}
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_fails_fast_then_serves_last_known_data() -> None:
+    clock = Clock()
+    inner = FlakyProvider()
+    provider = _resilient(inner, attempts=1, failure_threshold=2, fallback_store=MemoryResponseStore(), clock=clock)
+    good = await provider.get_standings("mock-39", "2024")
+
+    inner.errors = [_status_error(500)] * 2
+    assert await provider.get_standings("mock-39", "2024") == good
+    assert await provider.get_standings("mock-39", "2024") == good
+    assert provider.breaker_states() == {"get_standings": "open"}
+
+    calls = inner.calls
+    assert await provider.get_standings("mock-39", "2024") == good
+    with pytest.raises(ProviderUnavailableError):
+        await provider.get_standings("mock-140", "2024")  # nothing known for this league
+    assert inner.calls == calls
+    assert provider.stats()["resilience"] == {"retries": 0, "failures": 2, "short_circuited": 2, "fallbacks": 3}
+
+
+def test_breaker_half_open_trial_decides_next_state() -> None:
+    clock = Clock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=30, clock=clock)
+    first = breaker.allow()
+    assert first is not None
+    breaker.record_failure(first)
+    assert _state(breaker) is BreakerState.open and not breaker.allow()
+
+    clock.now = 30
+    trial = breaker.allow()
+    assert trial is not None
+    assert not breaker.allow()  # only one trial at a time
+    breaker.record_failure(trial)
+    assert _state(breaker) is BreakerState.open
+
+    clock.now = 60
+    assert breaker.allow()
+    breaker.record_success()
+    assert _state(breaker) is BreakerState.closed
+
+
+def test_calls_admitted_before_a_trial_cannot_end_it() -> None:
+    clock = Clock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=30, clock=clock)
+    slow = breaker.allow()  # admitted while closed, still running
+    assert slow is not None
+    breaker.record_failure(slow)
+
+    clock.now = 30
+    assert breaker.allow() is not None
+    breaker.release(slow)
+    assert not breaker.allow()  # the trial is still in flight
+
+
+@pytest.mark.asyncio
+async def test_unparsable_responses_leave_the_breaker_as_it_is() -> None:
+    clock = Clock()
+    inner = FlakyProvider(_status_error(500), KeyError("response"))
+    provider = _resilient(inner, attempts=1, failure_threshold=1, clock=clock)
+    with pytest.raises(ProviderUnavailableError):
+        await provider.get_standings("mock-39", "2024")
+
+    clock.now = 30
+    with pytest.raises(KeyError):
+        await provider.get_standings("mock-39", "2024")
+
+    assert provider.breaker_states() == {"get_standings": "half_open"}
+
+
+@pytest.mark.asyncio
+async def test_sync_feeds_fail_instead_of_serving_last_known_data() -> None:
+    inner = FlakyProvider()
+    store = MemoryResponseStore()
+    provider = _resilient(inner, attempts=1, failure_threshold=1, fallback_store=store)
+    await provider.get_events("mock-fix-1001")
+    assert not store._data  # only read-mostly endpoints are remembered
+
+    inner.errors = [_status_error(500)]
+    with pytest.raises(ProviderUnavailableError):
+        await provider.get_events("mock-fix-1001")
+    with pytest.raises(ProviderUnavailableError):
+        await provider.get_events("mock-fix-1001")  # circuit open
+    assert provider.stats()["resilience"]["fallbacks"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_half_open_trial_releases_the_breaker() -> None:
+    clock = Clock()
+    inner = FlakyProvider(_status_error(500), asyncio.CancelledError())
+    provider = _resilient(inner, attempts=1, failure_threshold=1, clock=clock)
+    with pytest.raises(ProviderUnavailableError):
+        await provider.get_standings("mock-39", "2024")
+
+    clock.now = 30
+    with pytest.raises(asyncio.CancelledError):
+        await provider.get_standings("mock-39", "2024")
+
+    assert len(await provider.get_standings("mock-39", "2024")) == 3  # a new trial was let through
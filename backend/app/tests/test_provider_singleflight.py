@@ -0,0 +1,74 @@
+"""Tests for provider request coalescing."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.services.mock_provider import MockProvider
+from app.services.provider import ProviderEvent, ProviderTeam
+from app.services.provider_singleflight import CoalescingProvider
+
+
+class SlowSearchProvider(MockProvider):
+    def __init__(self, fail: bool = False) -> None:
+        super().__init__()
+        self.calls = 0
+        self.fail = fail
+
+    async def search_teams(self, query: str, limit: int = 10) -> list[ProviderTeam]:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise RuntimeError("upstream 500")
+        return await super().search_teams(query, limit)
+
+    async def get_events(self, fixture_provider_id: str) -> list[ProviderEvent]:
+        await asyncio.sleep(0.01)
+        return [ProviderEvent(fixture_provider_id, "goal", 12, payload={"detail": "Normal Goal"})]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_share_one_upstream_request() -> None:
+    inner = SlowSearchProvider()
+    provider = CoalescingProvider(inner)
+
+    results = await asyncio.gather(*(provider.search_teams("liver") for _ in range(5)), provider.search_teams("real"))
+
+    assert inner.calls == 2
+    assert all(r == results[0] for r in results[:5])
+    assert results[0] is not results[1]
+    assert provider.stats()["singleflight"] == {
+        "calls": 6,
+        "upstream": 2,
+        "coalesced": 4,
+        "remote_coalesced": 0,
+        "lock_timeouts": 0,
+    }
+
+    await provider.search_teams("liver")
+    assert inner.calls == 3  # nothing is cached once the flight has landed
+
+
+@pytest.mark.asyncio
+async def test_failures_reach_every_waiter() -> None:
+    inner = SlowSearchProvider(fail=True)
+    provider = CoalescingProvider(inner)
+
+    results = await asyncio.gather(*(provider.search_teams("liver") for _ in range(3)), return_exceptions=True)
+
+    assert inner.calls == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_callers_sharing_a_flight_get_independent_results() -> None:
+    provider = CoalescingProvider(SlowSearchProvider())
+
+    leader, follower = await asyncio.gather(provider.get_events("f1"), provider.get_events("f1"))
+    leader[0].payload["detail"] = "Own Goal"
+    leader.append(ProviderEvent("f1", "card", 30))
+
+    assert len(follower) == 1
+    assert follower[0].payload == {"detail": "Normal Goal"}
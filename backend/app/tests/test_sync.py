@@ -0,0 +1,329 @@
+"""Tests for SyncService."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import Event, Fixture, League, Standing, Team
+from app.services.id_resolver import Kind
+from app.services.mock_provider import MockProvider
+from app.services.provider import ProviderEvent, ProviderFixture, ProviderLiveFixture
+from app.services.sync import SyncService, event_keys
+
+_KICKOFF = datetime(2024, 5, 1, 15, 0, tzinfo=UTC)
+
+
+async def _seed_league_and_teams(db: AsyncSession) -> None:
+    db.add(League(id="sync-league", provider_league_id="sync-lg", name="Sync League", country="X", season="2024"))
+    for n in range(4):
+        db.add(Team(id=f"sync-team-{n}", provider_team_id=f"sync-t-{n}", name=f"Sync {n}", league_id="sync-league"))
+    await db.flush()
+
+
+def _fixture(n: int, home: int = 0, away: int = 1, **kwargs: object) -> ProviderFixture:
+    return ProviderFixture(
+        provider_id=f"sync-fix-{n}",
+        league_provider_id="sync-lg",
+        season="2024",
+        home_team_provider_id=f"sync-t-{home}",
+        away_team_provider_id=f"sync-t-{away}",
+        start_time=_KICKOFF + timedelta(days=n),
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+@pytest.mark.asyncio
+async def test_upsert_fixtures_inserts_updates_and_skips(db: AsyncSession) -> None:
+    await _seed_league_and_teams(db)
+    svc = SyncService(MockProvider(), db)
+
+    first = await svc.upsert_fixtures([_fixture(1), _fixture(2, 2, 3), _fixture(3, 0, 99)])
+    assert (first.inserted, first.updated, first.unchanged, first.skipped) == (2, 0, 0, 1)
+
+    second = await svc.upsert_fixtures([_fixture(1, status="FT", home_score=1, away_score=0), _fixture(2, 2, 3)])
+    assert (second.inserted, second.updated, second.unchanged, second.skipped) == (0, 1, 1, 0)
+
+    row = (await db.execute(select(Fixture).where(Fixture.provider_fixture_id == "sync-fix-1"))).scalar_one()
+    await db.refresh(row)
+    assert (row.status, row.home_score, row.away_score) == ("FT", 1, 0)
+
+
+@pytest.mark.asyncio
+async def test_upsert_fixtures_dedupes_within_batch(db: AsyncSession) -> None:
+    await _seed_league_and_teams(db)
+    svc = SyncService(MockProvider(), db)
+
+    fixture = _fixture(5)
+    result = await svc.upsert_fixtures([fixture, replace(fixture, status="1H")])
+    assert result.inserted == 1
+
+    rows = (await db.execute(select(Fixture).where(Fixture.provider_fixture_id == "sync-fix-5"))).scalars().all()
+    assert [r.status for r in rows] == ["1H"]
+
+
+@pytest.mark.asyncio
+async def test_id_resolver_serves_repeat_lookups_from_memory(db: AsyncSession) -> None:
+    await _seed_league_and_teams(db)
+    svc = SyncService(MockProvider(), db)
+
+    await svc.upsert_fixtures([_fixture(10), _fixture(11, 2, 3)])
+    await svc.upsert_fixtures([_fixture(12, 1, 2)])
+
+    teams = svc.ids.stats[Kind.team]
+    assert (teams.misses, teams.hits, teams.queries) == (4, 2, 1)
+    assert await svc.ids.resolve_one(Kind.fixture, "sync-fix-12") is not None
+    assert svc.ids.stats[Kind.fixture].queries == 0
+
+
+async def _seed_mock_fixture(db: AsyncSession) -> None:
+    db.add(League(id="ev-league", provider_league_id="mock-39", name="PL", country="England", season="2024"))
+    db.add(Team(id="ev-mci", provider_team_id="mock-50", name="Manchester City", league_id="ev-league"))
+    db.add(Team(id="ev-liv", provider_team_id="mock-40", name="Liverpool", league_id="ev-league"))
+    db.add(
+        Fixture(
+            id="ev-fix",
+            provider_fixture_id="mock-fix-1001",
+            league_id="ev-league",
+            season="2024",
+            home_team_id="ev-mci",
+            away_team_id="ev-liv",
+            start_time=_KICKOFF,
+            status="FT",
+        )
+    )
+    await db.flush()
+
+
+@pytest.mark.asyncio
+async def test_sync_events_is_idempotent(db: AsyncSession) -> None:
+    await _seed_mock_fixture(db)
+    svc = SyncService(MockProvider(), db)
+
+    first = await svc.sync_events("mock-fix-1001")
+    second = await svc.sync_events("mock-fix-1001")
+
+    assert [e.player_name for e in first.new] == ["Haaland", "De Bruyne", "Salah"]
+    assert second.new == [] and second.changed == []
+    count = (await db.execute(select(func.count()).select_from(Event).where(Event.fixture_id == "ev-fix"))).scalar()
+    assert count == 3
+
+
+@pytest.mark.asyncio
+async def test_sync_events_reports_only_the_delta(db: AsyncSession) -> None:
+    await _seed_mock_fixture(db)
+    goal = ProviderEvent("mock-fix-1001", "goal", 24, "mock-50", "Haaland", {"detail": "Normal Goal"})
+    feed = [goal]
+
+    async def get_events(fixture_provider_id: str) -> list[ProviderEvent]:
+        return feed
+
+    provider = MockProvider()
+    provider.get_events = get_events  # type: ignore[method-assign]
+    svc = SyncService(provider, db)
+    await svc.sync_events("mock-fix-1001")
+
+    reviewed = replace(goal, payload={"detail": "Normal Goal", "comments": "VAR checked"})
+    late_goal = ProviderEvent("mock-fix-1001", "goal", 90, "mock-40", "Salah", {"detail": "Penalty"})
+    feed = [reviewed, late_goal]
+    delta = await svc.sync_events("mock-fix-1001")
+
+    assert delta.new == [late_goal]
+    assert delta.changed == [reviewed]
+    payloads = (await db.execute(select(Event.payload).where(Event.fixture_id == "ev-fix"))).scalars().all()
+    assert sorted(p or "" for p in payloads) == [
+        '{"comments": "VAR checked", "detail": "Normal Goal"}',
+        '{"detail": "Penalty"}',
+    ]
+
+
+async def _stored_players(db: AsyncSession) -> list[tuple[int | None, str | None]]:
+    rows = await db.execute(select(Event.minute, Event.player_name).where(Event.fixture_id == "ev-fix"))
+    return sorted(rows.tuples(), key=lambda r: (r[0] or 0, r[1] or ""))
+
+
+@pytest.mark.asyncio
+async def test_write_events_deletes_events_dropped_from_the_feed(db: AsyncSession) -> None:
+    await _seed_mock_fixture(db)
+    svc = SyncService(MockProvider(), db)
+    goal = ProviderEvent("mock-fix-1001", "goal", 24, "mock-50", "Haaland", {"detail": "Normal Goal"})
+    disallowed = ProviderEvent("mock-fix-1001", "goal", 61, "mock-40", "Salah", {"detail": "Normal Goal"})
+    await svc.write_events("mock-fix-1001", [goal, disallowed])
+
+    delta = await svc.write_events("mock-fix-1001", [goal])  # overturned by VAR
+
+    assert (delta.new, delta.changed, delta.removed) == ([], [], event_keys([goal, disallowed])[1:])
+    assert await _stored_players(db) == [(24, "Haaland")]
+
+
+@pytest.mark.asyncio
+async def test_write_events_replaces_a_corrected_event(db: AsyncSession) -> None:
+    await _seed_mock_fixture(db)
+    svc = SyncService(MockProvider(), db)
+    goal = ProviderEvent("mock-fix-1001", "goal", 24, "mock-50", "Haaland", {"detail": "Normal Goal"})
+    await svc.write_events("mock-fix-1001", [goal])
+
+    corrected = replace(goal, minute=25, player_name="De Bruyne")
+    delta = await svc.write_events("mock-fix-1001", [corrected])
+
+    assert (delta.new, delta.removed) == ([corrected], event_keys([goal]))
+    assert await _stored_players(db) == [(25, "De Bruyne")]
+
+
+@pytest.mark.asyncio
+async def test_write_events_rekeys_legacy_rows_without_reporting_them(db: AsyncSession) -> None:
+    await _seed_mock_fixture(db)
+    svc = SyncService(MockProvider(), db)
+    goal = ProviderEvent("mock-fix-1001", "goal", 24, "mock-50", "Haaland", {"detail": "Normal Goal"})
+    card = ProviderEvent("mock-fix-1001", "card", 40, "mock-40", "Salah", {"detail": "Yellow Card"})
+    await svc.write_events("mock-fix-1001", [goal])
+    legacy_card = Event(fixture_id="ev-fix", type="card", minute=40, team_id="ev-liv", player_name="Salah")
+    legacy_card.payload = '{"detail": "Yellow Card"}'
+    db.add(legacy_card)
+    await db.flush()
+
+    late_goal = ProviderEvent("mock-fix-1001", "goal", 90, "mock-40", "Salah", {"detail": "Penalty"})
+    delta = await svc.write_events("mock-fix-1001", [goal, card, late_goal])
+
+    assert (delta.new, delta.changed, delta.removed) == ([late_goal], [], [])
+    keys = (await db.execute(select(Event.event_key).where(Event.fixture_id == "ev-fix"))).scalars().all()
+    assert sorted(k or "" for k in keys) == sorted(event_keys([goal, card, late_goal]))
+
+
+def test_event_keys_disambiguate_identical_events() -> None:
+    card = ProviderEvent("f1", "card", 30, "t1", "Player", {"detail": "Yellow Card"})
+    keys = event_keys([card, replace(card)])
+    assert len(set(keys)) == 2
+    assert keys == event_keys([card, replace(card)])
+
+
+@pytest.mark.asyncio
+async def test_upsert_standings_writes_only_changed_rows(db: AsyncSession) -> None:
+    await _seed_mock_fixture(db)
+    db.add(Team(id="ev-ars", provider_team_id="mock-42", name="Arsenal", league_id="ev-league"))
+    await db.flush()
+    provider = MockProvider()
+    svc = SyncService(provider, db)
+
+    assert await svc.sync_standings("mock-39", "2024") == 3
+    assert await svc.sync_standings("mock-39", "2024") == 0
+
+    table = await provider.get_standings("mock-39", "2024")
+    table[2] = replace(table[2], played=29, wins=19, points=61)
+    result = await svc.upsert_standings(table)
+    assert (result.inserted, result.updated, result.unchanged, result.skipped) == (0, 1, 2, 0)
+
+    row = await db.get(Standing, ("ev-league", "2024", "ev-ars"))
+    assert row is not None
+    await db.refresh(row)
+    assert (row.played, row.points) == (29, 61)
+
+
+@pytest.mark.asyncio
+async def test_sync_league_fixtures_uses_one_provider_call(db: AsyncSession) -> None:
+    await _seed_mock_fixture(db)
+    db.add(Team(id="ev-ars", provider_team_id="mock-42", name="Arsenal", league_id="ev-league"))
+    await db.flush()
+    provider = MockProvider()
+    calls: list[str] = []
+    get_league_fixtures = provider.get_league_fixtures
+
+    async def counting(
+        league_provider_id: str, season: str, from_date: datetime, to_date: datetime
+    ) -> list[ProviderFixture]:
+        calls.append(league_provider_id)
+        return await get_league_fixtures(league_provider_id, season, from_date, to_date)
+
+    provider.get_league_fixtures = counting  # type: ignore[method-assign]
+    inserted = await SyncService(provider, db).sync_league_fixtures("mock-39", "2024")
+
+    assert calls == ["mock-39"]
+    assert inserted == 1  # mock-fix-1001 is already stored; mock-fix-1002 is new
+
+
+@pytest.mark.asyncio
+async def test_batch_sync_bounds_concurrency_and_collects_failures(db: AsyncSession) -> None:
+    await _seed_mock_fixture(db)
+    provider = MockProvider()
+    in_flight = peak = 0
+
+    async def get_events(fixture_provider_id: str) -> list[ProviderEvent]:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if fixture_provider_id == "broken":
+            raise RuntimeError("upstream 500")
+        return []
+
+    provider.get_events = get_events  # type: ignore[method-assign]
+    svc = SyncService(provider, db, fetch_concurrency=2)
+    deltas = await svc.sync_events_many(["mock-fix-1001", "broken", "f3", "f4", "f5"])
+
+    assert peak == 2
+    assert [d.fixture_provider_id for d in deltas] == ["mock-fix-1001", "f3", "f4", "f5"]
+    assert [(f.call, f.key) for f in svc.report.failures] == [("get_events", "broken")]
+    assert svc.report.summary()["calls"] == 5
+
+
+@pytest.mark.asyncio
+async def test_sync_live_updates_scores_and_events_from_one_call(db: AsyncSession) -> None:
+    db.add(League(id="live-league", provider_league_id="mock-140", name="La Liga", country="Spain", season="2024"))
+    db.add(Team(id="live-atm", provider_team_id="mock-530", name="Atletico Madrid", league_id="live-league"))
+    db.add(Team(id="live-rma", provider_team_id="mock-541", name="Real Madrid", league_id="live-league"))
+    db.add(
+        Fixture(
+            id="live-stale",
+            provider_fixture_id="mock-fix-0999",
+            league_id="live-league",
+            season="2024",
+            home_team_id="live-rma",
+            away_team_id="live-atm",
+            start_time=_KICKOFF,
+            status="2H",
+        )
+    )
+    await db.flush()
+    provider = MockProvider()
+    calls: list[object] = []
+    get_live_fixtures = provider.get_live_fixtures
+
+    async def counting(league_provider_ids: object = None) -> list[ProviderLiveFixture]:
+        calls.append(league_provider_ids)
+        return await get_live_fixtures(league_provider_ids)  # type: ignore[arg-type]
+
+    provider.get_live_fixtures = counting  # type: ignore[method-assign]
+    svc = SyncService(provider, db)
+    live = await svc.sync_live(["mock-140"])
+
+    assert calls == [["mock-140"]]
+    assert live.fixtures.inserted == 1
+    assert [(d.fixture_provider_id, len(d.new)) for d in live.deltas] == [("mock-fix-1004", 2)]
+    assert live.ended == ["mock-fix-0999"]
+    row = (await db.execute(select(Fixture).where(Fixture.provider_fixture_id == "mock-fix-1004"))).scalar_one()
+    assert (row.status, row.home_score, row.away_score) == ("2H", 1, 0)
+
+    again = await svc.sync_live(["mock-140"])
+    assert again.fixtures.unchanged == 1 and again.deltas[0].new == []
+
+
+@pytest.mark.asyncio
+async def test_refresh_fixtures_updates_only_requested_ids(db: AsyncSession) -> None:
+    await _seed_mock_fixture(db)
+    await db.execute(update(Fixture).where(Fixture.id == "ev-fix").values(status="2H", home_score=None))
+    svc = SyncService(MockProvider(), db)
+
+    result = await svc.refresh_fixtures(["mock-fix-1001", "mock-fix-missing"])
+
+    assert (result.inserted, result.updated) == (0, 1)
+    row = await db.get(Fixture, "ev-fix")
+    assert row is not None
+    await db.refresh(row)
+    assert (row.status, row.home_score, row.away_score) == ("FT", 2, 1)
+    assert svc.report.calls == 1
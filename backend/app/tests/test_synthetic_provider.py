@@ -0,0 +1,62 @@
+"""Tests for SyntheticProvider."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import httpx
+import pytest
+
+from app.services.synthetic_provider import SyntheticConfig, SyntheticProvider
+
+_NOW = datetime(2024, 11, 9, 16, 0, tzinfo=UTC)
+_SEASON = (_NOW - timedelta(days=365), _NOW + timedelta(days=365))
+
+
+def _provider(**kwargs: float) -> SyntheticProvider:
+    return SyntheticProvider(SyntheticConfig(leagues=3, teams_per_league=7, live_matches=4, **kwargs), now=_NOW)  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_schedule_is_a_full_double_round_robin() -> None:
+    provider = _provider()
+    fixtures = await provider.get_league_fixtures("syn-lg-1", "2024", *_SEASON)
+
+    assert len(fixtures) == 7 * 6
+    assert len({(f.home_team_provider_id, f.away_team_provider_id) for f in fixtures}) == 7 * 6
+    assert {f.status for f in fixtures} >= {"FT", "NS"}
+
+    table = await provider.get_standings("syn-lg-1", "2024")
+    finished = sum(f.status == "FT" for f in fixtures)
+    assert sum(row.played for row in table) == 2 * finished
+    assert [row.rank for row in table] == list(range(1, 8))
+
+
+@pytest.mark.asyncio
+async def test_same_seed_gives_the_same_data() -> None:
+    a = await _provider().get_league_fixtures("syn-lg-0", "2024", *_SEASON)
+    b = await _provider().get_league_fixtures("syn-lg-0", "2024", *_SEASON)
+    c = await _provider(seed=7).get_league_fixtures("syn-lg-0", "2024", *_SEASON)
+
+    assert a == b
+    assert [(f.home_score, f.away_score) for f in a] != [(f.home_score, f.away_score) for f in c]
+    assert await _provider().get_fixtures_by_ids([a[3].provider_id, "syn-fx-9-0-0-0"]) == [a[3]]
+
+
+@pytest.mark.asyncio
+async def test_live_feed_scores_match_events() -> None:
+    live = await _provider(events_per_minute=0.3).get_live_fixtures()
+
+    assert len(live) == 4
+    for lf in live:
+        goals = [e for e in lf.events if e.type == "goal"]
+        assert lf.fixture.status == "1H"
+        assert (lf.fixture.home_score or 0) + (lf.fixture.away_score or 0) == len(goals)
+
+
+@pytest.mark.asyncio
+async def test_error_injection_raises_retryable_http_errors() -> None:
+    provider = _provider(error_rate=1.0)
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        await provider.get_leagues()
+    assert exc_info.value.response.status_code == 503
@@ -0,0 +1,44 @@
+"""Shared helpers for benchmark scripts."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import AsyncGenerator, Callable
+from contextlib import asynccontextmanager
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.db.models import Base
+
+DEFAULT_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
+
+@asynccontextmanager
+async def fresh_session(database_url: str) -> AsyncGenerator[AsyncSession, None]:
+    """Yield a session on a freshly created schema; everything is dropped afterwards."""
+    engine = create_async_engine(database_url, echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    try:
+        async with async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)() as session:
+            yield session
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+        await engine.dispose()
+
+
+async def timed(fn: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    await fn()
+    return time.perf_counter() - start
+
+
+def report(title: str, rows: list[tuple[str, float]], unit: str = "s") -> None:
+    print(f"\n{title}")
+    baseline = rows[0][1]
+    for label, value in rows:
+        ratio = f"{baseline / value:6.1f}x" if value else "     -"
+        print(f"  {label:<28} {value:10.3f} {unit}  {ratio}")
@@ -0,0 +1,125 @@
+"""
+Cache-hit throughput of GET /leagues/{id}/standings.
+
+Usage (from backend/):
+    python -m benchmarks.bench_cache_hit
+    python -m benchmarks.bench_cache_hit --teams 36 --requests 5000
+
+"decoded" replays the previous hit path (json.loads of the cached value, one
+model_validate per row, then FastAPI's own validation and serialization);
+"pre-serialized" is the current endpoint, whose hit returns the cached body
+as is. Both run in the same bare FastAPI app (no middleware) and are served
+from the in-process cache, so Redis is not needed and the difference is all
+CPU per request.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from collections.abc import AsyncGenerator
+
+from fastapi import Depends, FastAPI, Query
+from fastapi.responses import ORJSONResponse
+from httpx import ASGITransport, AsyncClient
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.standings import router as standings_router
+from app.core.security import get_current_user_id
+from app.db.session import get_db
+from app.schemas.standings import StandingOut
+from app.services import cache
+from benchmarks._common import report
+
+
+def standings(teams: int) -> list[StandingOut]:
+    return [
+        StandingOut.model_validate(
+            {
+                "league_id": "league-1",
+                "season": "2024",
+                "team_id": f"team-{rank}",
+                "team": {
+                    "id": f"team-{rank}",
+                    "provider_team_id": str(30 + rank),
+                    "name": f"Team {rank}",
+                    "short_name": None,
+                    "country": "England",
+                    "logo_url": f"https://media.api-sports.io/football/teams/{30 + rank}.png",
+                    "league_id": "league-1",
+                },
+                "rank": rank,
+                "played": 30,
+                "wins": 30 - rank // 2,
+                "draws": rank // 3,
+                "losses": rank // 2 - rank // 3,
+                "goals_for": 70 - rank,
+                "goals_against": 20 + rank,
+                "goal_diff": 50 - 2 * rank,
+                "points": 90 - 2 * rank,
+                "updated_at": "2024-05-19T17:00:00Z",
+            }
+        )
+        for rank in range(1, teams + 1)
+    ]
+
+
+async def per_request(target: FastAPI, path: str, requests: int) -> float:
+    """Mean microseconds per sequential request."""
+    async with AsyncClient(transport=ASGITransport(app=target), base_url="http://bench") as client:
+        for _ in range(50):  # warm-up
+            (await client.get(path)).raise_for_status()
+        start = time.perf_counter()
+        for _ in range(requests):
+            await client.get(path)
+        return (time.perf_counter() - start) / requests * 1e6
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--teams", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    rows = standings(args.teams)
+    body = TypeAdapter(list[StandingOut]).dump_json(rows)
+    stored = json.dumps([row.model_dump(mode="json") for row in rows])  # the old cache_get value
+
+    bench = FastAPI(default_response_class=ORJSONResponse)
+    bench.include_router(standings_router)
+
+    @bench.get("/decoded/{league_id}", response_model=list[StandingOut])
+    async def old_hit_path(
+        league_id: str,
+        season: str | None = Query(default=None),
+        db: AsyncSession = Depends(get_db),
+        _: str = Depends(get_current_user_id),
+    ) -> list[StandingOut]:
+        return [StandingOut.model_validate(s) for s in json.loads(stored)]
+
+    async def no_db() -> AsyncGenerator[None, None]:
+        yield None
+
+    bench.dependency_overrides[get_current_user_id] = lambda: "bench-user"
+    bench.dependency_overrides[get_db] = no_db
+    l1 = cache.get_local_cache()
+    if l1 is None:
+        raise SystemExit("CACHE_L1_MAX_ENTRIES is 0; the benchmark serves hits from the in-process cache")
+    l1.ttl_seconds = 3600
+    l1.set("standings:league-1:2024", cache._Entry(time.time() + 3600, 0.0, body))
+
+    decoded = await per_request(bench, "/decoded/league-1?season=2024", args.requests)
+    served = await per_request(bench, "/leagues/league-1/standings?season=2024", args.requests)
+    report(
+        f"Standings cache hit, {args.teams} rows, {len(body)} bytes ({args.requests} sequential requests)",
+        [("decoded", decoded), ("pre-serialized", served)],
+        unit="us/req",
+    )
+    print(f"  ~{1e6 / decoded:.0f} -> ~{1e6 / served:.0f} requests/s on one core")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,179 @@
+"""
+API-Football response parsing: decoder, DTO layout and event-loop stalls.
+
+Usage (from backend/):
+    python -m benchmarks.bench_parse                          # synthetic 2000-fixture body
+    python -m benchmarks.bench_parse --fixtures 10000
+    python -m benchmarks.bench_parse --cassette pl-2024.zip   # largest recorded /fixtures body
+
+Payloads follow the full API-Football fixture shape (venue, periods, score
+breakdown...), so byte sizes match what a season request returns.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+import tracemalloc
+from dataclasses import asdict, fields, make_dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import orjson
+
+from app.services.api_football import ApiFootballProvider, _decode
+from app.services.provider import ProviderFixture
+from app.services.provider_cassette import Cassette
+from benchmarks._common import report
+
+
+def synthetic_body(n: int) -> bytes:
+    kickoff = datetime(2024, 8, 16, 19, 0, tzinfo=UTC)
+    response = []
+    for i in range(n):
+        home, away = 33 + i % 20, 33 + (i + 7) % 20
+        response.append(
+            {
+                "fixture": {
+                    "id": 1_200_000 + i,
+                    "referee": "M. Oliver, England",
+                    "timezone": "UTC",
+                    "date": (kickoff + timedelta(days=i // 10)).isoformat(),
+                    "timestamp": int(kickoff.timestamp()) + i * 8640,
+                    "periods": {"first": 1723834800, "second": 1723838400},
+                    "venue": {"id": 556, "name": "Old Trafford", "city": "Manchester"},
+                    "status": {"long": "Match Finished", "short": "FT", "elapsed": 90, "extra": None},
+                },
+                "league": {
+                    "id": 39,
+                    "name": "Premier League",
+                    "country": "England",
+                    "logo": "https://media.api-sports.io/football/leagues/39.png",
+                    "flag": "https://media.api-sports.io/flags/gb.svg",
+                    "season": 2024,
+                    "round": f"Regular Season - {i // 10 + 1}",
+                },
+                "teams": {
+                    side: {
+                        "id": tid,
+                        "name": f"Team {tid}",
+                        "logo": f"https://media.api-sports.io/{tid}.png",
+                        "winner": None,
+                    }
+                    for side, tid in (("home", home), ("away", away))
+                },
+                "goals": {"home": i % 4, "away": i % 3},
+                "score": {
+                    "halftime": {"home": i % 2, "away": 0},
+                    "fulltime": {"home": i % 4, "away": i % 3},
+                    "extratime": {"home": None, "away": None},
+                    "penalty": {"home": None, "away": None},
+                },
+            }
+        )
+    return orjson.dumps({"get": "fixtures", "results": n, "response": response})
+
+
+def cassette_body(path: str) -> bytes:
+    cassette = Cassette.load(path)
+    bodies = [it.body for key in cassette.keys() if key.startswith("GET /fixtures?") if (it := cassette.next(key))]
+    if not bodies:
+        raise SystemExit(f"{path} holds no /fixtures responses")
+    return max(bodies, key=len)
+
+
+def best_of(repeat: int, fn: Any) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def allocated(build: Any) -> float:
+    tracemalloc.start()
+    kept = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return size / 1024 / 1024
+
+
+async def worst_loop_stall(parse: Any, repeat: int) -> float:
+    """Median over ``repeat`` runs of the longest gap a 1 ms ticker sees while ``parse`` runs."""
+    stalls = sorted([await _worst_loop_stall(parse) for _ in range(repeat)])
+    return stalls[len(stalls) // 2]
+
+
+async def _worst_loop_stall(parse: Any) -> float:
+    worst, done = 0.0, asyncio.Event()
+
+    async def ticker() -> None:
+        nonlocal worst
+        last = time.perf_counter()
+        while not done.is_set():
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            worst, last = max(worst, now - last), now
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0.01)
+    await parse()
+    done.set()
+    await task
+    return worst * 1000
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixtures", type=int, default=2000)
+    parser.add_argument("--cassette", help="take the largest /fixtures body from a recorded cassette")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    body = cassette_body(args.cassette) if args.cassette else synthetic_body(args.fixtures)
+    parse = ApiFootballProvider._parse_fixtures
+    fixtures = _decode(body, parse)
+    print(f"\nPayload: {len(body) / 1024:.0f} KiB, {len(fixtures)} fixtures")
+
+    report(
+        f"Decode + parse (best of {args.repeat})",
+        [
+            ("json.loads(str) + DTOs", best_of(args.repeat, lambda: parse(json.loads(body.decode())))),
+            ("orjson.loads(bytes)", best_of(args.repeat, lambda: orjson.loads(body))),
+            ("orjson.loads(bytes) + DTOs", best_of(args.repeat, lambda: _decode(body, parse))),
+        ],
+    )
+
+    plain = make_dataclass("PlainFixture", [(f.name, f.type) for f in fields(ProviderFixture)])
+    rows = [asdict(f) for f in fixtures]
+    report(
+        "Memory held by the parsed list",
+        [
+            ("@dataclass", allocated(lambda: [plain(**r) for r in rows])),
+            ("@dataclass(slots=True)", allocated(lambda: [ProviderFixture(**r) for r in rows])),
+        ],
+        unit="MiB",
+    )
+
+    async def in_thread() -> None:
+        await asyncio.to_thread(_decode, body, parse)
+
+    async def inline() -> None:
+        _decode(body, parse)
+
+    report(
+        "Worst event-loop stall while parsing",
+        [
+            ("inline", await worst_loop_stall(inline, args.repeat)),
+            ("asyncio.to_thread", await worst_loop_stall(in_thread, args.repeat)),
+        ],
+        unit="ms",
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,80 @@
+"""
+Sync run against recorded API-Football traffic.
+
+Usage (from backend/):
+    # once, with network and PROVIDER_API_KEY set: record a cassette
+    python -m benchmarks.bench_replay --record --cassette pl-2024.zip --leagues 39:2024,140:2024
+    # any number of times, offline
+    python -m benchmarks.bench_replay --cassette pl-2024.zip --leagues 39:2024,140:2024
+    python -m benchmarks.bench_replay --cassette pl-2024.zip --leagues 39:2024,140:2024 --latency-scale 0
+
+Both modes run the same phases, so a replay requests exactly what was recorded.
+Replay sleeps for each recorded response time times --latency-scale; 0 leaves
+only parsing and database writes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+
+from app.core.config import get_settings
+from app.services.api_football import ApiFootballProvider
+from app.services.provider_cassette import Cassette, RecordingTransport, ReplayTransport
+from app.services.sync import SyncService
+from benchmarks._common import DEFAULT_DATABASE_URL, fresh_session, report, timed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cassette", required=True)
+    parser.add_argument("--record", action="store_true", help="call the real API and write the cassette")
+    parser.add_argument("--leagues", default="39:2024", help="comma-separated league:season pairs")
+    parser.add_argument("--latency-scale", type=float, default=1.0)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--database-url", default=DEFAULT_DATABASE_URL)
+    args = parser.parse_args()
+
+    leagues = [(league, season) for league, season in (pair.split(":") for pair in args.leagues.split(","))]
+    settings = get_settings()
+    cassette = Cassette() if args.record else Cassette.load(args.cassette)
+    transport = RecordingTransport(cassette) if args.record else ReplayTransport(cassette, args.latency_scale)
+    provider = ApiFootballProvider(
+        api_key=settings.provider_api_key,
+        base_url=settings.provider_base_url or "https://v3.football.api-sports.io",
+        transport=transport,
+    )
+
+    async with fresh_session(args.database_url) as session:
+        svc = SyncService(provider, session, args.concurrency)
+
+        async def sync_catalog() -> None:
+            await svc.sync_leagues()
+            for league_pid, _ in leagues:
+                await svc.sync_teams(league_pid)
+            await session.commit()
+
+        async def sync_fixtures() -> None:
+            await svc.sync_league_fixtures_many(leagues, hours_forward=24 * 365)
+            await session.commit()
+
+        async def sync_standings() -> None:
+            await svc.sync_standings_many(leagues)
+            await session.commit()
+
+        rows = [
+            ("leagues + teams", await timed(sync_catalog)),
+            ("fixtures (season)", await timed(sync_fixtures)),
+            ("standings", await timed(sync_standings)),
+        ]
+    await provider.aclose()
+
+    if args.record:
+        cassette.save(args.cassette)
+    mode = "recorded" if args.record else f"replayed at {args.latency_scale}x latency"
+    report(f"API-Football sync, {len(cassette)} responses {mode}", rows)
+    print(f"  {svc.report.summary()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
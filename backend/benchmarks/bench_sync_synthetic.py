@@ -0,0 +1,75 @@
+"""
+Full sync run against SyntheticProvider at matchday scale.
+
+Usage (from backend/):
+    python -m benchmarks.bench_sync_synthetic                        # 20 leagues x 20 teams
+    python -m benchmarks.bench_sync_synthetic --leagues 60 --latency-ms 40 --error-rate 0.02
+
+Syncs leagues, teams, a season of fixtures, standings and one live tick into a
+fresh schema, timing each phase. Latency and errors are injected by the provider.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+
+from app.services.sync import SyncService
+from app.services.synthetic_provider import SyntheticConfig, SyntheticProvider
+from benchmarks._common import DEFAULT_DATABASE_URL, fresh_session, report, timed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--leagues", type=int, default=20)
+    parser.add_argument("--teams-per-league", type=int, default=20)
+    parser.add_argument("--live-matches", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--database-url", default=DEFAULT_DATABASE_URL)
+    args = parser.parse_args()
+
+    provider = SyntheticProvider(
+        SyntheticConfig(
+            leagues=args.leagues,
+            teams_per_league=args.teams_per_league,
+            live_matches=args.live_matches,
+            latency_ms=args.latency_ms,
+            error_rate=args.error_rate,
+        )
+    )
+    async with fresh_session(args.database_url) as session:
+        svc = SyncService(provider, session, args.concurrency)
+        leagues = [(f"syn-lg-{n}", "2024") for n in range(args.leagues)]
+
+        async def sync_catalog() -> None:
+            await svc.sync_leagues()
+            for league_pid, _ in leagues:
+                await svc.sync_teams(league_pid)
+            await session.commit()
+
+        async def sync_fixtures() -> None:
+            await svc.sync_league_fixtures_many(leagues, hours_forward=24 * 365)
+            await session.commit()
+
+        async def sync_standings() -> None:
+            await svc.sync_standings_many(leagues)
+            await session.commit()
+
+        async def sync_live() -> None:
+            await svc.sync_live()
+            await session.commit()
+
+        rows = [
+            ("leagues + teams", await timed(sync_catalog)),
+            ("fixtures (season)", await timed(sync_fixtures)),
+            ("standings", await timed(sync_standings)),
+            ("live tick", await timed(sync_live)),
+        ]
+    report(f"Synthetic sync, {args.leagues} leagues x {args.teams_per_league} teams", rows)
+    print(f"  {svc.report.summary()}  ids={svc.ids.summary()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -27,6 +27,24 @@ class WorkerSettings(BaseSettings):
     provider_name: str = "mock"
     provider_api_key: str = ""
     provider_base_url: str = ""
+    provider_timeout_seconds: float = 15.0
+    provider_max_connections: int = 20
+    provider_max_keepalive_connections: int = 10
+    provider_http2: bool = False
+    provider_parse_offload_bytes: int = 0
+    provider_cache_enabled: bool = True  # cache leagues/teams/standings responses in Redis
+    provider_quota_enabled: bool = True  # shares the request budget with the API processes
+    provider_quota_per_minute: int = 300
+    provider_quota_per_day: int = 7500
+    provider_coalesce_distributed: bool = False
+    provider_coalesce_lock_ms: int = 5000
+    provider_retry_attempts: int = 3
+    provider_breaker_failure_threshold: int = 5
+    provider_breaker_reset_seconds: float = 30.0
+    provider_fallback_ttl_seconds: int = 2 * 24 * 3600
+
+    # Max provider calls in flight during one sync task (DB writes stay serialized)
+    sync_fetch_concurrency: int = 8
 
     @property
     def is_development(self) -> bool:
@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any
+
 import structlog
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
@@ -16,57 +21,113 @@ def _make_session_factory(database_url: str) -> async_sessionmaker[AsyncSession]
     return async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
 
 
+@lru_cache(maxsize=1)
 def _get_provider() -> object:
+    """One provider per worker process, so its connection pool settings are shared by all tasks."""
     settings = get_worker_settings()
     if settings.provider_api_key and settings.provider_name == "api_football":
         from app.provider_adapters.api_football import ApiFootballProvider  # type: ignore[import]
+        from app.provider_adapters.cache import CachedProvider, RedisResponseStore  # type: ignore[import]
+        from app.provider_adapters.quota import QuotaLimits, QuotaScheduler  # type: ignore[import]
+        from app.provider_adapters.resilience import ResilientProvider  # type: ignore[import]
+        from app.provider_adapters.singleflight import CoalescingProvider  # type: ignore[import]
 
-        return ApiFootballProvider(
+        store = RedisResponseStore() if settings.provider_cache_enabled else None
+        provider = ApiFootballProvider(
             api_key=settings.provider_api_key,
             base_url=settings.provider_base_url or "https://v3.football.api-sports.io",
+            timeout=settings.provider_timeout_seconds,
+            max_connections=settings.provider_max_connections,
+            max_keepalive_connections=settings.provider_max_keepalive_connections,
+            http2=settings.provider_http2,
+            parse_offload_bytes=settings.provider_parse_offload_bytes,
+            validator_store=store,
+            quota=QuotaScheduler(QuotaLimits(settings.provider_quota_per_minute, settings.provider_quota_per_day))
+            if settings.provider_quota_enabled
+            else None,
+        )
+        provider = ResilientProvider(
+            provider,
+            attempts=settings.provider_retry_attempts,
+            failure_threshold=settings.provider_breaker_failure_threshold,
+            reset_seconds=settings.provider_breaker_reset_seconds,
+            fallback_store=RedisResponseStore(),
+            fallback_ttl=settings.provider_fallback_ttl_seconds,
+        )
+        provider = CoalescingProvider(
+            provider,
+            distributed=settings.provider_coalesce_distributed,
+            lock_ms=settings.provider_coalesce_lock_ms,
         )
+        # Leagues, rosters and standings are reused across runs instead of re-fetched
+        return CachedProvider(provider, store) if store is not None else provider
     from app.provider_adapters.mock import MockProvider  # type: ignore[import]
 
     return MockProvider()
 
 
+@asynccontextmanager
+async def _provider() -> AsyncIterator[Any]:
+    """Yield the process provider and close its pooled client when the task ends.
+
+    Pooled connections are bound to the event loop of the task that opened them,
+    so they are released here; the client is recreated lazily by the next task.
+    """
+    provider: Any = _get_provider()
+    try:
+        yield provider
+    finally:
+        log.info("Provider stats", **provider.stats())
+        await provider.aclose()
+
+
 # ── Individual sync tasks ─────────────────────────────────────────────────────
 
 
 async def sync_fixtures_task() -> None:
-    """Sync upcoming and recent fixtures for all tracked teams."""
+    """Sync upcoming and recent fixtures league by league (one provider call per league)."""
     settings = get_worker_settings()
     factory = _make_session_factory(settings.database_url)
-    provider = _get_provider()
 
-    async with factory() as session:
+    async with _provider() as provider, factory() as session:
         # Import DB models from the shared layer
         # Worker re-uses backend models by having them importable via PYTHONPATH
         try:
-            from app.db_models import Team  # type: ignore[import]
+            from app.db_models import League, Team  # type: ignore[import]
         except ImportError:
             log.warning("DB models not importable – skipping fixture sync")
             return
 
         from app.sync_helper import SyncService  # type: ignore[import]
 
-        svc = SyncService(provider, session)  # type: ignore[arg-type]
+        svc = SyncService(provider, session, settings.sync_fetch_concurrency)  # type: ignore[arg-type]
 
-        teams_result = await session.execute(select(Team))
-        teams = teams_result.scalars().all()
-        for team in teams:
-            await svc.sync_fixtures(team.provider_team_id, hours_forward=72)
+        leagues_result = await session.execute(select(League))
+        leagues = leagues_result.scalars().all()
+        await svc.sync_league_fixtures_many(
+            [(league.provider_league_id, league.season) for league in leagues], hours_forward=72
+        )
+        # Teams without a league can only be synced through the per-team endpoint
+        orphans_result = await session.execute(select(Team).where(Team.league_id.is_(None)))
+        orphan_teams = orphans_result.scalars().all()
+        await svc.sync_fixtures_many([team.provider_team_id for team in orphan_teams], hours_forward=72)
         await session.commit()
-    log.info("Fixture sync complete", team_count=len(teams))
+        await svc.refresh_caches()
+    log.info(
+        "Fixture sync complete",
+        league_count=len(leagues),
+        orphan_team_count=len(orphan_teams),
+        ids=svc.ids.summary(),
+        **svc.report.summary(),
+    )
 
 
 async def sync_standings_task() -> None:
     """Sync standings for all tracked leagues."""
     settings = get_worker_settings()
     factory = _make_session_factory(settings.database_url)
-    provider = _get_provider()
 
-    async with factory() as session:
+    async with _provider() as provider, factory() as session:
         try:
             from app.db_models import League  # type: ignore[import]
             from app.sync_helper import SyncService  # type: ignore[import]
@@ -74,42 +135,39 @@ async def sync_standings_task() -> None:
             log.warning("DB models not importable – skipping standings sync")
             return
 
-        svc = SyncService(provider, session)  # type: ignore[arg-type]
+        svc = SyncService(provider, session, settings.sync_fetch_concurrency)  # type: ignore[arg-type]
         leagues_result = await session.execute(select(League))
         leagues = leagues_result.scalars().all()
-        for league in leagues:
-            await svc.sync_standings(league.provider_league_id, league.season)
+        await svc.sync_standings_many([(league.provider_league_id, league.season) for league in leagues])
         await session.commit()
-    log.info("Standings sync complete", league_count=len(leagues))
+        await svc.refresh_caches()
+    log.info("Standings sync complete", league_count=len(leagues), ids=svc.ids.summary(), **svc.report.summary())
 
 
 async def sync_live_events_task() -> None:
-    """Sync events for fixtures that are currently in-progress."""
-    from datetime import UTC, datetime, timedelta
-
+    """Refresh scores, statuses and events of all live matches from one provider call."""
     settings = get_worker_settings()
     factory = _make_session_factory(settings.database_url)
-    provider = _get_provider()
 
-    async with factory() as session:
+    async with _provider() as provider, factory() as session:
         try:
-            from app.db_models import Fixture  # type: ignore[import]
+            from app.db_models import League  # type: ignore[import]
             from app.sync_helper import SyncService  # type: ignore[import]
         except ImportError:
             log.warning("DB models not importable – skipping event sync")
             return
 
-        svc = SyncService(provider, session)  # type: ignore[arg-type]
-        now = datetime.now(UTC)
-        result = await session.execute(
-            select(Fixture).where(
-                Fixture.status.not_in(["FT", "AET", "PEN", "NS", "TBD", "CANC"]),
-                Fixture.start_time <= now,
-                Fixture.start_time >= now - timedelta(hours=4),
-            )
-        )
-        fixtures = result.scalars().all()
-        for fixture in fixtures:
-            await svc.sync_events(fixture.provider_fixture_id)
+        svc = SyncService(provider, session, settings.sync_fetch_concurrency)  # type: ignore[arg-type]
+        leagues_result = await session.execute(select(League.provider_league_id))
+        live = await svc.sync_live(leagues_result.scalars().all())
+        # Matches that just left the feed: pick up their final score and status now
+        await svc.refresh_fixtures(live.ended)
         await session.commit()
-    log.info("Live event sync complete", fixture_count=len(fixtures))
+        await svc.refresh_caches()
+    log.info(
+        "Live sync complete",
+        live_count=len(live.deltas),
+        new_events=sum(len(d.new) for d in live.deltas),
+        ended=live.ended,
+        **svc.report.summary(),
+    )